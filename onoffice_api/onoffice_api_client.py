@@ -7,14 +7,20 @@ It allows you to make authenticated requests to the OnOffice API endpoints with
 Requirements:
     - Python 3.6+
     - requests
-    - python-dotenv
+    - python-dotenv (optional)
+
+Importing the module has no side effects. The .env file is loaded once, on
+the first call of ``send_onoffice_api_request`` or ``get_session``, when
+python-dotenv is installed. Scripts reading the environment before their
+first request call ``load_dotenv()`` themselves.
 
 Example usage:
+    import os
+    from dotenv import load_dotenv
     from onoffice_api_client import send_onoffice_api_request
     
-    # Configure your environment variables in .env file:
-    # ONOFFICE_API_TOKEN=your_token
-    # ONOFFICE_API_SECRET=your_secret
+    # Read ONOFFICE_API_TOKEN and ONOFFICE_API_SECRET before the first request
+    load_dotenv()
     
     # Example parameters for retrieving estate data
     parameters = {
@@ -35,6 +41,20 @@ Example usage:
         actionid='urn:onoffice-de-ns:smart:2.5:smartml:action:read',
         parameters=parameters
     )
+
+    # Several actions in one POST
+    read_action = 'urn:onoffice-de-ns:smart:2.5:smartml:action:read'
+    results = send_onoffice_api_request(
+        token=os.getenv('ONOFFICE_API_TOKEN'),
+        secret=os.getenv('ONOFFICE_API_SECRET'),
+        actions=[
+            {"resourcetype": "estate", "actionid": read_action, "parameters": parameters},
+            {"resourcetype": "address", "actionid": read_action, "parameters": {"data": ["Id", "Name"]}}
+        ]
+    )
+
+Requests reuse a pooled HTTP session per token and API version, so scripts
+calling the function in a loop keep their connections open.
 """
 
 import os
@@ -43,11 +63,30 @@ import hashlib
 import base64
 import requests
 import json
+import threading
 import time
-from dotenv import load_dotenv
+from typing import Dict, List, Optional
 
-# Load environment variables from .env file
-load_dotenv()
+API_URL = 'https://api.onoffice.de/api/{version}/api.php'
+HEADERS = {'Content-Type': 'application/json'}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_env_loaded = False
+
+def _load_env() -> None:
+    """
+    Load the .env file once, if python-dotenv is installed.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
 
 def create_hmac2(token: str, secret: str, timestamp: int, resourcetype: str, actionid: str) -> str:
     """
@@ -70,9 +109,41 @@ def create_hmac2(token: str, secret: str, timestamp: int, resourcetype: str, act
     digest = hmac.new(key, msg, hashlib.sha256).digest()
     return base64.b64encode(digest).decode('utf-8')
 
-def send_onoffice_api_request(token: str, secret: str, resourcetype: str, actionid: str, parameters: dict) -> dict:
+def get_session(token: str, api_version: str = 'stable') -> requests.Session:
     """
-    Send an authenticated request to the OnOffice API.
+    Get the pooled session shared by all requests for a token and API version.
+    
+    Args:
+        token (str): OnOffice API token
+        api_version (str, optional): API version. Defaults to 'stable'
+    
+    Returns:
+        requests.Session: Session keeping connections to the API open
+    """
+    _load_env()
+    key = (token, api_version)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = requests.Session()
+    return session
+
+def close_sessions() -> None:
+    """
+    Close all pooled sessions and their connections.
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+def build_action(token: str, secret: str, resourcetype: str, actionid: str, parameters: dict,
+                 resourceid: str = "", identifier: str = "") -> dict:
+    """
+    Build a signed action for the request envelope.
     
     Args:
         token (str): OnOffice API token
@@ -80,41 +151,85 @@ def send_onoffice_api_request(token: str, secret: str, resourcetype: str, action
         resourcetype (str): Type of resource being accessed (e.g., 'estate')
         actionid (str): ID of the action being performed
         parameters (dict): Request parameters specific to the action
+        resourceid (str, optional): ID of the resource. Defaults to ""
+        identifier (str, optional): Identifier echoed back in the result. Defaults to ""
     
     Returns:
-        dict: JSON response from the API
-    
-    Raises:
-        requests.RequestException: If the API request fails
+        dict: Action data with its own timestamp and HMAC2 signature
     """
-    api_url = 'https://api.onoffice.de/api/stable/api.php'
     timestamp = int(time.time())
 
     hmac2 = create_hmac2(token, secret, timestamp, resourcetype, actionid)
 
-    action_data = {
+    return {
         "actionid": actionid,
-        "resourceid": "",
+        "resourceid": resourceid,
         "resourcetype": resourcetype,
-        "identifier": "",
+        "identifier": identifier,
         "timestamp": timestamp,
         "hmac": hmac2,
         "hmac_version": "2",
         "parameters": parameters
     }
 
+def send_onoffice_api_request(token: str, secret: str, resourcetype: Optional[str] = None,
+                              actionid: Optional[str] = None, parameters: Optional[dict] = None,
+                              actions: Optional[List[Dict]] = None, api_version: str = 'stable',
+                              timeout: float = 30) -> dict:
+    """
+    Send an authenticated request to the OnOffice API.
+    
+    Either pass a single action with ``resourcetype``, ``actionid`` and
+    ``parameters``, or a list of ``actions`` that are sent in one POST.
+    
+    Args:
+        token (str): OnOffice API token
+        secret (str): OnOffice API secret
+        resourcetype (str, optional): Type of resource being accessed (e.g., 'estate')
+        actionid (str, optional): ID of the action being performed
+        parameters (dict, optional): Request parameters specific to the action
+        actions (list, optional): Dicts with ``resourcetype``, ``actionid``, ``parameters``
+            and optionally ``resourceid`` and ``identifier``
+        api_version (str, optional): API version. Defaults to 'stable'
+        timeout (float, optional): Request timeout in seconds. Defaults to 30
+    
+    Returns:
+        dict: JSON response from the API, with one entry in
+        ``response.results`` per action
+    
+    Raises:
+        ValueError: If neither a single action nor ``actions`` is given
+        requests.RequestException: If the API request fails
+    """
+    if actions is None:
+        if resourcetype is None or actionid is None:
+            raise ValueError("Pass resourcetype and actionid, or a list of actions")
+        actions = [{"resourcetype": resourcetype, "actionid": actionid, "parameters": parameters or {}}]
+
     request_data = {
         "token": token,
         "request": {
-            "actions": [action_data]
+            "actions": [
+                build_action(
+                    token,
+                    secret,
+                    action["resourcetype"],
+                    action["actionid"],
+                    action.get("parameters", {}),
+                    resourceid=action.get("resourceid", ""),
+                    identifier=action.get("identifier", "")
+                )
+                for action in actions
+            ]
         }
     }
 
-    headers = {
-        'Content-Type': 'application/json'
-    }
-
-    response = requests.post(api_url, json=request_data, headers=headers)
+    response = get_session(token, api_version).post(
+        API_URL.format(version=api_version),
+        json=request_data,
+        headers=HEADERS,
+        timeout=timeout
+    )
     response.raise_for_status()
     return response.json()
 
@@ -122,6 +237,9 @@ def main():
     """
     Example usage of the OnOffice API client.
     """
+    # Load environment variables from .env file
+    _load_env()
+
     # Get token and secret from environment variables
     token = os.getenv('ONOFFICE_API_TOKEN')
     secret = os.getenv('ONOFFICE_API_SECRET')
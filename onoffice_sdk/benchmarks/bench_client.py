@@ -0,0 +1,239 @@
+"""
+Throughput and latency benchmarks of the client's main call paths.
+
+Runs the client against a local FakeOnOfficeServer, over HTTP on localhost
+by default or in memory with ``--transport memory``. Reports per-request
+p50/p95/p99 latency, requests per second and peak RSS for each case, and
+compares them with a stored baseline. Every case runs in its own process,
+since peak RSS never goes down within one.
+
+Usage:
+    python benchmarks/bench_client.py [--transport http|memory] [--latency-ms 0]
+    python benchmarks/bench_client.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from onoffice_sdk import OnOfficeClient, RequestsTransport
+from onoffice_sdk.testing import FakeOnOfficeServer, generate_addresses, generate_estates
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TOKEN = "bench_token"
+SECRET = "bench_secret"
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+class TimedTransport:
+    """Wraps a transport and records the latency of every request."""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def post(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.transport.post(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies.append(elapsed)
+
+    def warm_up(self, url, connections):
+        return self.transport.warm_up(url, connections)
+
+    def stats(self):
+        return self.transport.stats()
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(q / 100 * len(values))) - 1))
+    return values[index]
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+def case_single_get(client, args):
+    rng = random.Random(1)
+    for _ in range(args.requests):
+        client.estate.get(rng.randint(1, args.estates))
+
+def case_paginated_search(client, args):
+    for _ in client.estate.iter_search(fields=["Id", "kaufpreis", "lage"], page_size=100):
+        pass
+
+def case_keyset_scan(client, args):
+    for _ in client.estate.scan(fields=["Id", "kaufpreis", "lage"], page_size=100, concurrency=4):
+        pass
+
+def case_bulk_update(client, args):
+    rng = random.Random(2)
+    changes = [
+        {"id": estate_id, "kaufpreis": rng.randrange(80000, 1500000, 500)}
+        for estate_id in range(1, args.estates + 1)
+    ]
+    client.estate.bulk_update(changes, elements_per_action=100, actions_per_request=10)
+
+def case_concurrent_get(client, args):
+    rng = random.Random(3)
+    ids = [rng.randint(1, args.estates) for _ in range(args.requests)]
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(client.estate.get, ids))
+
+CASES = [
+    ("single_get", case_single_get),
+    ("paginated_search", case_paginated_search),
+    ("keyset_scan", case_keyset_scan),
+    ("bulk_update", case_bulk_update),
+    ("concurrent_get", case_concurrent_get),
+]
+
+def build_server(args):
+    return FakeOnOfficeServer(
+        TOKEN,
+        SECRET,
+        estates=generate_estates(args.estates),
+        addresses=generate_addresses(args.estates // 5),
+        latency=args.latency_ms / 1000
+    )
+
+def run_case(name, fn, base_url, server, args):
+    if args.transport == "memory":
+        inner = server.transport()
+    else:
+        inner = RequestsTransport(pool_maxsize=max(10, args.workers))
+    transport = TimedTransport(inner)
+    client = OnOfficeClient(token=TOKEN, secret=SECRET, transport=transport, base_url=base_url)
+
+    start = time.perf_counter()
+    fn(client, args)
+    elapsed = time.perf_counter() - start
+
+    latencies = transport.latencies
+    rss = peak_rss_mb()
+    return {
+        "requests": len(latencies),
+        "req_per_s": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "peak_rss_mb": round(rss, 1) if rss is not None else None,
+    }
+
+def run_case_process(name, base_url, args):
+    """Run one case in a fresh interpreter, so its peak RSS is its own."""
+    command = [
+        sys.executable, os.path.abspath(__file__),
+        "--run-case", name,
+        "--transport", args.transport,
+        "--latency-ms", str(args.latency_ms),
+        "--estates", str(args.estates),
+        "--requests", str(args.requests),
+        "--workers", str(args.workers),
+    ]
+    if base_url is not None:
+        command += ["--base-url", base_url]
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def run_cases(results, base_url, args):
+    for name, _ in CASES:
+        if name not in args.cases:
+            continue
+        result = results[name] = run_case_process(name, base_url, args)
+        rss = f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "n/a"
+        print(
+            f"{name:<18} {result['requests']:>8} {result['req_per_s']:>10,.0f} "
+            f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} {rss:>12}"
+        )
+
+def compare(results, baseline, tolerance, min_delta_ms=0.5):
+    """Return the metrics that are worse than the baseline by more than ``tolerance``."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["req_per_s"] < base["req_per_s"] * (1 - tolerance):
+            regressions.append(f"{name}: req/s {result['req_per_s']:.0f} < baseline {base['req_per_s']:.0f}")
+        for metric in ("p95_ms", "p99_ms"):
+            # Ignore sub-millisecond jitter of in-memory runs
+            if result[metric] > base[metric] * (1 + tolerance) and result[metric] - base[metric] > min_delta_ms:
+                regressions.append(f"{name}: {metric} {result[metric]:.2f} > baseline {base[metric]:.2f}")
+        if result["peak_rss_mb"] and base.get("peak_rss_mb") and result["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance):
+            regressions.append(f"{name}: peak RSS {result['peak_rss_mb']:.1f} MB > baseline {base['peak_rss_mb']:.1f} MB")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transport", choices=["http", "memory"], default="http")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server latency per request")
+    parser.add_argument("--estates", type=int, default=5000, help="Seed estates")
+    parser.add_argument("--requests", type=int, default=500, help="Requests for the get cases")
+    parser.add_argument("--workers", type=int, default=16, help="Threads for concurrent_get")
+    parser.add_argument("--cases", nargs="*", default=[name for name, _ in CASES])
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="Ignored absolute latency increase")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        # Child process of run_case_process: run one case and print its result
+        server = build_server(args) if args.transport == "memory" else None
+        print(json.dumps(run_case(args.run_case, dict(CASES)[args.run_case], args.base_url, server, args)))
+        return
+
+    results = {}
+    print(f"{'case':<18} {'requests':>8} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak RSS MB':>12}")
+    if args.transport == "http":
+        with build_server(args).serve() as base_url:
+            run_cases(results, base_url, args)
+    else:
+        # The in-memory transport needs the server in the case's own process
+        run_cases(results, None, args)
+
+    key = f"{args.transport}/{args.latency_ms:g}ms/{args.estates}"
+    stored = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+
+    if args.save_baseline:
+        stored[key] = results
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"Baseline for {key} saved to {args.baseline}")
+        return
+
+    if key not in stored:
+        print(f"No baseline for {key}; run with --save-baseline to store one")
+        return
+    regressions = compare(results, stored[key], args.tolerance, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions against the {key} baseline (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
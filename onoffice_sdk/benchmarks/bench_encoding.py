@@ -0,0 +1,84 @@
+"""
+Microbenchmark of the client-side request encoding path.
+
+Compares the previous encoding (fresh HMAC object per action, stdlib json
+via ``requests``) with the signing context and pluggable codec. Reports
+requests per second on one core; no network is involved.
+
+Usage:
+    python benchmarks/bench_encoding.py [--seconds 2]
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import time
+from onoffice_sdk import OnOfficeClient
+from onoffice_sdk.codec import JSONCodec, default_codec
+
+TOKEN = "bench_token"
+SECRET = "bench_secret"
+PARAMETERS = {
+    "data": ["Id", "kaufpreis", "lage"],
+    "filter": {"Id": [{"op": "=", "val": 123}]},
+}
+
+def legacy_encode():
+    """Encoding as done before the signing context: new HMAC per call, stdlib json."""
+    timestamp = int(time.time())
+    resource_type = "estate"
+    action_id = OnOfficeClient.ACTION_READ
+    message = ''.join([str(timestamp), TOKEN, resource_type, action_id])
+    digest = hmac.new(SECRET.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).digest()
+    action = {
+        "actionid": action_id,
+        "resourceid": "",
+        "resourcetype": resource_type,
+        "identifier": "",
+        "timestamp": timestamp,
+        "hmac": base64.b64encode(digest).decode('utf-8'),
+        "hmac_version": "2",
+        "parameters": PARAMETERS
+    }
+    headers = {'Content-Type': 'application/json'}
+    body = json.dumps({"token": TOKEN, "request": {"actions": [action]}}).encode('utf-8')
+    return body, headers
+
+def make_client_encode(codec):
+    client = OnOfficeClient(token=TOKEN, secret=SECRET, codec=codec)
+
+    def encode():
+        action = client._build_action("estate", client.ACTION_READ, PARAMETERS)
+        return client.codec.dumps(client._build_request([action])), client.HEADERS
+    return encode
+
+def measure(fn, seconds):
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            fn()
+        calls += 1000
+    return calls / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0, help="Duration per case")
+    args = parser.parse_args()
+
+    cases = [
+        ("legacy (hmac.new + json)", legacy_encode),
+        ("signing context + json", make_client_encode(JSONCodec())),
+        (f"signing context + {default_codec().name}", make_client_encode(default_codec())),
+    ]
+    baseline = None
+    for name, fn in cases:
+        rate = measure(fn, args.seconds)
+        baseline = baseline or rate
+        print(f"{name:<32} {rate:>12,.0f} req/s  x{rate / baseline:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -29,10 +29,29 @@ setup(
         'python-dotenv>=1.0.0',
     ],
     extras_require={
+        'async': [
+            'httpx>=0.24.0',
+        ],
+        'dataframe': [
+            'pandas>=1.0.0',
+        ],
+        'arrow': [
+            'pyarrow>=8.0.0',
+        ],
+        'fast': [
+            'orjson>=3.6.0',
+        ],
+        'local': [
+            'numpy>=1.17.0',
+        ],
+        'tracing': [
+            'opentelemetry-api>=1.0.0',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'requests-mock>=1.11.0',
             'pytest-cov>=4.1.0',
+            'httpx>=0.24.0',
         ]
     },
     python_requires='>=3.6',
@@ -5,18 +5,57 @@ A comprehensive SDK for interacting with the OnOffice API.
 """
 
 from .client import OnOfficeClient
+from .async_client import AsyncOnOfficeClient
+from .batch import Batch, BatchItem
+from .breaker import CircuitBreaker
+from .cache import ResponseCache
+from .changes import ChangeTracker
+from .columnar import ColumnarRecords
+from .fields import FieldRegistry
+from .hedging import HedgePolicy
+from .hooks import RequestEvent, MetricsAggregator, TracingHook
+from .query import LocalQueryEngine
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .sync import SyncEngine
+from .transport import Transport, RequestsTransport, InMemoryTransport
+from .writebehind import WriteBehindWriter
 from .exceptions import (
     OnOfficeAPIError,
     AuthenticationError,
     RateLimitError,
-    ValidationError
+    ValidationError,
+    CircuitOpenError
 )
 from .version import __version__
 
 __all__ = [
     'OnOfficeClient',
+    'AsyncOnOfficeClient',
+    'Batch',
+    'BatchItem',
+    'CircuitBreaker',
+    'ResponseCache',
+    'ChangeTracker',
+    'ColumnarRecords',
+    'FieldRegistry',
+    'HedgePolicy',
+    'RequestEvent',
+    'MetricsAggregator',
+    'TracingHook',
+    'LocalQueryEngine',
+    'RateLimiter',
+    'RetryPolicy',
+    'SingleFlight',
+    'SyncEngine',
+    'Transport',
+    'RequestsTransport',
+    'InMemoryTransport',
+    'WriteBehindWriter',
     'OnOfficeAPIError',
     'AuthenticationError',
     'RateLimitError',
     'ValidationError',
+    'CircuitOpenError',
 ]
@@ -0,0 +1,382 @@
+"""
+Async OnOffice API Client
+
+Asyncio client for interacting with the OnOffice API. Requires ``httpx``
+(``pip install onoffice-sdk[async]``).
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Any, Optional
+from .changes import skipped_response
+from .client import BaseClient
+from .hooks import RequestEvent
+from .exceptions import OnOfficeAPIError, RateLimitError
+
+class AsyncOnOfficeClient(BaseClient):
+    """
+    Asyncio client for interacting with the OnOffice API.
+
+    Uses the same HMAC2 signing and error mapping as ``OnOfficeClient`` and
+    sends requests through a pooled ``httpx.AsyncClient``, so many requests
+    can be in flight on one event loop.
+
+    Args:
+        token (str): Your OnOffice API token
+        secret (str): Your OnOffice API secret
+        api_version (str, optional): API version to use. Defaults to 'stable'.
+        timeout (int, optional): Request timeout in seconds. Defaults to 30.
+        cache (ResponseCache, optional): Cache for read actions. Defaults to None.
+        rate_limiter (RateLimiter, optional): Limiter pacing outgoing requests. Defaults to None.
+        retry (RetryPolicy, optional): Retry policy for failed requests. Defaults to None.
+        single_flight (SingleFlight, optional): Coalesces identical in-flight reads. Defaults to None.
+        codec (JSONCodec, optional): JSON codec for request and response bodies. Defaults to orjson when installed.
+        base_url (str, optional): API URL with a ``{version}`` placeholder. Defaults to the OnOffice API.
+        field_registry (FieldRegistry, optional): Field definitions used to validate requests.
+            Await ``field_registry.load_async()`` before the first request.
+        change_tracker (ChangeTracker, optional): Sends only changed fields of
+            modify actions and skips no-op updates. Defaults to None.
+        circuit_breaker (CircuitBreaker, optional): Fails requests fast while
+            the API is failing. Defaults to None.
+        hedge (HedgePolicy, optional): Sends a second copy of slow reads.
+            Defaults to None.
+        query_engine (LocalQueryEngine, optional): Snapshots answering
+            ``search(local=True)``. Defaults to None.
+        max_connections (int, optional): Size of the connection pool. Defaults to 100.
+        transport (httpx.AsyncBaseTransport, optional): Custom httpx transport
+
+    Examples:
+        >>> async with AsyncOnOfficeClient(token="your_token", secret="your_secret") as client:
+        ...     estates = await client.estate.search(filters={"status": [{"op": "=", "val": 1}]})
+    """
+
+    def __init__(
+        self,
+        token: str,
+        secret: str,
+        api_version: str = 'stable',
+        timeout: int = 30,
+        cache: Optional[Any] = None,
+        rate_limiter: Optional[Any] = None,
+        retry: Optional[Any] = None,
+        single_flight: Optional[Any] = None,
+        codec: Optional[Any] = None,
+        max_connections: int = 100,
+        transport: Optional[Any] = None,
+        base_url: Optional[str] = None,
+        field_registry: Optional[Any] = None,
+        change_tracker: Optional[Any] = None,
+        circuit_breaker: Optional[Any] = None,
+        hedge: Optional[Any] = None,
+        query_engine: Optional[Any] = None
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "AsyncOnOfficeClient requires httpx. "
+                "Install it with: pip install onoffice-sdk[async]"
+            )
+
+        super().__init__(
+            token,
+            secret,
+            api_version=api_version,
+            timeout=timeout,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            single_flight=single_flight,
+            codec=codec,
+            base_url=base_url,
+            field_registry=field_registry,
+            change_tracker=change_tracker,
+            circuit_breaker=circuit_breaker,
+            hedge=hedge,
+            query_engine=query_engine
+        )
+        self._httpx = httpx
+        self.http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> 'AsyncOnOfficeClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.http.aclose()
+
+    async def _send(
+        self,
+        actions: List[Dict[str, Any]],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """
+        Send one or more signed actions in a single request.
+
+        Args:
+            actions (list): Actions built with ``_build_action``
+            event (RequestEvent, optional): Event collecting phase timings
+
+        Returns:
+            dict: API response
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ValidationError: If request validation fails
+            CircuitOpenError: If the circuit breaker is open
+            OnOfficeAPIError: For other API errors
+        """
+        if self.circuit_breaker is None:
+            return await self._post(actions, event)
+
+        self.circuit_breaker.before()
+        started = time.monotonic()
+        try:
+            data = await self._post(actions, event)
+        except Exception as e:
+            self.circuit_breaker.record(time.monotonic() - started, e)
+            raise
+        self.circuit_breaker.record(time.monotonic() - started)
+        return data
+
+    async def _post(
+        self,
+        actions: List[Dict[str, Any]],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Encode and post one request, then decode it and map API errors."""
+        if event is not None:
+            started = time.perf_counter()
+        body = self.codec.dumps(self._build_request(actions))
+        if event is not None:
+            started = event.lap("encode", started)
+            event.request_bytes += len(body)
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+            if event is not None:
+                started = event.lap("rate_limit", started)
+
+        try:
+            response = await self.http.post(
+                self.API_BASE_URL.format(version=self.api_version),
+                content=body,
+                headers=self.HEADERS
+            )
+            if event is not None:
+                started = event.lap("network", started)
+                event.http_status = response.status_code
+                event.response_bytes += len(response.content)
+            response.raise_for_status()
+            data = self.codec.loads(response.content)
+            if event is not None:
+                started = event.lap("decode", started)
+                event.status_code = data.get('status', {}).get('code')
+        except self._httpx.HTTPError as e:
+            raise OnOfficeAPIError(f"Request failed: {str(e)}") from e
+        except ValueError as e:
+            raise OnOfficeAPIError(f"Invalid response: {str(e)}") from e
+
+        # Check for API errors
+        try:
+            self._raise_for_status(data)
+        except RateLimitError as e:
+            self._rate_limited(e)
+            raise
+        if event is not None:
+            event.lap("status", started)
+
+        return data
+
+    async def _attempt(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Sign and send one attempt of an action, hedging reads with a hedge policy."""
+        if self.hedge is None or action_id not in self.READ_ACTIONS:
+            return await self._send([self._sign_action(resource_type, action_id, parameters, event)], event)
+
+        delay = self.hedge.delay()
+        started = time.perf_counter()
+        if delay is None:
+            data = await self._send([self._sign_action(resource_type, action_id, parameters, event)], event)
+        else:
+            data = await self._hedged(resource_type, action_id, parameters, event, delay)
+        self.hedge.observe(time.perf_counter() - started)
+        return data
+
+    async def _hedged(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent],
+        delay: float
+    ) -> Dict[str, Any]:
+        """Send a read, and a copy of it if no answer arrived after ``delay`` seconds."""
+        primary = asyncio.ensure_future(
+            self._send([self._sign_action(resource_type, action_id, parameters, event)], event)
+        )
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.hedge.allow_hedge():
+            return await primary
+
+        copy = asyncio.ensure_future(self._send([self._sign_action(resource_type, action_id, parameters, None)]))
+        pending = {primary, copy}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    self.hedge.record_hedge(won=task is copy)
+                    return task.result()
+        finally:
+            # The slower of the two is cancelled
+            for task in pending:
+                task.cancel()
+        self.hedge.record_hedge(won=False)
+        raise error
+
+    async def _send_action(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Sign and send a single action, retrying it according to the retry policy."""
+        if self.retry is None:
+            return await self._attempt(resource_type, action_id, parameters, event)
+
+        started = self.retry.start()
+        attempt = 1
+        while True:
+            try:
+                return await self._attempt(resource_type, action_id, parameters, event)
+            except OnOfficeAPIError as e:
+                delay = self.retry.next_delay(
+                    e,
+                    attempt,
+                    started,
+                    idempotent=action_id in self.READ_ACTIONS,
+                    rate_limited=self.rate_limiter is not None
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            if event is not None:
+                event.phases["backoff"] = event.phases.get("backoff", 0.0) + delay
+                event.retries += 1
+
+    async def _make_request(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the OnOffice API.
+
+        Args:
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action being performed
+            parameters (dict): Request parameters
+
+        Returns:
+            dict: API response
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ValidationError: If request validation fails
+            OnOfficeAPIError: For other API errors
+        """
+        if not self._hooks:
+            return await self._request(resource_type, action_id, parameters)
+
+        event = RequestEvent(resource_type, action_id)
+        try:
+            return await self._request(resource_type, action_id, parameters, event)
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            self._emit(event)
+
+    async def _request(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Serve a request from the cache, a coalesced request or the API."""
+        if self.change_tracker is not None:
+            parameters = self.change_tracker.prepare(resource_type, action_id, parameters)
+            if parameters is None:
+                return skipped_response(resource_type, action_id)
+
+        cache_key = self._cache_key(resource_type, action_id, parameters)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if event is not None:
+                event.cache = "miss" if cached is None else "hit"
+            if cached is not None:
+                return cached
+            generation = self.cache.generation(resource_type)
+
+        flight_key = self._flight_key(resource_type, action_id, parameters, cache_key)
+        if flight_key is not None:
+            if event is not None:
+                event.coalesced = True
+
+            def send():
+                if event is not None:
+                    event.coalesced = False
+                return self._send_action(resource_type, action_id, parameters, event)
+
+            data = await self.single_flight.do_async(flight_key, send)
+        else:
+            data = await self._send_action(resource_type, action_id, parameters, event)
+
+        if cache_key is not None:
+            self.cache.set(resource_type, cache_key, data, generation=generation)
+        else:
+            self._invalidate_cache(resource_type, action_id)
+        if self.change_tracker is not None:
+            self.change_tracker.record(resource_type, action_id, parameters, data)
+        return data
+
+    @property
+    def estate(self) -> 'AsyncEstateResource':
+        """Get the estate resource handler."""
+        if self._estate is None:
+            from .resources.estate import AsyncEstateResource
+            self._estate = AsyncEstateResource(self)
+        return self._estate
+
+    @property
+    def address(self) -> 'AsyncAddressResource':
+        """Get the address resource handler."""
+        if self._address is None:
+            from .resources.address import AsyncAddressResource
+            self._address = AsyncAddressResource(self)
+        return self._address
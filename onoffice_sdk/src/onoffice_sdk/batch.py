@@ -0,0 +1,297 @@
+"""
+Request batching for the OnOffice API.
+
+Collects actions issued through the regular resource handlers and sends
+them in multi-action requests.
+"""
+
+import json
+from typing import Dict, List, Any, Optional
+from .changes import skipped_response
+from .client import OnOfficeClient
+from .exceptions import OnOfficeAPIError
+from .hooks import RequestEvent
+
+class BatchItem:
+    """
+    Result placeholder for one action queued in a batch.
+
+    Args:
+        resource_type (str): Type of resource being accessed
+        action_id (str): ID of the action being performed
+        parameters (dict): Request parameters
+    """
+
+    def __init__(self, resource_type: str, action_id: str, parameters: Dict[str, Any]):
+        self.resource_type = resource_type
+        self.action_id = action_id
+        self.parameters = parameters
+        self.done = False
+        self._result = None
+        self._error = None
+
+    def _set_result(self, result: Dict[str, Any]) -> None:
+        self._result = result
+        self.done = True
+
+    def _set_exception(self, error: Exception) -> None:
+        self._error = error
+        self.done = True
+
+    def exception(self) -> Optional[Exception]:
+        """
+        Get the exception raised by this action, if any.
+
+        Returns:
+            Exception: The error for this action, or None on success
+        """
+        if not self.done:
+            raise RuntimeError("Batch has not been executed yet")
+        return self._error
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Get the response for this action.
+
+        The response has the same shape as a single-action request, with
+        exactly one entry in ``response.results``.
+
+        Returns:
+            dict: API response for this action
+
+        Raises:
+            OnOfficeAPIError: If this action failed
+        """
+        if self.exception() is not None:
+            raise self._error
+        return self._result
+
+class _BatchResource:
+    """
+    Resource handler bound to a batch.
+
+    Only the single-action methods are available; each queues its action
+    and returns a ``BatchItem``. Methods and search options that need a
+    response to continue (``get_many``, ``iter_search``, ``scan``, bulk
+    writes, ``stream``, ``columnar``, ``include``, ``local``) are refused.
+
+    Args:
+        resource: Resource handler whose client is the batch
+    """
+
+    _METHODS = ("get", "search", "create", "update", "delete")
+
+    def __init__(self, resource):
+        self._resource = resource
+
+    def __getattr__(self, name: str):
+        if name not in self._METHODS:
+            raise AttributeError(f"{name} is not available in a batch")
+        return getattr(self._resource, name)
+
+    def search(self, *args, **kwargs) -> BatchItem:
+        """Queue a search; see the ``search`` method of the resource handler."""
+        for option in ("stream", "columnar", "include", "local"):
+            if kwargs.get(option):
+                raise ValueError(f"{option} is not supported in a batch")
+        return self._resource.search(*args, **kwargs)
+
+class Batch:
+    """
+    Collects actions and sends them in multi-action requests.
+
+    Resource handlers bound to a batch queue their action and return a
+    ``BatchItem`` instead of sending a request. The queued actions are sent
+    when the ``with`` block exits or when ``execute()`` is called.
+
+    Args:
+        client (OnOfficeClient): Client used to sign and send the actions
+        max_actions (int, optional): Maximum actions per request. Defaults to 50
+        max_payload_bytes (int, optional): Maximum encoded size of the action
+            parameters per request. Defaults to None (no limit)
+    """
+
+    ACTION_READ = OnOfficeClient.ACTION_READ
+    ACTION_CREATE = OnOfficeClient.ACTION_CREATE
+    ACTION_MODIFY = OnOfficeClient.ACTION_MODIFY
+    ACTION_DELETE = OnOfficeClient.ACTION_DELETE
+    ACTION_GET = OnOfficeClient.ACTION_GET
+    ACTION_DO = OnOfficeClient.ACTION_DO
+
+    def __init__(
+        self,
+        client: OnOfficeClient,
+        max_actions: int = 50,
+        max_payload_bytes: Optional[int] = None
+    ):
+        if max_actions < 1:
+            raise ValueError("max_actions must be at least 1")
+        self.client = client
+        self.max_actions = max_actions
+        self.max_payload_bytes = max_payload_bytes
+        self.items = []
+
+        self._estate = None
+        self._address = None
+
+    def __enter__(self) -> 'Batch':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.execute()
+        return False
+
+    def _make_request(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any]
+    ) -> BatchItem:
+        """
+        Queue an action instead of sending it.
+
+        Args:
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action being performed
+            parameters (dict): Request parameters
+
+        Returns:
+            BatchItem: Placeholder resolved when the batch is executed
+        """
+        tracker = self.client.change_tracker
+        if tracker is not None:
+            prepared = tracker.prepare(resource_type, action_id, parameters)
+            if prepared is None:
+                item = BatchItem(resource_type, action_id, parameters)
+                item._set_result(skipped_response(resource_type, action_id))
+                self.items.append(item)
+                return item
+            parameters = prepared
+        item = BatchItem(resource_type, action_id, parameters)
+        self.items.append(item)
+        return item
+
+    def execute(self) -> List[BatchItem]:
+        """
+        Send all pending actions.
+
+        Actions are packed into requests of at most ``max_actions`` and
+        ``max_payload_bytes``. A failed request marks all of its actions as
+        failed; a failed action only marks its own item.
+
+        Returns:
+            list: All items of this batch, in the order they were queued
+        """
+        chunk = []
+        chunk_bytes = 0
+        for item in self.items:
+            if item.done:
+                continue
+            size = 0
+            if self.max_payload_bytes is not None:
+                size = len(json.dumps(item.parameters, default=str))
+            if chunk and (
+                len(chunk) >= self.max_actions
+                or (self.max_payload_bytes is not None and chunk_bytes + size > self.max_payload_bytes)
+            ):
+                self._execute_chunk(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(item)
+            chunk_bytes += size
+        if chunk:
+            self._execute_chunk(chunk)
+        return self.items
+
+    def _send(self, chunk: List[BatchItem], actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send one request, emitting a single event for it when the client has hooks."""
+        if not self.client._hooks:
+            return self.client._send(actions)
+
+        kinds = {(item.resource_type, item.action_id) for item in chunk}
+        resource_type, action_id = kinds.pop() if len(kinds) == 1 else ("batch", "batch")
+        event = RequestEvent(resource_type, action_id)
+        event.actions = len(actions)
+        try:
+            return self.client._send(actions, event)
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            self.client._emit(event)
+
+    def _execute_chunk(self, chunk: List[BatchItem]) -> None:
+        actions = [
+            self.client._build_action(
+                item.resource_type,
+                item.action_id,
+                item.parameters,
+                identifier=str(index)
+            )
+            for index, item in enumerate(chunk)
+        ]
+
+        try:
+            data = self._send(chunk, actions)
+        except OnOfficeAPIError as e:
+            for item in chunk:
+                item._set_exception(e)
+            return
+
+        results = data.get('response', {}).get('results', [])
+        by_identifier = {
+            str(result.get('identifier')): result
+            for result in results
+            if result.get('identifier') not in (None, "")
+        }
+
+        for index, item in enumerate(chunk):
+            if by_identifier:
+                result = by_identifier.get(str(index))
+            else:
+                result = results[index] if index < len(results) else None
+
+            if result is None:
+                item._set_exception(OnOfficeAPIError(
+                    "No result returned for action",
+                    response=data
+                ))
+                continue
+
+            try:
+                self.client._raise_for_action_status(result)
+            except OnOfficeAPIError as e:
+                item._set_exception(e)
+                continue
+
+            item._set_result({
+                "status": data.get('status'),
+                "response": {
+                    "results": [result]
+                }
+            })
+            self.client._invalidate_cache(item.resource_type, item.action_id)
+            if self.client.change_tracker is not None:
+                self.client.change_tracker.record(item.resource_type, item.action_id, item.parameters, item.result())
+
+    @property
+    def field_registry(self) -> Optional['FieldRegistry']:
+        """Field registry of the underlying client."""
+        return self.client.field_registry
+
+    @property
+    def estate(self) -> _BatchResource:
+        """Get the estate resource handler bound to this batch."""
+        if self._estate is None:
+            from .resources.estate import EstateResource
+            self._estate = _BatchResource(EstateResource(self))
+        return self._estate
+
+    @property
+    def address(self) -> _BatchResource:
+        """Get the address resource handler bound to this batch."""
+        if self._address is None:
+            from .resources.address import AddressResource
+            self._address = _BatchResource(AddressResource(self))
+        return self._address
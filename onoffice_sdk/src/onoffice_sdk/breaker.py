@@ -0,0 +1,159 @@
+"""
+Circuit breaker that stops sending requests while the API is failing.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+from .exceptions import AuthenticationError, CircuitOpenError, RateLimitError, ValidationError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """
+    Fails requests fast after consecutive failures.
+
+    Connection errors, timeouts, 5xx responses and invalid responses count
+    as failures, and so do requests slower than ``slow_call_threshold``.
+    Authentication, validation and rate limit errors show that the API is
+    answering and count as successes. After ``failure_threshold``
+    consecutive failures the breaker opens and every request raises
+    ``CircuitOpenError`` without being sent. After ``recovery_timeout``
+    seconds up to ``half_open_max_calls`` probe requests are let through;
+    a successful probe closes the breaker, a failed one opens it again.
+
+    One breaker can be shared by several clients and threads.
+
+    Args:
+        failure_threshold (int, optional): Consecutive failures that open the breaker. Defaults to 5
+        recovery_timeout (float, optional): Seconds the breaker stays open. Defaults to 30
+        slow_call_threshold (float, optional): Seconds after which a request
+            counts as a failure. Defaults to None (latency is not checked)
+        half_open_max_calls (int, optional): Concurrent probes while half-open. Defaults to 1
+
+    Examples:
+        >>> breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30, slow_call_threshold=5)
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", circuit_breaker=breaker)
+        >>> breaker.stats()
+        {'state': 'closed', 'consecutive_failures': 0, 'opened': 0, 'rejected': 0, 'slow_calls': 0}
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        slow_call_threshold: Optional[float] = None,
+        half_open_max_calls: int = 1
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_threshold = slow_call_threshold
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probes = 0
+        self._opened = 0
+        self._rejected = 0
+        self._slow_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before(self) -> None:
+        """
+        Admit a request or reject it.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            if self._state == OPEN:
+                remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError("Circuit breaker is open", retry_after=remaining)
+                self._state = HALF_OPEN
+                self._probes = 0
+            if self._probes >= self.half_open_max_calls:
+                self._rejected += 1
+                raise CircuitOpenError("Circuit breaker is half-open", retry_after=0.0)
+            self._probes += 1
+
+    def is_failure(self, error: Optional[Exception]) -> bool:
+        """
+        Check whether an error shows that the API is unhealthy.
+
+        Args:
+            error (Exception): Error raised by a request, or None
+
+        Returns:
+            bool: False for successes and errors the API answered deliberately
+        """
+        if error is None:
+            return False
+        return not isinstance(error, (AuthenticationError, ValidationError, RateLimitError, CircuitOpenError))
+
+    def record(self, duration: float, error: Optional[Exception] = None) -> None:
+        """
+        Record the outcome of an admitted request.
+
+        Args:
+            duration (float): Seconds the request took
+            error (Exception, optional): Error it raised, if any
+        """
+        slow = self.slow_call_threshold is not None and duration > self.slow_call_threshold
+        failed = slow or self.is_failure(error)
+        with self._lock:
+            if slow:
+                self._slow_calls += 1
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+            if not failed:
+                # A late success from before the breaker opened does not close it
+                if self._state != OPEN:
+                    self._failures = 0
+                    self._state = CLOSED
+                return
+            self._failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._opened += 1
+
+    def reset(self) -> None:
+        """Close the breaker and clear the failure count."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get breaker statistics.
+
+        Returns:
+            dict: State, consecutive failures, times opened, rejected requests and slow calls
+        """
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "opened": self._opened,
+                "rejected": self._rejected,
+                "slow_calls": self._slow_calls,
+            }
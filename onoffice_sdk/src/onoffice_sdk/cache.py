@@ -0,0 +1,178 @@
+"""
+Response cache for read actions.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+def request_key(resource_type: str, action_id: str, parameters: Dict[str, Any]) -> str:
+    """
+    Build a canonical key for a request.
+
+    Parameters are serialised with sorted keys, so dicts that only differ
+    in insertion order produce the same key.
+
+    Args:
+        resource_type (str): Type of resource being accessed
+        action_id (str): ID of the action being performed
+        parameters (dict): Request parameters
+
+    Returns:
+        str: Hex encoded SHA-256 of the canonical request
+    """
+    payload = json.dumps(
+        [resource_type, action_id, parameters],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """
+    Thread-safe TTL/LRU cache for API responses.
+
+    Args:
+        ttl (float, optional): Default time to live in seconds. Defaults to 60
+        maxsize (int, optional): Maximum number of entries. Defaults to 1024
+        ttls (dict, optional): Per resource type TTL overrides, e.g. {"estate": 30}
+
+    Examples:
+        >>> cache = ResponseCache(ttl=60, maxsize=2048, ttls={"address": 300})
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", cache=cache)
+        >>> client.estate.get(123)
+        >>> cache.stats()
+        {'hits': 0, 'misses': 1, 'evictions': 0, 'invalidations': 0, 'size': 1}
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        maxsize: int = 1024,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def generation(self, resource_type: str) -> tuple:
+        """
+        Get the invalidation counters of a resource type.
+
+        Pass the result to ``set`` so a response read before an
+        invalidation is not stored after it.
+
+        Args:
+            resource_type (str): Type of resource
+
+        Returns:
+            tuple: Full and per resource type invalidation counters
+        """
+        with self._lock:
+            return self._generation(resource_type)
+
+    def _generation(self, resource_type: str) -> tuple:
+        return (self._epoch, self._generations.get(resource_type, 0))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response.
+
+        Args:
+            key (str): Key built with ``request_key``
+
+        Returns:
+            dict: Copy of the cached response, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[2]
+        return copy.deepcopy(value)
+
+    def set(
+        self,
+        resource_type: str,
+        key: str,
+        value: Dict[str, Any],
+        generation: Optional[tuple] = None
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            resource_type (str): Type of resource the response belongs to
+            key (str): Key built with ``request_key``
+            value (dict): API response
+            generation (tuple, optional): Result of ``generation`` taken before the request
+        """
+        ttl = self.ttls.get(resource_type, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self._generation(resource_type):
+                return
+            self._entries[key] = (resource_type, time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, resource_type: Optional[str] = None) -> None:
+        """
+        Drop cached responses.
+
+        Args:
+            resource_type (str, optional): Only drop entries of this resource type
+        """
+        with self._lock:
+            if resource_type is None:
+                removed = list(self._entries)
+                self._epoch += 1
+            else:
+                removed = [
+                    key for key, entry in self._entries.items()
+                    if entry[0] == resource_type
+                ]
+                self._generations[resource_type] = self._generations.get(resource_type, 0) + 1
+            for key in removed:
+                del self._entries[key]
+            self.invalidations += len(removed)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            dict: Hits, misses, evictions, invalidations and current size
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
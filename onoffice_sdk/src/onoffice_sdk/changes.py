@@ -0,0 +1,324 @@
+"""
+Change tracking for diff-aware updates.
+"""
+
+import json
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+from .utils import get_records
+
+ACTION_READ = 'urn:onoffice-de-ns:smart:2.5:smartml:action:read'
+ACTION_MODIFY = 'urn:onoffice-de-ns:smart:2.5:smartml:action:modify'
+ACTION_DELETE = 'urn:onoffice-de-ns:smart:2.5:smartml:action:delete'
+
+_ID_KEYS = ("id", "Id")
+
+def normalise(value: Any) -> Any:
+    """
+    Normalise a field value for comparison.
+
+    The API returns every value as a string, so numbers are compared by
+    value ("250000.00" equals 250000), strings ignore surrounding
+    whitespace, and None equals an empty string. Strings with leading
+    zeros, like postal codes, stay strings.
+
+    Args:
+        value: Field value
+
+    Returns:
+        Comparable value
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value) if math.isfinite(value) else str(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text and not (len(text) > 1 and text[0] == "0" and text[1] != "."):
+            try:
+                number = float(text)
+            except ValueError:
+                return text
+            if math.isfinite(number):
+                return number
+        return text
+    if isinstance(value, (list, tuple)):
+        return tuple(normalise(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, separators=(',', ':'), default=str))
+
+def _elements(parameters: Dict[str, Any]) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+    """Get the elements of a modify action and whether they are wrapped in ``elements``."""
+    data = parameters.get("data")
+    if not isinstance(data, dict):
+        return None, False
+    if isinstance(data.get("elements"), list):
+        return data["elements"], True
+    return [data], False
+
+def _element_id(element: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    for key in _ID_KEYS:
+        if element.get(key) not in (None, ""):
+            return key, element[key]
+    return None, None
+
+class ChangeTracker:
+    """
+    Snapshot of the last known field values, used to send only real changes.
+
+    Records read through the client are remembered, and modify actions are
+    reduced to the fields whose values differ from the snapshot. Elements
+    without changes are dropped, and a modify action without any changes
+    is answered locally without a request. Fields the snapshot has never
+    seen are always sent.
+
+    Args:
+        maxsize (int, optional): Maximum number of records kept, least
+            recently used first out. Defaults to 100000
+        resource_types (tuple, optional): Tracked resource types.
+            Defaults to ("estate", "address")
+
+    Examples:
+        >>> tracker = ChangeTracker()
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", change_tracker=tracker)
+        >>> client.estate.get(123, fields=["Id", "kaufpreis"])
+        >>> client.estate.update(123, {"kaufpreis": 250000})  # no request if unchanged
+        >>> tracker.stats()["skipped_writes"]
+        1
+    """
+
+    def __init__(self, maxsize: int = 100000, resource_types: Tuple[str, ...] = ("estate", "address")):
+        self.maxsize = maxsize
+        self.resource_types = tuple(resource_types)
+        self._snapshots = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._skipped_writes = 0
+        self._skipped_elements = 0
+        self._skipped_fields = 0
+        self._bytes_saved = 0
+
+    def _merge(self, key: Tuple[str, str], values: Dict[str, Any]) -> None:
+        """Merge normalised values into a snapshot. Call with the lock held."""
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            snapshot = self._snapshots[key] = {}
+        else:
+            self._snapshots.move_to_end(key)
+        for field, value in values.items():
+            if field not in _ID_KEYS:
+                snapshot[field] = normalise(value)
+        while len(self._snapshots) > self.maxsize:
+            self._snapshots.popitem(last=False)
+
+    def observe(self, resource_type: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Remember the field values of records read from the API or a mirror.
+
+        Args:
+            resource_type (str): Type of the records
+            records (list): Records with ``id`` and ``elements``
+        """
+        if resource_type not in self.resource_types:
+            return
+        with self._lock:
+            for record in records:
+                if record.get("id") in (None, "") or not isinstance(record.get("elements"), dict):
+                    continue
+                self._merge((resource_type, str(record["id"])), record["elements"])
+
+    def load_mirror(self, engine, resource_types: Optional[Tuple[str, ...]] = None) -> int:
+        """
+        Take the snapshots from a ``SyncEngine`` mirror.
+
+        Args:
+            engine (SyncEngine): Local mirror
+            resource_types (tuple, optional): Resource types to load. Defaults to the tracked ones
+
+        Returns:
+            int: Number of records loaded
+        """
+        count = 0
+        for resource_type in resource_types or self.resource_types:
+            records = list(engine.iter_records(resource_type))
+            self.observe(resource_type, records)
+            count += len(records)
+        return count
+
+    def snapshot(self, resource_type: str, record_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the normalised last known values of a record.
+
+        Args:
+            resource_type (str): Type of the record
+            record_id: Record ID
+
+        Returns:
+            dict: Field values, or None if the record is unknown
+        """
+        with self._lock:
+            snapshot = self._snapshots.get((resource_type, str(record_id)))
+            return dict(snapshot) if snapshot is not None else None
+
+    def forget(self, resource_type: str, record_id: Any) -> None:
+        """
+        Drop the snapshot of a record.
+
+        Args:
+            resource_type (str): Type of the record
+            record_id: Record ID
+        """
+        with self._lock:
+            self._snapshots.pop((resource_type, str(record_id)), None)
+
+    def changes(self, resource_type: str, record_id: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the fields of ``data`` that differ from the snapshot.
+
+        Args:
+            resource_type (str): Type of the record
+            record_id: Record ID
+            data (dict): New field values
+
+        Returns:
+            dict: Changed or unknown fields with their new values
+        """
+        with self._lock:
+            snapshot = self._snapshots.get((resource_type, str(record_id))) or {}
+            return {
+                field: value for field, value in data.items()
+                if field not in snapshot or snapshot[field] != normalise(value)
+            }
+
+    def prepare(self, resource_type: str, action_id: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Reduce a modify action to its changed fields.
+
+        Args:
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action being performed
+            parameters (dict): Request parameters
+
+        Returns:
+            dict: Parameters to send, or None if nothing changed
+        """
+        if action_id != ACTION_MODIFY or resource_type not in self.resource_types:
+            return parameters
+        elements, wrapped = _elements(parameters)
+        if not elements:
+            return parameters
+
+        reduced = []
+        skipped_elements = 0
+        skipped_fields = 0
+        for element in elements:
+            id_key, record_id = _element_id(element)
+            if id_key is None:
+                reduced.append(element)
+                continue
+            data = {field: value for field, value in element.items() if field not in _ID_KEYS}
+            changed = self.changes(resource_type, record_id, data)
+            skipped_fields += len(data) - len(changed)
+            if changed or not data:
+                reduced.append({id_key: record_id, **changed})
+            else:
+                skipped_elements += 1
+
+        if reduced:
+            data = dict(parameters["data"], elements=reduced) if wrapped else reduced[0]
+            result = dict(parameters, data=data)
+        else:
+            result = None
+
+        with self._lock:
+            self._writes += 1
+            self._skipped_elements += skipped_elements
+            self._skipped_fields += skipped_fields
+            if result is None:
+                self._skipped_writes += 1
+                self._bytes_saved += _size(parameters)
+            elif skipped_fields:
+                self._bytes_saved += _size(parameters) - _size(result)
+        return result
+
+    def record(self, resource_type: str, action_id: str, parameters: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """
+        Update the snapshots after a successful action.
+
+        Reads are remembered, sent modifications become the new known
+        values and deleted records are dropped.
+
+        Args:
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action performed
+            parameters (dict): Parameters that were sent
+            response (dict): API response
+        """
+        if resource_type not in self.resource_types:
+            return
+        if action_id == ACTION_READ:
+            self.observe(resource_type, get_records(response))
+        elif action_id == ACTION_MODIFY:
+            elements, _ = _elements(parameters)
+            with self._lock:
+                for element in elements or []:
+                    _, record_id = _element_id(element)
+                    if record_id is not None:
+                        self._merge((resource_type, str(record_id)), element)
+        elif action_id == ACTION_DELETE:
+            elements, _ = _elements(parameters)
+            for element in elements or []:
+                _, record_id = _element_id(element)
+                if record_id is not None:
+                    self.forget(resource_type, record_id)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get write statistics.
+
+        Returns:
+            dict: Modify actions seen, actions skipped entirely, elements and
+            fields left out, encoded bytes saved, and tracked records
+        """
+        with self._lock:
+            return {
+                "writes": self._writes,
+                "skipped_writes": self._skipped_writes,
+                "skipped_elements": self._skipped_elements,
+                "skipped_fields": self._skipped_fields,
+                "bytes_saved": self._bytes_saved,
+                "size": len(self._snapshots),
+            }
+
+def skipped_response(resource_type: str, action_id: str) -> Dict[str, Any]:
+    """
+    Build the response returned for a modify action that was not sent.
+
+    Args:
+        resource_type (str): Type of resource
+        action_id (str): ID of the action
+
+    Returns:
+        dict: Response shaped like an API response with one empty result
+    """
+    return {
+        "status": {"code": 200, "errorcode": 0, "message": "OK"},
+        "response": {
+            "results": [{
+                "actionid": action_id,
+                "resourceid": "",
+                "resourcetype": resource_type,
+                "identifier": "",
+                "data": {"meta": {"cntabsolute": None}, "records": []},
+                "status": {"errorcode": 0, "message": "Not sent: no changes"}
+            }]
+        }
+    }
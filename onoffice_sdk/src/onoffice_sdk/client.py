@@ -4,27 +4,58 @@ OnOffice API Client
 Main client class for interacting with the OnOffice API.
 """
 
+import logging
+import threading
 import time
-import hmac
-import hashlib
-import base64
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from typing import Dict, List, Any, Callable, Iterator, Optional
 import requests
+from .cache import request_key
+from .changes import skipped_response
+from .hooks import RequestEvent
+from .codec import JSONCodec, default_codec
+from .signing import SigningContext
+from .streaming import StreamingParser
+from .transport import Transport, RequestsTransport
+from .ratelimit import reset_delay
 from .exceptions import AuthenticationError, RateLimitError, ValidationError, OnOfficeAPIError
 
-class OnOfficeClient:
+logger = logging.getLogger(__name__)
+
+def _counted(chunks: Iterator[bytes], event: RequestEvent) -> Iterator[bytes]:
+    """Pass chunks through, adding their size to the event."""
+    for chunk in chunks:
+        event.response_bytes += len(chunk)
+        yield chunk
+
+class BaseClient:
     """
-    Main client class for interacting with the OnOffice API.
+    Signing, envelope building and error mapping shared by the sync and
+    async clients.
     
     Args:
         token (str): Your OnOffice API token
         secret (str): Your OnOffice API secret
         api_version (str, optional): API version to use. Defaults to 'stable'.
         timeout (int, optional): Request timeout in seconds. Defaults to 30.
-    
-    Examples:
-        >>> client = OnOfficeClient(token="your_token", secret="your_secret")
-        >>> estates = client.estate.search(filters={"status": [{"op": "=", "val": 1}]})
+        cache (ResponseCache, optional): Cache for read actions. Defaults to None.
+        rate_limiter (RateLimiter, optional): Limiter pacing outgoing requests. Defaults to None.
+        retry (RetryPolicy, optional): Retry policy for failed requests. Defaults to None.
+        single_flight (SingleFlight, optional): Coalesces identical in-flight reads. Defaults to None.
+        codec (JSONCodec, optional): JSON codec for request and response bodies.
+            Defaults to orjson when installed, otherwise the stdlib json module.
+        base_url (str, optional): API URL with a ``{version}`` placeholder, e.g. a
+            local ``FakeOnOfficeServer``. Defaults to the OnOffice API.
+        field_registry (FieldRegistry, optional): Field definitions used to
+            validate requests before sending. Defaults to None.
+        change_tracker (ChangeTracker, optional): Sends only changed fields of
+            modify actions and skips no-op updates. Defaults to None.
+        circuit_breaker (CircuitBreaker, optional): Fails requests fast while
+            the API is failing. Defaults to None.
+        hedge (HedgePolicy, optional): Sends a second copy of slow reads.
+            Defaults to None.
+        query_engine (LocalQueryEngine, optional): Snapshots answering
+            ``search(local=True)``. Defaults to None.
     """
     
     API_BASE_URL = 'https://api.onoffice.de/api/{version}/api.php'
@@ -36,24 +67,92 @@ class OnOfficeClient:
     ACTION_DELETE = 'urn:onoffice-de-ns:smart:2.5:smartml:action:delete'
     ACTION_GET = 'urn:onoffice-de-ns:smart:2.5:smartml:action:get'
     ACTION_DO = 'urn:onoffice-de-ns:smart:2.5:smartml:action:do'
+    
+    HEADERS = {'Content-Type': 'application/json'}
+    
+    READ_ACTIONS = (ACTION_READ, ACTION_GET)
+    WRITE_ACTIONS = (ACTION_CREATE, ACTION_MODIFY, ACTION_DELETE)
 
     def __init__(
         self,
         token: str,
         secret: str,
         api_version: str = 'stable',
-        timeout: int = 30
+        timeout: int = 30,
+        cache: Optional['ResponseCache'] = None,
+        rate_limiter: Optional['RateLimiter'] = None,
+        retry: Optional['RetryPolicy'] = None,
+        single_flight: Optional['SingleFlight'] = None,
+        codec: Optional[JSONCodec] = None,
+        base_url: Optional[str] = None,
+        field_registry: Optional['FieldRegistry'] = None,
+        change_tracker: Optional['ChangeTracker'] = None,
+        circuit_breaker: Optional['CircuitBreaker'] = None,
+        hedge: Optional['HedgePolicy'] = None,
+        query_engine: Optional['LocalQueryEngine'] = None
     ):
         self.token = token
         self.secret = secret
         self.api_version = api_version
         self.timeout = timeout
-        self.session = requests.Session()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.single_flight = single_flight
+        self.codec = codec or default_codec()
+        if base_url is not None:
+            self.API_BASE_URL = base_url
+        self.field_registry = field_registry
+        if field_registry is not None and field_registry.client is None:
+            field_registry.client = self
+        self.change_tracker = change_tracker
+        self.circuit_breaker = circuit_breaker
+        self.hedge = hedge
+        self.query_engine = query_engine
+        self._signer = None
+        self._hooks = ()
         
         # Initialize resource handlers
         self._estate = None
         self._address = None
     
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Register a function called with a ``RequestEvent`` after every request.
+        
+        Hooks run on the thread (or event loop) that made the request and
+        should return quickly. An exception raised by a hook is logged and
+        does not reach the caller. Without hooks no timings are collected.
+        
+        Args:
+            hook (callable): Function taking a ``RequestEvent``
+            
+        Examples:
+            >>> metrics = MetricsAggregator()
+            >>> client.add_hook(metrics)
+        """
+        self._hooks = self._hooks + (hook,)
+    
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Unregister a hook added with ``add_hook``.
+        
+        Args:
+            hook (callable): The hook to remove
+        """
+        hooks = list(self._hooks)
+        hooks.remove(hook)
+        self._hooks = tuple(hooks)
+    
+    def _emit(self, event: RequestEvent) -> None:
+        """Finish an event and pass it to every hook, logging hook failures."""
+        event.finish()
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Request hook %r failed", hook)
+    
     def _create_hmac2(
         self,
         timestamp: int,
@@ -71,93 +170,663 @@ class OnOfficeClient:
         Returns:
             str: Base64 encoded HMAC signature
         """
-        fields = [str(timestamp), self.token, resource_type, action_id]
-        message = ''.join(fields)
-        key = self.secret.encode('utf-8')
-        msg = message.encode('utf-8')
-        digest = hmac.new(key, msg, hashlib.sha256).digest()
-        return base64.b64encode(digest).decode('utf-8')
+        signer = self._signer
+        if signer is None or signer.token != self.token or signer.secret != self.secret:
+            signer = self._signer = SigningContext(self.token, self.secret)
+        return signer.sign(timestamp, resource_type, action_id)
     
-    def _make_request(
+    def _build_action(
         self,
         resource_type: str,
         action_id: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        identifier: str = ""
     ) -> Dict[str, Any]:
         """
-        Make a request to the OnOffice API.
+        Build a single signed action for the request envelope.
         
         Args:
             resource_type (str): Type of resource being accessed
             action_id (str): ID of the action being performed
             parameters (dict): Request parameters
+            identifier (str, optional): Identifier echoed back in the action result
             
         Returns:
-            dict: API response
-            
-        Raises:
-            AuthenticationError: If authentication fails
-            RateLimitError: If rate limit is exceeded
-            ValidationError: If request validation fails
-            OnOfficeAPIError: For other API errors
+            dict: Action data including its own timestamp and HMAC2 signature
         """
         timestamp = int(time.time())
         hmac2 = self._create_hmac2(timestamp, resource_type, action_id)
         
-        action_data = {
+        return {
             "actionid": action_id,
             "resourceid": "",
             "resourcetype": resource_type,
-            "identifier": "",
+            "identifier": identifier,
             "timestamp": timestamp,
             "hmac": hmac2,
             "hmac_version": "2",
             "parameters": parameters
         }
+    
+    def _sign_action(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent]
+    ) -> Dict[str, Any]:
+        """Build an action, adding the signing time to the event if there is one."""
+        if event is None:
+            return self._build_action(resource_type, action_id, parameters)
+        started = time.perf_counter()
+        action = self._build_action(resource_type, action_id, parameters)
+        event.lap("sign", started)
+        return action
+    
+    def _raise_for_status(self, data: Dict[str, Any]) -> None:
+        """
+        Map the status block of an API response to an exception.
+        
+        Args:
+            data (dict): Decoded API response
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ValidationError: If request validation fails
+            OnOfficeAPIError: For other API errors
+        """
+        if data.get('status', {}).get('code') != 200:
+            error = data.get('status', {})
+            if error.get('code') == 401:
+                raise AuthenticationError("Authentication failed", response=data)
+            elif error.get('code') == 429:
+                raise RateLimitError(
+                    "Rate limit exceeded",
+                    reset_time=error.get('reset_time')
+                )
+            elif error.get('code') == 400:
+                raise ValidationError("Validation failed", errors=error.get('errors'))
+            else:
+                raise OnOfficeAPIError(
+                    f"API error: {error.get('message')}",
+                    response=data
+                )
+    
+    def _raise_for_action_status(self, result: Dict[str, Any]) -> None:
+        """
+        Check the status block of a single action result.
         
-        request_data = {
+        Args:
+            result (dict): One entry of ``response.results``
+            
+        Raises:
+            OnOfficeAPIError: If the action reported an error
+        """
+        status = result.get('status', {})
+        if status.get('errorcode', 0) != 0:
+            raise OnOfficeAPIError(
+                f"Action error {status.get('errorcode')}: {status.get('message')}",
+                response=result
+            )
+    
+    def _cache_key(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any]
+    ) -> Optional[str]:
+        """Get the cache key for a cacheable request, or None."""
+        if self.cache is None or action_id not in self.READ_ACTIONS:
+            return None
+        return request_key(resource_type, action_id, parameters)
+    
+    def _flight_key(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        cache_key: Optional[str]
+    ) -> Optional[str]:
+        """Get the single-flight key for a read that may be coalesced, or None."""
+        if self.single_flight is None or action_id not in self.READ_ACTIONS:
+            return None
+        return cache_key or request_key(resource_type, action_id, parameters)
+    
+    def _invalidate_cache(self, resource_type: str, action_id: str) -> None:
+        """Drop cached reads of a resource type after a write went through."""
+        if self.cache is not None and action_id in self.WRITE_ACTIONS:
+            self.cache.invalidate(resource_type)
+    
+    def _rate_limited(self, error: RateLimitError) -> None:
+        """Pause every user of the rate limiter until the server-side limit resets."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.pause(reset_delay(error.reset_time))
+    
+    def _build_request(self, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Wrap signed actions in the request envelope.
+        
+        Args:
+            actions (list): Actions built with ``_build_action``
+            
+        Returns:
+            dict: Request body
+        """
+        return {
             "token": self.token,
             "request": {
-                "actions": [action_data]
+                "actions": actions
             }
         }
+
+class OnOfficeClient(BaseClient):
+    """
+    Main client class for interacting with the OnOffice API.
+    
+    Args:
+        token (str): Your OnOffice API token
+        secret (str): Your OnOffice API secret
+        api_version (str, optional): API version to use. Defaults to 'stable'.
+        timeout (int, optional): Request timeout in seconds. Defaults to 30.
+        cache (ResponseCache, optional): Cache for read actions. Defaults to None.
+        rate_limiter (RateLimiter, optional): Limiter pacing outgoing requests. Defaults to None.
+        retry (RetryPolicy, optional): Retry policy for failed requests. Defaults to None.
+        single_flight (SingleFlight, optional): Coalesces identical in-flight reads. Defaults to None.
+        codec (JSONCodec, optional): JSON codec for request and response bodies.
+            Defaults to orjson when installed, otherwise the stdlib json module.
+        base_url (str, optional): API URL with a ``{version}`` placeholder, e.g. a
+            local ``FakeOnOfficeServer``. Defaults to the OnOffice API.
+        field_registry (FieldRegistry, optional): Field definitions used to
+            validate requests before sending. Defaults to None.
+        change_tracker (ChangeTracker, optional): Sends only changed fields of
+            modify actions and skips no-op updates. Defaults to None.
+        circuit_breaker (CircuitBreaker, optional): Fails requests fast while
+            the API is failing. Defaults to None.
+        hedge (HedgePolicy, optional): Sends a second copy of slow reads.
+            Defaults to None.
+        query_engine (LocalQueryEngine, optional): Snapshots answering
+            ``search(local=True)``. Defaults to None.
+        transport (Transport, optional): HTTP transport. Defaults to a
+            ``RequestsTransport`` with default pool sizes.
+    
+    Examples:
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret")
+        >>> estates = client.estate.search(filters={"status": [{"op": "=", "val": 1}]})
+    """
+
+    def __init__(
+        self,
+        token: str,
+        secret: str,
+        api_version: str = 'stable',
+        timeout: int = 30,
+        cache: Optional['ResponseCache'] = None,
+        rate_limiter: Optional['RateLimiter'] = None,
+        retry: Optional['RetryPolicy'] = None,
+        single_flight: Optional['SingleFlight'] = None,
+        codec: Optional[JSONCodec] = None,
+        transport: Optional[Transport] = None,
+        base_url: Optional[str] = None,
+        field_registry: Optional['FieldRegistry'] = None,
+        change_tracker: Optional['ChangeTracker'] = None,
+        circuit_breaker: Optional['CircuitBreaker'] = None,
+        hedge: Optional['HedgePolicy'] = None,
+        query_engine: Optional['LocalQueryEngine'] = None
+    ):
+        super().__init__(
+            token,
+            secret,
+            api_version=api_version,
+            timeout=timeout,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            single_flight=single_flight,
+            codec=codec,
+            base_url=base_url,
+            field_registry=field_registry,
+            change_tracker=change_tracker,
+            circuit_breaker=circuit_breaker,
+            hedge=hedge,
+            query_engine=query_engine
+        )
+        self.transport = transport or RequestsTransport()
+        self._hedge_pool = None
+        self._hedge_slots = None
+        if hedge is not None:
+            self._hedge_pool = ThreadPoolExecutor(
+                max_workers=hedge.max_workers,
+                thread_name_prefix="onoffice-hedge"
+            )
+            # Tasks only go to the pool while a thread is free, so none waits in its queue
+            self._hedge_slots = threading.BoundedSemaphore(hedge.max_workers)
+    
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """The ``requests.Session`` of a ``RequestsTransport``, otherwise None."""
+        return getattr(self.transport, 'session', None)
+    
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Open connections to the API ahead of the first requests.
         
-        headers = {
-            'Content-Type': 'application/json'
-        }
+        Args:
+            connections (int, optional): Number of connections to open. Defaults to 1
+            
+        Returns:
+            int: Number of connections opened
+            
+        Examples:
+            >>> client.warm_up(10)
+            10
+        """
+        return self.transport.warm_up(self.API_BASE_URL.format(version=self.api_version), connections)
+    
+    def transport_stats(self) -> Dict[str, int]:
+        """
+        Get connection counters of the transport.
+        
+        Returns:
+            dict: Requests sent, connections created and requests served on reused connections
+        """
+        return self.transport.stats()
+    
+    def _send(
+        self,
+        actions: List[Dict[str, Any]],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """
+        Send one or more signed actions in a single request.
         
+        Args:
+            actions (list): Actions built with ``_build_action``
+            event (RequestEvent, optional): Event collecting phase timings
+            
+        Returns:
+            dict: API response
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ValidationError: If request validation fails
+            CircuitOpenError: If the circuit breaker is open
+            OnOfficeAPIError: For other API errors
+        """
+        if self.circuit_breaker is None:
+            return self._post(actions, event)
+        
+        self.circuit_breaker.before()
+        started = time.monotonic()
         try:
-            response = self.session.post(
+            data = self._post(actions, event)
+        except Exception as e:
+            self.circuit_breaker.record(time.monotonic() - started, e)
+            raise
+        self.circuit_breaker.record(time.monotonic() - started)
+        return data
+    
+    def _post(
+        self,
+        actions: List[Dict[str, Any]],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Encode and post one request, then decode it and map API errors."""
+        if event is not None:
+            started = time.perf_counter()
+        body = self.codec.dumps(self._build_request(actions))
+        if event is not None:
+            started = event.lap("encode", started)
+            event.request_bytes += len(body)
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+            if event is not None:
+                started = event.lap("rate_limit", started)
+        
+        try:
+            response = self.transport.post(
                 self.API_BASE_URL.format(version=self.api_version),
-                json=request_data,
-                headers=headers,
+                body,
+                self.HEADERS,
                 timeout=self.timeout
             )
+            if event is not None:
+                started = event.lap("network", started)
+                event.http_status = response.status_code
+                event.response_bytes += len(response.content)
             response.raise_for_status()
-            data = response.json()
+            data = self.codec.loads(response.content)
+            if event is not None:
+                started = event.lap("decode", started)
+                event.status_code = data.get('status', {}).get('code')
             
             # Check for API errors
-            if data.get('status', {}).get('code') != 200:
-                error = data.get('status', {})
-                if error.get('code') == 401:
-                    raise AuthenticationError("Authentication failed", response=data)
-                elif error.get('code') == 429:
-                    raise RateLimitError(
-                        "Rate limit exceeded",
-                        reset_time=error.get('reset_time')
-                    )
-                elif error.get('code') == 400:
-                    raise ValidationError("Validation failed", errors=error.get('errors'))
-                else:
-                    raise OnOfficeAPIError(
-                        f"API error: {error.get('message')}",
-                        response=data
-                    )
+            self._raise_for_status(data)
+            if event is not None:
+                event.lap("status", started)
+            
+            return data
             
+        except RateLimitError as e:
+            self._rate_limited(e)
+            raise
+        except requests.exceptions.RequestException as e:
+            raise OnOfficeAPIError(f"Request failed: {str(e)}") from e
+        except ValueError as e:
+            raise OnOfficeAPIError(f"Invalid response: {str(e)}") from e
+    
+    def _attempt(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Sign and send one attempt of an action, hedging reads with a hedge policy."""
+        if self.hedge is None or action_id not in self.READ_ACTIONS:
+            return self._send([self._sign_action(resource_type, action_id, parameters, event)], event)
+        
+        delay = self.hedge.delay()
+        started = time.perf_counter()
+        if delay is None:
+            data = self._send([self._sign_action(resource_type, action_id, parameters, event)], event)
+        else:
+            data = self._hedged(resource_type, action_id, parameters, event, delay)
+        self.hedge.observe(time.perf_counter() - started)
+        return data
+    
+    def _hedged(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent],
+        delay: float
+    ) -> Dict[str, Any]:
+        """Send a read, and a copy of it if no answer arrived after ``delay`` seconds."""
+        primary = self._submit_hedged(self._sign_action(resource_type, action_id, parameters, event), event)
+        if primary is None:
+            # Every hedge thread is busy: send on this thread without a copy
+            return self._send([self._sign_action(resource_type, action_id, parameters, event)], event)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        
+        copy = None
+        if self.hedge.allow_hedge():
+            copy = self._submit_hedged(self._sign_action(resource_type, action_id, parameters, None))
+        if copy is None:
+            return primary.result()
+        
+        # The slower of the two is left to finish in the background
+        error = None
+        for future in as_completed((primary, copy)):
+            try:
+                data = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+            self.hedge.record_hedge(won=future is copy)
             return data
+        self.hedge.record_hedge(won=False)
+        raise error
+    
+    def _submit_hedged(self, action: Dict[str, Any], event: Optional[RequestEvent] = None):
+        """Run an action on a free hedge thread, or return None if all are busy."""
+        if not self._hedge_slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._hedge_pool.submit(self._send, [action], event)
+        except BaseException:
+            self._hedge_slots.release()
+            raise
+        future.add_done_callback(lambda _: self._hedge_slots.release())
+        return future
+    
+    def _send_action(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Sign and send a single action, retrying it according to the retry policy."""
+        if self.retry is None:
+            return self._attempt(resource_type, action_id, parameters, event)
+        
+        started = self.retry.start()
+        attempt = 1
+        while True:
+            try:
+                return self._attempt(resource_type, action_id, parameters, event)
+            except OnOfficeAPIError as e:
+                delay = self.retry.next_delay(
+                    e,
+                    attempt,
+                    started,
+                    idempotent=action_id in self.READ_ACTIONS,
+                    rate_limited=self.rate_limiter is not None
+                )
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+            if event is not None:
+                event.phases["backoff"] = event.phases.get("backoff", 0.0) + delay
+                event.retries += 1
+    
+    def _make_request(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the OnOffice API.
+        
+        Args:
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action being performed
+            parameters (dict): Request parameters
+            
+        Returns:
+            dict: API response
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ValidationError: If request validation fails
+            OnOfficeAPIError: For other API errors
+        """
+        if not self._hooks:
+            return self._request(resource_type, action_id, parameters)
+        
+        event = RequestEvent(resource_type, action_id)
+        try:
+            return self._request(resource_type, action_id, parameters, event)
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            self._emit(event)
+    
+    def _request(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        event: Optional[RequestEvent] = None
+    ) -> Dict[str, Any]:
+        """Serve a request from the cache, a coalesced request or the API."""
+        if self.change_tracker is not None:
+            parameters = self.change_tracker.prepare(resource_type, action_id, parameters)
+            if parameters is None:
+                return skipped_response(resource_type, action_id)
+        
+        cache_key = self._cache_key(resource_type, action_id, parameters)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if event is not None:
+                event.cache = "miss" if cached is None else "hit"
+            if cached is not None:
+                return cached
+            generation = self.cache.generation(resource_type)
+        
+        flight_key = self._flight_key(resource_type, action_id, parameters, cache_key)
+        if flight_key is not None:
+            if event is not None:
+                event.coalesced = True
+            
+            def send():
+                if event is not None:
+                    event.coalesced = False
+                return self._send_action(resource_type, action_id, parameters, event)
+            
+            data = self.single_flight.do(flight_key, send)
+        else:
+            data = self._send_action(resource_type, action_id, parameters, event)
+        
+        if cache_key is not None:
+            self.cache.set(resource_type, cache_key, data, generation=generation)
+        else:
+            self._invalidate_cache(resource_type, action_id)
+        if self.change_tracker is not None:
+            self.change_tracker.record(resource_type, action_id, parameters, data)
+        return data
+    
+    def _stream_request(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        chunk_size: int = 65536
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Make a request and parse the response body incrementally.
+        
+        The status blocks are still checked, but records are yielded one at
+        a time while the body is read from the socket. Streamed requests
+        bypass the cache and are not retried, since records may already
+        have been consumed when an error occurs.
+        
+        Args:
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action being performed
+            parameters (dict): Request parameters
+            chunk_size (int, optional): Bytes read from the socket at a time. Defaults to 65536
+            
+        Yields:
+            dict: Single records from ``response.results[*].data.records``
             
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            ValidationError: If request validation fails
+            OnOfficeAPIError: For other API errors
+        """
+        event = RequestEvent(resource_type, action_id) if self._hooks else None
+        try:
+            yield from self._stream_records(resource_type, action_id, parameters, chunk_size, event)
+        except Exception as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if event is not None:
+                self._emit(event)
+    
+    def _stream_records(
+        self,
+        resource_type: str,
+        action_id: str,
+        parameters: Dict[str, Any],
+        chunk_size: int,
+        event: Optional[RequestEvent]
+    ) -> Iterator[Dict[str, Any]]:
+        """Post one action with a streamed response and yield its records."""
+        action = self._sign_action(resource_type, action_id, parameters, event)
+        if event is not None:
+            started = time.perf_counter()
+        body = self.codec.dumps(self._build_request([action]))
+        if event is not None:
+            started = event.lap("encode", started)
+            event.request_bytes += len(body)
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+            if event is not None:
+                started = event.lap("rate_limit", started)
+        
+        try:
+            response = self.transport.post(
+                self.API_BASE_URL.format(version=self.api_version),
+                body,
+                self.HEADERS,
+                timeout=self.timeout,
+                stream=True
+            )
         except requests.exceptions.RequestException as e:
-            raise OnOfficeAPIError(f"Request failed: {str(e)}")
+            raise OnOfficeAPIError(f"Request failed: {str(e)}") from e
+        if event is not None:
+            event.lap("network", started)
+            event.http_status = response.status_code
+        
+        def check_status(status):
+            if event is not None:
+                event.status_code = status.get('code')
+            self._raise_for_status({"status": status})
+        
+        try:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=chunk_size)
+            if event is not None:
+                chunks = _counted(chunks, event)
+            parser = StreamingParser(
+                chunks,
+                check_status=check_status,
+                check_action_status=lambda status: self._raise_for_action_status({"status": status})
+            )
+            yield from parser.records()
+        except RateLimitError as e:
+            self._rate_limited(e)
+            raise
+        except requests.exceptions.RequestException as e:
+            raise OnOfficeAPIError(f"Request failed: {str(e)}") from e
+        except ValueError as e:
+            raise OnOfficeAPIError(f"Invalid response: {str(e)}") from e
+        finally:
+            response.close()
+    
+    def batch(
+        self,
+        max_actions: int = 50,
+        max_payload_bytes: Optional[int] = None
+    ) -> 'Batch':
+        """
+        Collect several actions and send them in as few requests as possible.
+        
+        Every action is signed on its own; up to ``max_actions`` of them are
+        packed into one POST when the batch is executed.
+        
+        Args:
+            max_actions (int, optional): Maximum actions per request. Defaults to 50
+            max_payload_bytes (int, optional): Maximum encoded size of the action
+                parameters per request. Defaults to None (no limit)
+            
+        Returns:
+            Batch: Batch context manager with ``estate`` and ``address`` handlers
+            
+        Examples:
+            >>> with client.batch() as b:
+            ...     first = b.estate.get(123)
+            ...     people = b.address.search(limit=10)
+            >>> first.result()
+        """
+        from .batch import Batch
+        return Batch(self, max_actions=max_actions, max_payload_bytes=max_payload_bytes)
     
     @property
     def estate(self) -> 'EstateResource':
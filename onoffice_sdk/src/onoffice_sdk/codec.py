@@ -0,0 +1,47 @@
+"""
+Pluggable JSON encoding for request and response bodies.
+"""
+
+import json
+from typing import Any
+
+class JSONCodec:
+    """Encodes request bodies to bytes and decodes response bodies."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return json.loads(data)
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+def default_codec() -> JSONCodec:
+    """
+    Get the fastest available codec.
+
+    Returns:
+        JSONCodec: ``OrjsonCodec`` when orjson is installed, otherwise the stdlib codec
+    """
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
@@ -0,0 +1,428 @@
+"""
+Column-oriented container for search results.
+
+Stores records in typed arrays instead of one dict per record and exports
+them to pandas or Arrow without copying the value buffers.
+"""
+
+import re
+from array import array
+from typing import Dict, List, Any, Iterable, Iterator, Mapping, Optional
+
+_INT_PATTERN = re.compile(r'-?(0|[1-9][0-9]*)$')
+# Leading zeros (postal codes, phone numbers) keep a value a string
+_FLOAT_PATTERN = re.compile(r'-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?$')
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value == ''
+
+def _as_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and _INT_PATTERN.match(value):
+        return int(value)
+    return None
+
+def _as_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and _FLOAT_PATTERN.match(value):
+        return float(value)
+    return None
+
+def _decimals(text: str) -> Optional[int]:
+    # Digits after the point of a plain decimal, None for exponent notation
+    if 'e' in text or 'E' in text:
+        return None
+    point = text.find('.')
+    return 0 if point < 0 else len(text) - point - 1
+
+def _format(number: Any, decimals: int) -> str:
+    if isinstance(number, int) and decimals == 0:
+        return str(number)
+    return f"{number:.{decimals}f}"
+
+class Column:
+    """
+    A typed column.
+
+    Original values are not kept per row. Numeric columns built from API
+    strings remember how many decimals the strings had, so "250000.00"
+    comes back from the stored 250000.0; the few rows that this does not
+    reproduce are kept in ``exceptions``.
+
+    Args:
+        kind (str): "int", "float", "dictionary" or "string"
+        values: ``array('q')``, ``array('d')``, ``array('i')`` of dictionary codes, or a list
+        missing (bytearray): One byte per row, 1 where the value is missing or empty
+        categories (list, optional): Dictionary of a "dictionary" column
+        decimals (int, optional): Decimals of the original strings of a numeric
+            column, or None if the originals were numbers
+        exceptions (dict, optional): Original values by row index, for rows
+            the typed value and ``decimals`` do not reproduce
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        values,
+        missing: bytearray,
+        categories: Optional[List[str]] = None,
+        decimals: Optional[int] = None,
+        exceptions: Optional[Dict[int, Any]] = None
+    ):
+        self.kind = kind
+        self.values = values
+        self.missing = missing
+        self.categories = categories
+        self.decimals = decimals
+        self.exceptions = exceptions or {}
+
+    def __len__(self) -> int:
+        return len(self.missing)
+
+    def value(self, index: int) -> Any:
+        """Get the Python value of one row, or None if it is missing."""
+        if self.missing[index]:
+            return None
+        if self.kind == "dictionary":
+            return self.categories[self.values[index]]
+        return self.values[index]
+
+    def source(self, index: int) -> Any:
+        """Get the value of one row as it was in the record, or None if it is missing."""
+        if self.missing[index]:
+            return None
+        if index in self.exceptions:
+            return self.exceptions[index]
+        if self.decimals is not None:
+            return _format(self.values[index], self.decimals)
+        return self.value(index)
+
+class _ColumnBuilder:
+    """Accumulates one field, widening int -> float -> string as values require."""
+
+    def __init__(self, kind: Optional[str] = None):
+        self.fixed = kind is not None
+        self.kind = kind or "int"
+        self.missing = bytearray()
+        self.values = array('q') if self.kind == "int" else array('d') if self.kind == "float" else array('i')
+        self.categories = {}
+        # Numeric columns: None until the first value, -1 for numbers, else decimals of the strings
+        self.decimals = None
+        self.exceptions = {}
+
+    def _source(self, index: int) -> Any:
+        if index in self.exceptions:
+            return self.exceptions[index]
+        if self.decimals is not None and self.decimals >= 0:
+            return _format(self.values[index], self.decimals)
+        return self.values[index]
+
+    def _keep(self, value: Any, number: Any) -> None:
+        # Remember the original of the last row only where the column format cannot rebuild it
+        index = len(self.missing) - 1
+        if isinstance(value, str):
+            if self.decimals is None:
+                self.decimals = _decimals(value)
+            if self.decimals is not None and self.decimals >= 0 and _format(number, self.decimals) == value:
+                return
+        else:
+            if self.decimals is None:
+                self.decimals = -1
+            if self.decimals == -1 and type(value) is type(number):
+                return
+        self.exceptions[index] = value
+
+    def _to_float(self) -> None:
+        if self.decimals == -1:
+            # Ints given as numbers are no longer reproduced by the float values
+            for index, value in enumerate(self.values):
+                if not self.missing[index]:
+                    self.exceptions.setdefault(index, value)
+        self.values = array('d', (
+            float('nan') if self.missing[index] else value
+            for index, value in enumerate(self.values)
+        ))
+        self.kind = "float"
+
+    def _to_string(self) -> None:
+        # Rebuild from the original values, so "1" does not come back as "1.0"
+        codes = array('i')
+        for index, missing in enumerate(self.missing):
+            if missing:
+                codes.append(-1)
+                continue
+            value = self._source(index)
+            if isinstance(value, str):
+                self.exceptions.pop(index, None)
+            else:
+                self.exceptions[index] = value
+            codes.append(self._code(value if isinstance(value, str) else str(value)))
+        self.values = codes
+        self.kind = "string"
+        self.decimals = None
+
+    def _code(self, text: str) -> int:
+        code = self.categories.get(text)
+        if code is None:
+            code = self.categories[text] = len(self.categories)
+        return code
+
+    def append(self, value: Any) -> None:
+        if _is_missing(value):
+            self.missing.append(1)
+            self.values.append(float('nan') if self.kind == "float" else -1 if self.kind == "string" else 0)
+            return
+        if self.kind == "int":
+            number = _as_int(value)
+            if number is not None and -2 ** 63 <= number < 2 ** 63:
+                self.missing.append(0)
+                self.values.append(number)
+                self._keep(value, number)
+                return
+            if self.fixed:
+                raise ValueError(f"Value {value!r} is not an int")
+            self._to_float()
+        if self.kind == "float":
+            number = _as_float(value)
+            if number is not None:
+                self.missing.append(0)
+                self.values.append(number)
+                self._keep(value, number)
+                return
+            if self.fixed:
+                raise ValueError(f"Value {value!r} is not a float")
+            self._to_string()
+        self.missing.append(0)
+        if isinstance(value, str):
+            self.values.append(self._code(value))
+        else:
+            self.values.append(self._code(str(value)))
+            self.exceptions[len(self.missing) - 1] = value
+
+    def build(self, dictionary_threshold: float) -> Column:
+        if self.kind in ("int", "float"):
+            decimals = self.decimals if self.decimals is not None and self.decimals >= 0 else None
+            return Column(self.kind, self.values, self.missing, decimals=decimals, exceptions=self.exceptions)
+        categories = list(self.categories)
+        if len(categories) <= dictionary_threshold * max(1, len(self.missing)):
+            return Column("dictionary", self.values, self.missing, categories, exceptions=self.exceptions)
+        strings = [None if code < 0 else categories[code] for code in self.values]
+        return Column("string", strings, self.missing, exceptions=self.exceptions)
+
+class RowView(Mapping):
+    """
+    Read-only, dict-like view of one row.
+
+    Values are looked up in the columns on access.
+    """
+
+    def __init__(self, records: 'ColumnarRecords', index: int):
+        self._records = records
+        self._index = index
+
+    @property
+    def id(self) -> Any:
+        """Record ID."""
+        return self._records.ids.value(self._index)
+
+    def __getitem__(self, field: str) -> Any:
+        return self._records.columns[field].value(self._index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records.columns)
+
+    def __len__(self) -> int:
+        return len(self._records.columns)
+
+    def to_record(self) -> Dict[str, Any]:
+        """Get the row in the API record shape, with ``id`` and ``elements``."""
+        return {"id": self.id, "elements": dict(self)}
+
+    def __repr__(self) -> str:
+        return f"RowView(id={self.id!r}, {dict(self)!r})"
+
+class ColumnarRecords:
+    """
+    Search results stored column by column.
+
+    Integer and float fields are kept in ``array`` buffers, low-cardinality
+    strings (e.g. ``objektart``) are dictionary-encoded, and other strings
+    are kept as lists. Rows are available as lazy ``RowView`` objects.
+    ``Column.source`` returns a value as it was in the record, like
+    "250000.00" for a float column holding 250000.0.
+
+    Args:
+        ids (Column): Record IDs
+        columns (dict): Columns keyed by field name
+        total (int, optional): Total number of matching records reported by the API
+
+    Examples:
+        >>> estates = client.estate.search(fields=["Id", "kaufpreis", "objektart"], columnar=True)
+        >>> estates.columns["kaufpreis"].kind
+        'float'
+        >>> df = estates.to_pandas()
+    """
+
+    def __init__(self, ids: Column, columns: Dict[str, Column], total: Optional[int] = None):
+        self.ids = ids
+        self.columns = columns
+        self.total = total
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+        dictionary_threshold: float = 0.5,
+        total: Optional[int] = None
+    ) -> 'ColumnarRecords':
+        """
+        Build columns from API records.
+
+        Records are consumed one at a time, so an iterator such as
+        ``iter_search`` never has to be held in memory as dicts.
+
+        Args:
+            records (iterable): Records with ``id`` and ``elements``
+            fields (list, optional): Fields to keep. Defaults to all fields seen
+            dtypes (dict, optional): Fixed kinds per field ("int", "float" or "string")
+            dictionary_threshold (float, optional): Maximum ratio of distinct to total
+                values for dictionary-encoding a string column. Defaults to 0.5
+            total (int, optional): Total number of matching records
+
+        Returns:
+            ColumnarRecords: The records in columnar form
+        """
+        dtypes = dtypes or {}
+        ids = _ColumnBuilder()
+        builders = {}
+        if fields is not None:
+            for field in fields:
+                builders[field] = _ColumnBuilder(dtypes.get(field))
+
+        count = 0
+        for record in records:
+            ids.append(record.get("id"))
+            elements = record.get("elements", {})
+            if fields is None:
+                for field in elements:
+                    if field not in builders:
+                        builder = builders[field] = _ColumnBuilder(dtypes.get(field))
+                        for _ in range(count):
+                            builder.append(None)
+            for field, builder in builders.items():
+                builder.append(elements.get(field))
+            count += 1
+
+        return cls(
+            ids.build(dictionary_threshold),
+            {field: builder.build(dictionary_threshold) for field, builder in builders.items()},
+            total=total
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        for index in range(len(self)):
+            yield RowView(self, index)
+
+    def to_pandas(self):
+        """
+        Convert to a ``pandas.DataFrame`` indexed by record ID.
+
+        Numeric columns and dictionary codes are wrapped with
+        ``numpy.frombuffer`` and handed to pandas without copying. Missing
+        floats are NaN; integer columns with missing values become nullable
+        ``Int64`` columns.
+
+        Returns:
+            pandas.DataFrame: One column per field
+        """
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "to_pandas requires pandas. Install it with: pip install onoffice-sdk[dataframe]"
+            )
+
+        def convert(column):
+            missing = np.frombuffer(column.missing, dtype=np.bool_)
+            if column.kind == "int":
+                values = np.frombuffer(column.values, dtype=np.int64)
+                if missing.any():
+                    return pd.arrays.IntegerArray(values, missing, copy=False)
+                return values
+            if column.kind == "float":
+                return np.frombuffer(column.values, dtype=np.float64)
+            if column.kind == "dictionary":
+                codes = np.frombuffer(column.values, dtype=np.int32)
+                return pd.Categorical.from_codes(codes, categories=column.categories)
+            return np.array(column.values, dtype=object)
+
+        return pd.DataFrame(
+            {field: convert(column) for field, column in self.columns.items()},
+            index=pd.Index(convert(self.ids), name="id"),
+            copy=False
+        )
+
+    def to_arrow(self):
+        """
+        Convert to a ``pyarrow.Table``.
+
+        Value buffers of numeric and dictionary columns are shared with
+        Arrow through ``pyarrow.py_buffer``; only validity bitmaps are built.
+
+        Returns:
+            pyarrow.Table: An ``id`` column plus one column per field
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "to_arrow requires pyarrow. Install it with: pip install onoffice-sdk[arrow]"
+            )
+
+        def validity(column):
+            if not any(column.missing):
+                return None
+            bitmap = bytearray((len(column) + 7) // 8)
+            for index, missing in enumerate(column.missing):
+                if not missing:
+                    bitmap[index >> 3] |= 1 << (index & 7)
+            return pa.py_buffer(bitmap)
+
+        def convert(column):
+            if column.kind == "int":
+                return pa.Array.from_buffers(
+                    pa.int64(), len(column), [validity(column), pa.py_buffer(column.values)]
+                )
+            if column.kind == "float":
+                return pa.Array.from_buffers(
+                    pa.float64(), len(column), [validity(column), pa.py_buffer(column.values)]
+                )
+            if column.kind == "dictionary":
+                indices = pa.Array.from_buffers(
+                    pa.int32(), len(column), [validity(column), pa.py_buffer(column.values)]
+                )
+                return pa.DictionaryArray.from_arrays(indices, pa.array(column.categories, pa.string()))
+            return pa.array(column.values, pa.string())
+
+        names = ["id"] + list(self.columns)
+        arrays = [convert(self.ids)] + [convert(column) for column in self.columns.values()]
+        return pa.Table.from_arrays(arrays, names=names)
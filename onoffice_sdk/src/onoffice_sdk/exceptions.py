@@ -23,3 +23,9 @@ class ValidationError(OnOfficeAPIError):
     def __init__(self, message, errors=None):
         super().__init__(message)
         self.errors = errors or {}
+
+class CircuitOpenError(OnOfficeAPIError):
+    """Raised without a request while the circuit breaker is open."""
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,283 @@
+"""
+Field metadata registry and client-side request validation.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from .exceptions import ValidationError
+from .utils import get_records
+
+ACTION_GET = 'urn:onoffice-de-ns:smart:2.5:smartml:action:get'
+
+OPERATORS = {
+    "=", "==", "!=", "<>", "<", ">", "<=", ">=",
+    "IN", "NOT IN", "LIKE", "NOT LIKE", "BETWEEN", "NOT BETWEEN", "REGEXP"
+}
+_LIST_OPERATORS = {"IN", "NOT IN"}
+_RANGE_OPERATORS = {"BETWEEN", "NOT BETWEEN"}
+_TEXT_OPERATORS = {"LIKE", "NOT LIKE", "REGEXP"}
+
+_INT_TYPES = {"integer", "int", "tinyint", "smallint", "bigint"}
+_FLOAT_TYPES = {"float", "decimal", "double"}
+_DATE_TYPES = {"date", "datetime", "timestamp"}
+_SELECT_TYPES = {"singleselect", "multiselect"}
+
+_INT_PATTERN = re.compile(r'-?[0-9]+$')
+_FLOAT_PATTERN = re.compile(r'-?[0-9]+(\.[0-9]+)?$')
+_DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Fields every record has, whether or not the account lists them
+_BUILTIN_FIELDS = {"Id": {"type": "integer"}}
+
+def _check_value(definition: Dict[str, Any], value: Any) -> Optional[str]:
+    """Get an error message if ``value`` does not fit the field type, else None."""
+    field_type = str(definition.get("type", "")).lower()
+    if value is None or value == "":
+        return None
+    if field_type in _INT_TYPES:
+        if isinstance(value, bool) or not (isinstance(value, int) or _INT_PATTERN.match(str(value))):
+            return f"expected an integer, got {value!r}"
+    elif field_type in _FLOAT_TYPES:
+        if isinstance(value, bool) or not (isinstance(value, (int, float)) or _FLOAT_PATTERN.match(str(value))):
+            return f"expected a number, got {value!r}"
+    elif field_type == "boolean":
+        if value not in (True, False, 0, 1, "0", "1"):
+            return f"expected a boolean, got {value!r}"
+    elif field_type in _DATE_TYPES:
+        if not isinstance(value, str) or not _DATE_PATTERN.match(value):
+            return f"expected a date (YYYY-MM-DD), got {value!r}"
+    elif field_type in _SELECT_TYPES:
+        permitted = definition.get("permittedvalues")
+        if permitted and str(value) not in {str(key) for key in permitted}:
+            return f"{value!r} is not a permitted value"
+    return None
+
+class FieldRegistry:
+    """
+    Field definitions of the account, used to validate requests locally.
+
+    Definitions are fetched once per module with the ``fields`` resource and
+    kept in memory. With ``path`` they are also stored on disk and reused
+    until ``ttl`` expires, so new processes do not fetch them again.
+
+    Once registered with a client, searches and reads check their fields,
+    filters and sort fields before sending, and resources request only
+    those of their default fields that exist in the account.
+
+    Args:
+        path (str, optional): JSON file caching the definitions. Defaults to None (memory only)
+        ttl (float, optional): Seconds until the definitions are fetched again. Defaults to 86400
+        modules (tuple, optional): Modules to load. Defaults to ("estate", "address")
+
+    Examples:
+        >>> registry = FieldRegistry(path="~/.cache/onoffice_fields.json")
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", field_registry=registry)
+        >>> client.estate.search(fields=["Id", "kaufpreiss"])
+        Traceback (most recent call last):
+        ValidationError: Invalid fields for estate
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 86400,
+        modules: Tuple[str, ...] = ("estate", "address")
+    ):
+        self.path = os.path.expanduser(path) if path else None
+        self.ttl = ttl
+        self.modules = tuple(modules)
+        self.client = None
+        self._fields = None
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def _account(self) -> str:
+        """Key of the account the definitions belong to."""
+        return hashlib.sha256(self.client.token.encode('utf-8')).hexdigest()[:16]
+
+    @property
+    def loaded(self) -> bool:
+        """True if definitions are loaded and not expired."""
+        return self._fields is not None and time.time() - self._loaded_at < self.ttl
+
+    def _parameters(self) -> Dict[str, Any]:
+        return {"modules": list(self.modules), "labels": True}
+
+    def _parse(self, response: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        fields = {}
+        for record in get_records(response):
+            module = record.get("id")
+            elements = record.get("elements", {})
+            fields[module] = {
+                name: definition for name, definition in elements.items()
+                if isinstance(definition, dict)
+            }
+        return fields
+
+    def _read_disk(self) -> bool:
+        if self.path is None or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if stored.get("account") != self._account() or time.time() - stored.get("fetched_at", 0) >= self.ttl:
+            return False
+        self._fields = stored["fields"]
+        self._loaded_at = stored["fetched_at"]
+        return True
+
+    def _store(self, fields: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        self._fields = fields
+        self._loaded_at = time.time()
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding='utf-8') as f:
+            json.dump({"account": self._account(), "fetched_at": self._loaded_at, "fields": fields}, f)
+        os.replace(temporary, self.path)
+
+    def load(self, force: bool = False) -> None:
+        """
+        Load the definitions from disk or the API.
+
+        Args:
+            force (bool, optional): Fetch from the API even if cached. Defaults to False
+        """
+        with self._lock:
+            if not force and (self.loaded or self._read_disk()):
+                return
+            response = self.client._make_request("fields", ACTION_GET, self._parameters())
+            self._store(self._parse(response))
+
+    async def load_async(self, force: bool = False) -> None:
+        """
+        Load the definitions with an ``AsyncOnOfficeClient``.
+
+        Async clients do not fetch definitions on demand; await this once
+        before making requests.
+
+        Args:
+            force (bool, optional): Fetch from the API even if cached. Defaults to False
+        """
+        if not force and (self.loaded or self._read_disk()):
+            return
+        response = await self.client._make_request("fields", ACTION_GET, self._parameters())
+        self._store(self._parse(response))
+
+    def _ensure(self) -> None:
+        if self.loaded:
+            return
+        if asyncio.iscoroutinefunction(self.client._make_request):
+            if not self._read_disk():
+                raise RuntimeError("Field definitions are not loaded; await registry.load_async() first")
+            return
+        self.load()
+
+    def fields(self, resource_type: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the field definitions of a module.
+
+        Args:
+            resource_type (str): Module name, e.g. "estate"
+
+        Returns:
+            dict: Definitions keyed by field name
+        """
+        self._ensure()
+        return dict(_BUILTIN_FIELDS, **self._fields.get(resource_type, {}))
+
+    def existing(self, resource_type: str, fields: List[str]) -> List[str]:
+        """
+        Keep only the fields that exist in the account.
+
+        Args:
+            resource_type (str): Module name
+            fields (list): Field names
+
+        Returns:
+            list: Existing field names in the given order
+        """
+        if resource_type not in self.modules:
+            return list(fields)
+        known = self.fields(resource_type)
+        return [field for field in fields if field in known]
+
+    def validate(
+        self,
+        resource_type: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        sort_by: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Check field names, filter operators and filter values.
+
+        Args:
+            resource_type (str): Module name
+            fields (list, optional): Requested fields
+            filters (dict, optional): Search filters
+            sort_by (dict, optional): Sorting criteria
+
+        Raises:
+            ValidationError: With ``errors`` mapping each invalid field to a message
+        """
+        if resource_type not in self.modules:
+            return
+        known = self.fields(resource_type)
+        errors = {}
+
+        for field in fields or []:
+            if field not in known:
+                errors[field] = "unknown field"
+
+        for field, direction in (sort_by or {}).items():
+            if field not in known:
+                errors[field] = "unknown sort field"
+            elif str(direction).upper() not in ("ASC", "DESC"):
+                errors[field] = f"invalid sort direction {direction!r}"
+
+        for field, conditions in (filters or {}).items():
+            if field not in known:
+                errors[field] = "unknown filter field"
+                continue
+            for condition in conditions:
+                message = self._check_condition(known[field], condition)
+                if message is not None:
+                    errors[field] = message
+                    break
+
+        if errors:
+            raise ValidationError(f"Invalid fields for {resource_type}", errors=errors)
+
+    @staticmethod
+    def _check_condition(definition: Dict[str, Any], condition: Dict[str, Any]) -> Optional[str]:
+        op = str(condition.get("op", "=")).upper()
+        if op not in OPERATORS:
+            return f"unknown operator {condition.get('op')!r}"
+        value = condition.get("val")
+        if op in _LIST_OPERATORS or op in _RANGE_OPERATORS:
+            if not isinstance(value, (list, tuple)):
+                return f"operator {op} expects a list"
+            if op in _RANGE_OPERATORS and len(value) != 2:
+                return f"operator {op} expects two values"
+            values = value
+        elif op in _TEXT_OPERATORS:
+            return None
+        else:
+            values = [value]
+        for item in values:
+            message = _check_value(definition, item)
+            if message is not None:
+                return message
+        return None
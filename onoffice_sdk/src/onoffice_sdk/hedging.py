@@ -0,0 +1,133 @@
+"""
+Hedged reads: a second copy of a slow read races the first.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+class HedgePolicy:
+    """
+    Decides when a read is sent a second time.
+
+    If a read has not finished after ``delay`` seconds, the client sends an
+    identical copy and uses whichever answer arrives first. Without a fixed
+    ``delay`` the ``quantile`` of the latencies of recent reads is used, so
+    only the slowest few percent of reads are hedged. Writes are never
+    hedged, and at most ``max_ratio`` of all reads get a copy, so a slow
+    API is not sent twice the load.
+
+    The sync client runs hedged reads on at most ``max_workers`` threads.
+    Reads arriving while all of them are busy are sent on the calling
+    thread without a copy instead of waiting for a free thread.
+
+    Args:
+        delay (float, optional): Fixed hedge delay in seconds. Defaults to None (use the quantile)
+        quantile (float, optional): Latency quantile used as delay. Defaults to 0.95
+        min_samples (int, optional): Reads needed before hedging starts. Defaults to 20
+        window (int, optional): Number of recent latencies kept. Defaults to 500
+        min_delay (float, optional): Lower bound of the delay in seconds. Defaults to 0.01
+        max_workers (int, optional): Threads of the sync client running hedged reads. Defaults to 16
+        max_ratio (float, optional): Maximum share of reads that are hedged. Defaults to 0.1
+
+    Examples:
+        >>> hedge = HedgePolicy(quantile=0.95)
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", hedge=hedge)
+        >>> hedge.stats()
+        {'samples': 0, 'delay': None, 'hedged': 0, 'hedge_wins': 0}
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 500,
+        min_delay: float = 0.01,
+        max_workers: int = 16,
+        max_ratio: float = 0.1
+    ):
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+        self.fixed_delay = delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_workers = max_workers
+        self.max_ratio = max_ratio
+        self._latencies = deque(maxlen=window)
+        self._reads = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float) -> None:
+        """
+        Record the latency of a successful read.
+
+        Args:
+            latency (float): Seconds the read took
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._reads += 1
+
+    def delay(self) -> Optional[float]:
+        """
+        Get the time to wait before hedging a read.
+
+        Returns:
+            float: Seconds, or None while too few latencies are known
+        """
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, math.ceil(self.quantile * len(latencies)) - 1)
+        return max(self.min_delay, latencies[index])
+
+    def allow_hedge(self) -> bool:
+        """
+        Reserve a hedge if fewer than ``max_ratio`` of the reads were hedged.
+
+        Returns:
+            bool: True if a copy may be sent; the hedge is counted
+        """
+        with self._lock:
+            # One hedge is allowed before enough reads are counted
+            if not self.max_ratio or self._hedged >= max(1.0, self.max_ratio * self._reads):
+                return False
+            self._hedged += 1
+            return True
+
+    def record_hedge(self, won: bool) -> None:
+        """
+        Count the outcome of a hedged read.
+
+        Args:
+            won (bool): Whether the copy answered first
+        """
+        if won:
+            with self._lock:
+                self._hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            dict: Known latencies, current delay, hedged reads and reads won by the copy
+        """
+        delay = self.delay()
+        with self._lock:
+            return {
+                "samples": len(self._latencies),
+                "delay": delay,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+            }
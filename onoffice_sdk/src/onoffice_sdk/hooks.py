@@ -0,0 +1,278 @@
+"""
+Request lifecycle events, metrics and tracing.
+
+Hooks registered with ``client.add_hook`` are called with a ``RequestEvent``
+after every request. When no hook is registered the client skips all timing
+and bookkeeping.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+def action_name(action_id: str) -> str:
+    """Get the short name of an action URN, e.g. ``read``."""
+    return action_id.rsplit(':', 1)[-1]
+
+class RequestEvent:
+    """
+    Timings and outcome of one request.
+
+    Phase times are summed over all attempts of a retried request. A
+    batched request gets one event for all of its actions; a streamed
+    request is emitted once its records are consumed or the stream is
+    closed, so its duration includes the time spent by the consumer.
+
+    Attributes:
+        resource_type (str): Type of resource accessed, "batch" for a
+            batched request mixing several
+        action_id (str): ID of the action performed, "batch" for a batched
+            request mixing several
+        actions (int): Number of actions sent in the request
+        start_time (float): Unix time the request started
+        duration (float): Total time in seconds
+        phases (dict): Seconds per phase: sign, encode, rate_limit, network,
+            decode, status (error mapping) and backoff
+        request_bytes (int): Encoded request bytes sent, over all attempts
+        response_bytes (int): Response bytes received, over all attempts
+        http_status (int): HTTP status code of the last attempt
+        status_code (int): API status code of the last attempt
+        retries (int): Number of retries
+        cache (str): "hit", "miss" or "bypass" when the request was not cacheable
+        coalesced (bool): True if the result was shared from another in-flight request
+        error (Exception): Exception raised to the caller, if any
+    """
+
+    __slots__ = (
+        'resource_type', 'action_id', 'actions', 'start_time', 'duration', 'phases',
+        'request_bytes', 'response_bytes', 'http_status', 'status_code',
+        'retries', 'cache', 'coalesced', 'error', '_started'
+    )
+
+    def __init__(self, resource_type: str, action_id: str):
+        self.resource_type = resource_type
+        self.action_id = action_id
+        self.actions = 1
+        self.start_time = time.time()
+        self.duration = None
+        self.phases = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.http_status = None
+        self.status_code = None
+        self.retries = 0
+        self.cache = "bypass"
+        self.coalesced = False
+        self.error = None
+        self._started = time.perf_counter()
+
+    def lap(self, phase: str, since: float) -> float:
+        """
+        Add the time since ``since`` to a phase.
+
+        Args:
+            phase (str): Phase name
+            since (float): ``time.perf_counter()`` value at the start of the phase
+
+        Returns:
+            float: The current ``time.perf_counter()`` value
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - since
+        return now
+
+    def finish(self) -> None:
+        """Record the total duration."""
+        self.duration = time.perf_counter() - self._started
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.resource_type!r}, {action_name(self.action_id)!r}, "
+            f"duration={self.duration!r}, cache={self.cache!r}, retries={self.retries}, "
+            f"error={self.error!r})"
+        )
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, buckets: Tuple[float, ...], value: float) -> None:
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+def _labels(names: Tuple[str, ...], values: Tuple[Any, ...]) -> str:
+    pairs = ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in zip(names, values)
+    )
+    return '{' + pairs + '}' if pairs else ''
+
+class MetricsAggregator:
+    """
+    In-process aggregator of request events in the Prometheus data model.
+
+    Register it as a hook and expose ``render()`` on a metrics endpoint.
+
+    Args:
+        buckets (tuple, optional): Histogram bucket bounds in seconds
+        prefix (str, optional): Metric name prefix. Defaults to "onoffice"
+
+    Examples:
+        >>> metrics = MetricsAggregator()
+        >>> client.add_hook(metrics)
+        >>> print(metrics.render())
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "onoffice"):
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._requests = {}
+        self._cache = {}
+        self._request_bytes = {}
+        self._response_bytes = {}
+        self._retries = {}
+        self._durations = {}
+        self._phases = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        action = action_name(event.action_id)
+        key = (event.resource_type, action)
+        outcome = "ok" if event.error is None else type(event.error).__name__
+        with self._lock:
+            request_key = key + (outcome,)
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            cache_key = (event.resource_type, event.cache)
+            self._cache[cache_key] = self._cache.get(cache_key, 0) + 1
+            self._request_bytes[key] = self._request_bytes.get(key, 0) + event.request_bytes
+            self._response_bytes[key] = self._response_bytes.get(key, 0) + event.response_bytes
+            self._retries[key] = self._retries.get(key, 0) + event.retries
+            self._observe(self._durations, key, event.duration or 0.0)
+            for phase, seconds in event.phases.items():
+                self._observe(self._phases, key + (phase,), seconds)
+
+    def _observe(self, histograms: Dict[tuple, _Histogram], key: tuple, value: float) -> None:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = _Histogram(self.buckets)
+        histogram.observe(self.buckets, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the aggregated values.
+
+        Returns:
+            dict: Counters keyed by label tuples, and histogram count and sum per key
+        """
+        with self._lock:
+            return {
+                "requests": dict(self._requests),
+                "cache": dict(self._cache),
+                "request_bytes": dict(self._request_bytes),
+                "response_bytes": dict(self._response_bytes),
+                "retries": dict(self._retries),
+                "duration": {key: (h.count, h.sum) for key, h in self._durations.items()},
+                "phases": {key: (h.count, h.sum) for key, h in self._phases.items()},
+            }
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text
+        """
+        lines = []
+        base = ("resource_type", "action")
+
+        def counter(name, help_text, values, label_names):
+            lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {self.prefix}_{name} counter")
+            for key in sorted(values):
+                lines.append(f"{self.prefix}_{name}{_labels(label_names, key)} {values[key]}")
+
+        def histogram(name, help_text, values, label_names):
+            lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {self.prefix}_{name} histogram")
+            for key in sorted(values):
+                h = values[key]
+                for bound, count in zip(self.buckets, h.counts):
+                    labels = _labels(label_names + ("le",), key + (repr(float(bound)),))
+                    lines.append(f"{self.prefix}_{name}_bucket{labels} {count}")
+                labels = _labels(label_names + ("le",), key + ("+Inf",))
+                lines.append(f"{self.prefix}_{name}_bucket{labels} {h.count}")
+                lines.append(f"{self.prefix}_{name}_sum{_labels(label_names, key)} {h.sum!r}")
+                lines.append(f"{self.prefix}_{name}_count{_labels(label_names, key)} {h.count}")
+
+        with self._lock:
+            counter("requests_total", "Requests by outcome.", self._requests, base + ("outcome",))
+            counter("cache_total", "Cache outcomes of requests.", self._cache, ("resource_type", "outcome"))
+            counter("request_bytes_total", "Encoded request bytes sent.", self._request_bytes, base)
+            counter("response_bytes_total", "Response bytes received.", self._response_bytes, base)
+            counter("retries_total", "Retried attempts.", self._retries, base)
+            histogram("request_duration_seconds", "Total request time.", self._durations, base)
+            histogram("request_phase_seconds", "Time per request phase.", self._phases, base + ("phase",))
+        return '\n'.join(lines) + '\n'
+
+class TracingHook:
+    """
+    Hook recording one OpenTelemetry span per request.
+
+    The span covers the whole request and carries the resource type,
+    action, byte sizes, status codes, retry count, cache outcome and the
+    time of every phase as attributes.
+
+    Args:
+        tracer (opentelemetry.trace.Tracer, optional): Tracer to use.
+            Defaults to the global tracer provider's "onoffice_sdk" tracer
+
+    Examples:
+        >>> client.add_hook(TracingHook())
+    """
+
+    def __init__(self, tracer: Optional[Any] = None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "TracingHook requires opentelemetry-api. "
+                "Install it with: pip install onoffice-sdk[tracing]"
+            )
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("onoffice_sdk")
+
+    def __call__(self, event: RequestEvent) -> None:
+        start_ns = int(event.start_time * 1e9)
+        attributes = {
+            "onoffice.resource_type": event.resource_type,
+            "onoffice.action": action_name(event.action_id),
+            "onoffice.actions": event.actions,
+            "onoffice.request_bytes": event.request_bytes,
+            "onoffice.response_bytes": event.response_bytes,
+            "onoffice.retries": event.retries,
+            "onoffice.cache": event.cache,
+            "onoffice.coalesced": event.coalesced,
+        }
+        if event.http_status is not None:
+            attributes["http.status_code"] = event.http_status
+        if event.status_code is not None:
+            attributes["onoffice.status_code"] = event.status_code
+        for phase, seconds in event.phases.items():
+            attributes[f"onoffice.phase.{phase}_ms"] = seconds * 1000
+
+        span = self.tracer.start_span(
+            f"onoffice {event.resource_type} {action_name(event.action_id)}",
+            start_time=start_ns,
+            attributes=attributes
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=start_ns + int((event.duration or 0.0) * 1e9))
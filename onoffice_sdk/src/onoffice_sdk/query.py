@@ -0,0 +1,405 @@
+"""
+Local query engine answering searches from an in-memory columnar snapshot.
+
+Takes the ``filters``, ``sort_by``, ``fields``, ``limit`` and ``offset``
+arguments of ``search`` and returns a response shaped like the API's, so
+callers switch between remote and local reads with ``search(local=True)``.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+from .columnar import ColumnarRecords, _as_float
+from .exceptions import ValidationError
+
+ACTION_READ = 'urn:onoffice-de-ns:smart:2.5:smartml:action:read'
+
+_NEGATIONS = {
+    "!=": "=",
+    "<>": "=",
+    "NOT IN": "IN",
+    "NOT LIKE": "LIKE",
+    "NOT BETWEEN": "BETWEEN",
+}
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "LocalQueryEngine requires numpy. Install it with: pip install onoffice-sdk[local]"
+        )
+    return numpy
+
+def _like_pattern(pattern: Any) -> 're.Pattern':
+    """Translate an SQL LIKE pattern into a case-insensitive regular expression."""
+    parts = []
+    for char in str(pattern):
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
+
+class _Vector:
+    """
+    One field of a snapshot as NumPy arrays.
+
+    Numeric fields keep their values; string fields are dictionary-encoded
+    into ``codes`` over sorted ``categories``, so comparisons are computed
+    once per distinct value and gathered with the codes. Results carry the
+    original values of the column, so "250000.00" is not returned as 250000.0.
+    """
+
+    def __init__(self, np, column):
+        # Only columns whose originals differ from the typed values need the lookup
+        self.column = column if column.decimals is not None or column.exceptions else None
+        self.missing = np.frombuffer(column.missing, dtype=np.bool_).copy()
+        if column.kind == "int":
+            self.kind = "int"
+            self.values = np.frombuffer(column.values, dtype=np.int64).copy()
+        elif column.kind == "float":
+            self.kind = "float"
+            self.values = np.frombuffer(column.values, dtype=np.float64).copy()
+        else:
+            self.kind = "category"
+            if column.kind == "dictionary":
+                labels = np.array(column.categories + [""], dtype=object)
+                codes = np.frombuffer(column.values, dtype=np.int32)
+                strings = labels[codes]
+            else:
+                strings = np.array(["" if value is None else value for value in column.values], dtype=object)
+            self.categories, self.codes = np.unique(strings.astype(str), return_inverse=True)
+            self.categories = self.categories.astype(object)
+            self.codes = self.codes.reshape(-1)
+        self._sort_key = None
+
+    def value(self, row: int) -> Any:
+        if self.missing[row]:
+            return ""
+        if self.column is not None:
+            return self.column.source(row)
+        if self.kind == "category":
+            return self.categories[self.codes[row]]
+        if self.kind == "int":
+            return int(self.values[row])
+        return float(self.values[row])
+
+    def sort_key(self, np):
+        """Get a numeric array ordering the rows like the values."""
+        if self._sort_key is None:
+            if self.kind == "category":
+                # Categories come sorted from numpy.unique, so codes are ranks
+                key = self.codes.astype(np.int64)
+            else:
+                key = np.where(self.missing, 0, self.values)
+            self._sort_key = key
+        return self._sort_key
+
+    def _numbers(self, values: Iterable[Any]) -> List[float]:
+        numbers = []
+        for value in values:
+            number = _as_float(value)
+            if number is not None:
+                numbers.append(number)
+        return numbers
+
+    def mask(self, np, op: str, expected: Any):
+        """Evaluate one positive condition over all rows."""
+        if self.kind == "category":
+            return self._category_mask(np, op, expected)
+
+        present = ~self.missing
+        if op == "LIKE" or op == "REGEXP":
+            pattern = _like_pattern(expected) if op == "LIKE" else re.compile(str(expected), re.IGNORECASE)
+            test = pattern.fullmatch if op == "LIKE" else pattern.search
+            texts = [self.value(row) for row in range(len(self.missing))]
+            return np.fromiter((bool(test(str(text))) for text in texts), dtype=np.bool_, count=len(texts)) & present
+        if op == "IN":
+            values = list(expected or [])
+            hits = np.isin(self.values, self._numbers(values)) & present
+            if any(value in (None, "") for value in values):
+                hits |= self.missing
+            return hits
+        if op == "BETWEEN":
+            low, high = (_as_float(value) for value in expected)
+            if low is None or high is None:
+                return np.zeros(len(self.missing), dtype=np.bool_)
+            return (self.values >= low) & (self.values <= high) & present
+
+        number = _as_float(expected)
+        if number is None:
+            if op == "=" and expected in (None, ""):
+                return self.missing.copy()
+            return np.zeros(len(self.missing), dtype=np.bool_)
+        if op == "=":
+            return (self.values == number) & present
+        if op == "<":
+            return (self.values < number) & present
+        if op == "<=":
+            return (self.values <= number) & present
+        if op == ">":
+            return (self.values > number) & present
+        return (self.values >= number) & present
+
+    def _category_mask(self, np, op: str, expected: Any):
+        categories = self.categories
+        if op == "=":
+            hits = categories == str("" if expected is None else expected)
+        elif op == "IN":
+            hits = np.isin(categories, np.array(["" if value is None else str(value) for value in expected or []], dtype=object))
+        elif op == "LIKE":
+            match = _like_pattern(expected).fullmatch
+            hits = np.fromiter((bool(match(text)) for text in categories), dtype=np.bool_, count=len(categories))
+        elif op == "REGEXP":
+            search = re.compile(str(expected), re.IGNORECASE).search
+            hits = np.fromiter((bool(search(text)) for text in categories), dtype=np.bool_, count=len(categories))
+        elif op == "BETWEEN":
+            low, high = (str(value) for value in expected)
+            hits = (categories >= low) & (categories <= high)
+        elif op == "<":
+            hits = categories < str(expected)
+        elif op == "<=":
+            hits = categories <= str(expected)
+        elif op == ">":
+            hits = categories > str(expected)
+        else:
+            hits = categories >= str(expected)
+        hits = np.asarray(hits, dtype=np.bool_)
+        if op not in ("=", "IN"):
+            # Empty values only match equality with an empty string
+            hits = hits & (categories != "")
+        return hits[self.codes] if len(hits) else np.zeros(len(self.codes), dtype=np.bool_)
+
+class _Snapshot:
+    """Vectors of one resource type plus cached sort orders."""
+
+    def __init__(self, np, resource_type: str, records: ColumnarRecords):
+        self.resource_type = resource_type
+        self.size = len(records)
+        self.loaded_at = time.time()
+        self.ids = _Vector(np, records.ids)
+        self.vectors = {field: _Vector(np, column) for field, column in records.columns.items()}
+        self.vectors["Id"] = self.ids
+        # Rows in ID order, the order of unsorted results
+        self.base = np.lexsort((self.ids.sort_key(np), self.ids.missing))
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def order(self, np, field: str, descending: bool):
+        """Get all rows sorted by one field, computed once per field and direction."""
+        key = (field, descending)
+        order = self._orders.get(key)
+        if order is None:
+            vector = self.vectors[field]
+            values = vector.sort_key(np)[self.base]
+            missing = vector.missing[self.base]
+            if descending:
+                # Stable descending order with missing values first, like a reversed sort
+                order = self.base[np.lexsort((-values, ~missing))]
+            else:
+                order = self.base[np.lexsort((values, missing))]
+            with self._lock:
+                self._orders[key] = order
+        return order
+
+class LocalQueryEngine:
+    """
+    Answers searches from in-memory snapshots instead of the API.
+
+    Each snapshot is stored column by column in NumPy arrays. Filters are
+    evaluated as vectorised masks (string fields compare their distinct
+    values once and gather the result by code), and the sort order of each
+    field and direction is computed once and reused by later queries.
+    Results have the shape of an API read response, including
+    ``cntabsolute``.
+
+    Snapshots are replaced as a whole by ``load``, ``load_mirror`` or
+    ``refresh``; queries running at that moment finish on the old one.
+
+    Examples:
+        >>> engine = LocalQueryEngine()
+        >>> engine.refresh(client, "estate", fields=["Id", "kaufpreis", "status", "objektart"])
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", query_engine=engine)
+        >>> client.estate.search(
+        ...     filters={"status": [{"op": "=", "val": 1}], "kaufpreis": [{"op": "<", "val": 300000}]},
+        ...     sort_by={"kaufpreis": "ASC"},
+        ...     local=True
+        ... )
+    """
+
+    def __init__(self):
+        self._np = _numpy()
+        self._snapshots = {}
+
+    def load(
+        self,
+        resource_type: str,
+        records: Union[ColumnarRecords, Iterable[Dict[str, Any]]],
+        fields: Optional[List[str]] = None
+    ) -> None:
+        """
+        Replace the snapshot of a resource type.
+
+        Args:
+            resource_type (str): "estate" or "address"
+            records (ColumnarRecords or iterable): Records with ``id`` and ``elements``
+            fields (list, optional): Fields to keep. Defaults to all fields seen
+        """
+        if not isinstance(records, ColumnarRecords):
+            records = ColumnarRecords.from_records(records, fields=fields)
+        self._snapshots[resource_type] = _Snapshot(self._np, resource_type, records)
+
+    def load_mirror(self, engine, resource_types: Tuple[str, ...] = ("estate", "address")) -> None:
+        """
+        Take the snapshots from a ``SyncEngine`` mirror.
+
+        Args:
+            engine (SyncEngine): Local mirror
+            resource_types (tuple, optional): Resource types to load. Defaults to ("estate", "address")
+        """
+        for resource_type in resource_types:
+            self.load(resource_type, engine.iter_records(resource_type))
+
+    def refresh(self, client, resource_type: str, fields: List[str], **scan_options) -> None:
+        """
+        Read all records with ``scan`` and replace the snapshot.
+
+        Args:
+            client (OnOfficeClient): Client to read with
+            resource_type (str): "estate" or "address"
+            fields (list): Fields to keep
+            **scan_options: Passed to ``scan``, e.g. ``concurrency``
+        """
+        resource = getattr(client, resource_type)
+        self.load(resource_type, resource.scan(fields=fields, **scan_options), fields=fields)
+
+    def loaded(self, resource_type: str) -> bool:
+        """True if a snapshot of the resource type is loaded."""
+        return resource_type in self._snapshots
+
+    def _snapshot(self, resource_type: str) -> _Snapshot:
+        snapshot = self._snapshots.get(resource_type)
+        if snapshot is None:
+            raise RuntimeError(f"No local snapshot of {resource_type}; call load() or refresh() first")
+        return snapshot
+
+    def search(
+        self,
+        resource_type: str,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        fields: Optional[List[str]] = None,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a search against the snapshot of a resource type.
+
+        Args:
+            resource_type (str): "estate" or "address"
+            filters (dict, optional): Search filters in the API format
+            fields (list, optional): Fields to return. Defaults to all snapshot fields
+            limit (int, optional): Maximum number of results. Defaults to 100
+            offset (int, optional): Number of results to skip. Defaults to 0
+            sort_by (dict, optional): Sorting criteria
+
+        Returns:
+            dict: Response shaped like the API's read response
+
+        Raises:
+            RuntimeError: If no snapshot of the resource type is loaded
+            ValidationError: If a field or operator cannot be answered locally
+        """
+        np = self._np
+        snapshot = self._snapshot(resource_type)
+        fields = list(fields) if fields else [field for field in snapshot.vectors if field != "Id"]
+        self._check(snapshot, fields, filters, sort_by)
+
+        mask = None
+        for field, conditions in (filters or {}).items():
+            vector = snapshot.vectors[field]
+            for condition in conditions:
+                op = str(condition.get("op", "=")).upper()
+                op = "=" if op == "==" else op
+                positive = _NEGATIONS.get(op, op)
+                hits = vector.mask(np, positive, condition.get("val"))
+                if positive != op:
+                    hits = ~hits
+                mask = hits if mask is None else mask & hits
+
+        rows = self._sorted(snapshot, sort_by, mask)
+        page = rows[offset:offset + limit]
+
+        records = []
+        for row in page.tolist():
+            elements = {field: snapshot.vectors[field].value(row) for field in fields}
+            records.append({"id": snapshot.ids.value(row), "type": resource_type, "elements": elements})
+
+        return {
+            "status": {"code": 200, "errorcode": 0, "message": "OK"},
+            "response": {
+                "results": [{
+                    "actionid": ACTION_READ,
+                    "resourceid": "",
+                    "resourcetype": resource_type,
+                    "identifier": "",
+                    "data": {"meta": {"cntabsolute": len(rows)}, "records": records},
+                    "status": {"errorcode": 0, "message": "OK"}
+                }]
+            }
+        }
+
+    def _sorted(self, snapshot: _Snapshot, sort_by: Optional[Dict[str, str]], mask):
+        """Get the matching rows in result order."""
+        np = self._np
+        items = list((sort_by or {}).items())
+        if len(items) <= 1:
+            if items:
+                field, direction = items[0]
+                order = snapshot.order(np, field, str(direction).upper() == "DESC")
+            else:
+                order = snapshot.base
+            return order if mask is None else order[mask[order]]
+
+        rows = snapshot.base if mask is None else snapshot.base[mask[snapshot.base]]
+        keys = []
+        for field, direction in reversed(items):
+            vector = snapshot.vectors[field]
+            values = vector.sort_key(np)[rows]
+            missing = vector.missing[rows]
+            if str(direction).upper() == "DESC":
+                keys.extend([-values, ~missing])
+            else:
+                keys.extend([values, missing])
+        return rows[np.lexsort(keys)]
+
+    @staticmethod
+    def _check(snapshot: _Snapshot, fields, filters, sort_by) -> None:
+        errors = {}
+        for field in fields:
+            if field not in snapshot.vectors:
+                errors[field] = "not in the local snapshot"
+        for field, direction in (sort_by or {}).items():
+            if field not in snapshot.vectors:
+                errors[field] = "not in the local snapshot"
+            elif str(direction).upper() not in ("ASC", "DESC"):
+                errors[field] = f"invalid sort direction {direction!r}"
+        for field, conditions in (filters or {}).items():
+            if field not in snapshot.vectors:
+                errors[field] = "not in the local snapshot"
+                continue
+            for condition in conditions:
+                op = str(condition.get("op", "=")).upper()
+                value = condition.get("val")
+                if op not in ("=", "==", "<", "<=", ">", ">=", "IN", "LIKE", "BETWEEN", "REGEXP") and op not in _NEGATIONS:
+                    errors[field] = f"unknown operator {condition.get('op')!r}"
+                elif op in ("IN", "NOT IN", "BETWEEN", "NOT BETWEEN") and not isinstance(value, (list, tuple)):
+                    errors[field] = f"operator {op} expects a list"
+                elif op in ("BETWEEN", "NOT BETWEEN") and len(value) != 2:
+                    errors[field] = f"operator {op} expects two values"
+        if errors:
+            raise ValidationError(f"Invalid fields for {snapshot.resource_type}", errors=errors)
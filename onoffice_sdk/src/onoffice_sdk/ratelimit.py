@@ -0,0 +1,98 @@
+"""
+Client-side rate limiting.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+def reset_delay(reset_time: Optional[float], default: float = 1.0) -> float:
+    """
+    Convert the ``reset_time`` of a ``RateLimitError`` into seconds to wait.
+
+    Values that look like Unix timestamps are taken as absolute times,
+    smaller values as a number of seconds.
+
+    Args:
+        reset_time (float, optional): Value reported by the API
+        default (float, optional): Delay when no reset time was sent. Defaults to 1.0
+
+    Returns:
+        float: Seconds until the limit resets
+    """
+    if reset_time is None:
+        return default
+    try:
+        reset_time = float(reset_time)
+    except (TypeError, ValueError):
+        return default
+    if reset_time > 1e9:
+        return max(0.0, reset_time - time.time())
+    return max(0.0, reset_time)
+
+class RateLimiter:
+    """
+    Token bucket shared by all threads and tasks using a client.
+
+    Callers reserve a token and wait until it is due, so requests are
+    spread evenly instead of bursting. ``pause`` holds back every caller
+    until the server-side limit resets and then lets them through one at
+    a time at the configured rate.
+
+    Args:
+        rate (float): Requests per second
+        burst (float, optional): Bucket size. Defaults to ``max(1, rate)``
+
+    Examples:
+        >>> limiter = RateLimiter(rate=5)
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.waited = 0.0
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller has to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            delay = max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+            self.waited += delay
+            return delay
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait on the event loop until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all callers for a number of seconds.
+
+        Args:
+            seconds (float): Time until the server-side limit resets
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._updated:
+                self._updated = until
+                self._tokens = min(self._tokens, 1.0)
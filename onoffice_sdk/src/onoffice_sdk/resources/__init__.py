@@ -1,6 +1,11 @@
 """Resource handlers for different OnOffice API endpoints."""
 
-from .estate import EstateResource
-from .address import AddressResource
+from .estate import EstateResource, AsyncEstateResource
+from .address import AddressResource, AsyncAddressResource
 
-__all__ = ['EstateResource', 'AddressResource']
+__all__ = [
+    'EstateResource',
+    'AddressResource',
+    'AsyncEstateResource',
+    'AsyncAddressResource',
+]
@@ -3,14 +3,14 @@ Address resource handler for the OnOffice API.
 """
 
 from typing import Dict, List, Any, Optional
+from .base import BaseResource, AsyncResourceMixin
 
-class AddressResource:
+class AddressResource(BaseResource):
     """
     Handler for address-related API endpoints.
     """
     
-    def __init__(self, client):
-        self.client = client
+    resource_type = "address"
     
     def search(
         self,
@@ -18,7 +18,10 @@ class AddressResource:
         fields: Optional[List[str]] = None,
         limit: int = 100,
         offset: int = 0,
-        sort_by: Optional[Dict[str, str]] = None
+        sort_by: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        columnar: bool = False,
+        local: bool = False
     ) -> Dict[str, Any]:
         """
         Search for addresses with given filters.
@@ -29,11 +32,24 @@ class AddressResource:
             limit (int, optional): Maximum number of results. Defaults to 100
             offset (int, optional): Number of results to skip. Defaults to 0
             sort_by (dict, optional): Sorting criteria
+            stream (bool, optional): Parse the response incrementally and return
+                an iterator over its records instead of the response dict.
+                Not supported on ``AsyncOnOfficeClient``
+            columnar (bool, optional): Return the records as ``ColumnarRecords``
+            local (bool, optional): Answer from the snapshot of the client's
+                ``query_engine`` instead of the API
             
         Returns:
             dict: Search results
         """
-        fields = fields or ["Id", "Vorname", "Name", "Email"]
+        fields = fields or self._default_fields(["Id", "Vorname", "Name", "Email"])
+        self._validate(fields, filters, sort_by)
+        if local:
+            if stream:
+                raise ValueError("local cannot be combined with stream")
+            response = self._local_search(filters, fields, limit, offset, sort_by)
+            return self._to_columnar(response) if columnar else response
+        
         parameters = {
             "data": fields,
             "listlimit": limit,
@@ -46,11 +62,23 @@ class AddressResource:
         if sort_by:
             parameters["sortby"] = sort_by
         
-        return self.client._make_request(
+        if stream:
+            return self.client._stream_request(
+                resource_type="address",
+                action_id="urn:onoffice-de-ns:smart:2.5:smartml:action:read",
+                parameters=parameters
+            )
+        
+        response = self.client._make_request(
             resource_type="address",
             action_id="urn:onoffice-de-ns:smart:2.5:smartml:action:read",
             parameters=parameters
         )
+        
+        if columnar:
+            return self._to_columnar(response)
+        
+        return response
     
     def get(self, address_id: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -63,7 +91,8 @@ class AddressResource:
         Returns:
             dict: Address details
         """
-        fields = fields or ["Id", "Vorname", "Name", "Email"]
+        fields = fields or self._default_fields(["Id", "Vorname", "Name", "Email"])
+        self._validate(fields)
         parameters = {
             "data": fields,
             "filter": {
@@ -120,3 +149,10 @@ class AddressResource:
             action_id="urn:onoffice-de-ns:smart:2.5:smartml:action:modify",
             parameters=parameters
         )
+
+class AsyncAddressResource(AsyncResourceMixin, AddressResource):
+    """
+    Handler for address-related API endpoints on an ``AsyncOnOfficeClient``.
+    
+    Mirrors ``AddressResource``; every request method returns an awaitable.
+    """
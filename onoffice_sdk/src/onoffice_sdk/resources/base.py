@@ -0,0 +1,643 @@
+"""
+Shared behaviour for OnOffice API resource handlers.
+"""
+
+import asyncio
+import math
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+from ..utils import get_records, get_total_count
+
+def _prepare_get_many(ids, chunk_size):
+    """Deduplicate IDs and split them into chunks for ``get_many``."""
+    unique = list(dict.fromkeys(ids))
+    results = {record_id: None for record_id in unique}
+    chunks = [unique[start:start + chunk_size] for start in range(0, len(unique), chunk_size)]
+    return results, chunks
+
+def _collect_get_many(results, pages):
+    """Assign the records of all chunks to the requested IDs."""
+    lookup = {str(record_id): record_id for record_id in results}
+    for records in pages:
+        for record in records:
+            record_id = lookup.get(str(record.get("id")))
+            if record_id is not None:
+                results[record_id] = record
+    return results
+
+def _keyset_filters(
+    filters: Optional[Dict[str, List[Dict[str, Any]]]],
+    after: Optional[int],
+    start: Optional[int],
+    end: Optional[int]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Add ``Id > after`` (or ``Id >= start``) and ``Id < end`` to the user's filters."""
+    combined = dict(filters or {})
+    conditions = list(combined.get("Id", []))
+    if after is not None:
+        conditions.append({"op": ">", "val": after})
+    elif start is not None:
+        conditions.append({"op": ">=", "val": start})
+    if end is not None:
+        conditions.append({"op": "<", "val": end})
+    combined["Id"] = conditions
+    return combined
+
+class _RangePlanner:
+    """
+    Splits an ID space into ranges holding about ``range_records`` records each.
+
+    The density (records per ID) is measured on the first page of every range
+    and the width of the ranges planned afterwards follows the running estimate.
+    """
+    
+    def __init__(self, start: int, end: int, range_records: int):
+        self.next_start = start
+        self.end = end
+        self.range_records = range_records
+        self.records = 0
+        self.span = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, records: int, span: int) -> None:
+        """Record that ``records`` records were found in ``span`` IDs."""
+        with self._lock:
+            self.records += records
+            self.span += max(1, span)
+    
+    def next_range(self) -> Optional[Tuple[int, int]]:
+        """Get the next ``[start, end)`` range, or None once the ID space is covered."""
+        with self._lock:
+            if self.next_start >= self.end:
+                return None
+            # Empty ranges so far: double the span measured instead of dividing by zero
+            density = self.records / self.span if self.records else 1 / (2 * max(1, self.span))
+            width = max(1, int(math.ceil(self.range_records / density)))
+            start = self.next_start
+            self.next_start = min(self.end, start + width)
+            return start, self.next_start
+
+def _first_page_span(records: List[Dict[str, Any]], start: int, end: int, page_size: int) -> int:
+    """IDs covered by the first page of a range."""
+    if len(records) < page_size:
+        return end - start
+    return int(records[-1]["id"]) - start + 1
+
+class BaseResource:
+    """
+    Base class for resource handlers.
+    
+    Subclasses set ``resource_type`` and implement ``search``.
+    """
+    
+    resource_type = None
+    
+    def __init__(self, client):
+        self.client = client
+    
+    def _default_fields(self, fields: List[str]) -> List[str]:
+        """Get the default fields that exist in the account, if a field registry is set."""
+        registry = getattr(self.client, 'field_registry', None)
+        if registry is None:
+            return list(fields)
+        return registry.existing(self.resource_type, fields)
+    
+    def _validate(
+        self,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        sort_by: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Check a request against the field registry before sending it, if one is set."""
+        registry = getattr(self.client, 'field_registry', None)
+        if registry is not None:
+            registry.validate(self.resource_type, fields, filters, sort_by)
+    
+    def _local_search(
+        self,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]],
+        fields: List[str],
+        limit: int,
+        offset: int,
+        sort_by: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Answer a search from the client's local query engine."""
+        engine = getattr(self.client, 'query_engine', None)
+        if engine is None:
+            raise RuntimeError("search(local=True) requires a client with a query_engine")
+        return engine.search(self.resource_type, filters, fields, limit, offset, sort_by)
+    
+    def _to_columnar(self, response: Dict[str, Any]) -> 'ColumnarRecords':
+        """Convert a search response into ``ColumnarRecords``."""
+        from ..columnar import ColumnarRecords
+        return ColumnarRecords.from_records(
+            get_records(response),
+            total=get_total_count(response)
+        )
+    
+    def iter_search(
+        self,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        sort_by: Optional[Dict[str, str]] = None,
+        concurrency: int = 1,
+        stream: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all search results, one record at a time.
+        
+        Pages are requested lazily, so only one page is held in memory.
+        With ``concurrency`` above 1 the total count is read from the first
+        page and the remaining pages are fetched on a thread pool sharing
+        the client's transport, with at most ``concurrency`` pages in flight.
+        Records are still yielded in order. With ``stream`` each page is
+        parsed incrementally, so only one record is held in memory.
+        
+        Args:
+            filters (dict, optional): Search filters
+            fields (list, optional): Fields to return
+            page_size (int, optional): Records per request. Defaults to 100
+            offset (int, optional): Number of results to skip. Defaults to 0
+            sort_by (dict, optional): Sorting criteria
+            concurrency (int, optional): Pages fetched in parallel. Defaults to 1
+            stream (bool, optional): Parse pages incrementally. Defaults to False
+            
+        Yields:
+            dict: Single records from ``data.records``
+            
+        Examples:
+            >>> for estate in client.estate.iter_search(page_size=500, concurrency=4):
+            ...     print(estate["id"])
+        """
+        if stream:
+            if concurrency > 1:
+                raise ValueError("stream cannot be combined with concurrency")
+            yield from self._iter_streamed(filters, fields, page_size, offset, sort_by)
+            return
+        
+        def fetch(page_offset):
+            response = self.search(
+                filters=filters,
+                fields=fields,
+                limit=page_size,
+                offset=page_offset,
+                sort_by=sort_by
+            )
+            return get_records(response), get_total_count(response)
+        
+        records, total = fetch(offset)
+        start = offset
+        offset += len(records)
+        yield from records
+        
+        if len(records) < page_size or (total is not None and offset >= total):
+            return
+        
+        if concurrency > 1 and total is not None:
+            yield from self._iter_prefetched(fetch, offset, start + total, page_size, concurrency)
+            return
+        
+        while True:
+            records, total = fetch(offset)
+            offset += len(records)
+            yield from records
+            
+            if len(records) < page_size or (total is not None and offset >= total):
+                return
+    
+    def _scan_bounds(self, filters, fields, page_size):
+        """Get the first page in ID order and the highest matching ID."""
+        last = get_records(self.search(
+            filters=filters,
+            fields=["Id"],
+            limit=1,
+            sort_by={"Id": "DESC"}
+        ))
+        if not last:
+            return [], None
+        max_id = int(last[0]["id"])
+        return self._scan_page(filters, fields, page_size, None, None, max_id + 1), max_id
+    
+    def _scan_page(self, filters, fields, page_size, after, start, end):
+        return get_records(self.search(
+            filters=_keyset_filters(filters, after, start, end),
+            fields=fields,
+            limit=page_size,
+            sort_by={"Id": "ASC"}
+        ))
+    
+    def scan(
+        self,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 500,
+        concurrency: int = 4,
+        range_pages: int = 4
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all matching records in ID order using keyset paging.
+        
+        Instead of ``listoffset``, every page asks for the records after the
+        last ID seen (``Id > last``), so page latency does not grow with the
+        position and records do not shift between pages while the scan runs.
+        The IDs up to the highest ID at the start of the scan are split into
+        ranges (``Id >= a`` and ``Id < b``) sized from the density of the
+        pages read so far, and up to ``concurrency`` ranges are read in
+        parallel. Records are yielded in ID order.
+        
+        Args:
+            filters (dict, optional): Search filters
+            fields (list, optional): Fields to return
+            page_size (int, optional): Records per request. Defaults to 500
+            concurrency (int, optional): Ranges read in parallel. Defaults to 4
+            range_pages (int, optional): Target number of pages per range. Defaults to 4
+            
+        Yields:
+            dict: Single records from ``data.records``
+            
+        Examples:
+            >>> for estate in client.estate.scan(fields=["Id", "kaufpreis"], concurrency=8):
+            ...     print(estate["id"])
+        """
+        first_page, max_id = self._scan_bounds(filters, fields, page_size)
+        yield from first_page
+        if len(first_page) < page_size:
+            return
+        
+        min_id = int(first_page[0]["id"])
+        last_id = int(first_page[-1]["id"])
+        planner = _RangePlanner(last_id + 1, max_id + 1, page_size * range_pages)
+        planner.observe(len(first_page), last_id - min_id + 1)
+        
+        if concurrency <= 1:
+            after = last_id
+            while True:
+                records = self._scan_page(filters, fields, page_size, after, None, max_id + 1)
+                yield from records
+                if len(records) < page_size:
+                    return
+                after = int(records[-1]["id"])
+        
+        stop = threading.Event()
+        
+        def read_range(start, end, pages):
+            try:
+                after = None
+                while not stop.is_set():
+                    records = self._scan_page(filters, fields, page_size, after, start, end)
+                    if after is None:
+                        planner.observe(len(records), _first_page_span(records, start, end, page_size))
+                    pages.put(records)
+                    if len(records) < page_size:
+                        break
+                    after = int(records[-1]["id"])
+                pages.put(None)
+            except Exception as e:
+                pages.put(e)
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            ranges = deque()
+            
+            def schedule():
+                while len(ranges) < concurrency:
+                    bounds = planner.next_range()
+                    if bounds is None:
+                        return
+                    pages = queue.Queue(maxsize=2)
+                    executor.submit(read_range, bounds[0], bounds[1], pages)
+                    ranges.append(pages)
+            
+            try:
+                schedule()
+                while ranges:
+                    page = ranges[0].get()
+                    if page is None:
+                        ranges.popleft()
+                        schedule()
+                        continue
+                    if isinstance(page, Exception):
+                        raise page
+                    yield from page
+            finally:
+                stop.set()
+                # Unblock readers waiting on a full queue
+                for pages in ranges:
+                    while not pages.empty():
+                        pages.get_nowait()
+    
+    def get_many(
+        self,
+        ids: Iterable[Any],
+        fields: Optional[List[str]] = None,
+        chunk_size: int = 500,
+        concurrency: int = 4
+    ) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """
+        Get many records by ID with as few requests as possible.
+        
+        IDs are deduplicated and sent in chunks as ``Id IN [...]`` filters,
+        with up to ``concurrency`` chunks in flight.
+        
+        Args:
+            ids (iterable): Record IDs
+            fields (list, optional): Fields to return
+            chunk_size (int, optional): IDs per request, at most the API list limit. Defaults to 500
+            concurrency (int, optional): Chunks fetched in parallel. Defaults to 4
+            
+        Returns:
+            dict: Records keyed by the requested IDs; IDs that were not found map to None
+            
+        Examples:
+            >>> estates = client.estate.get_many([1, 2, 3], fields=["Id", "kaufpreis"])
+            >>> missing = [i for i, record in estates.items() if record is None]
+        """
+        results, chunks = _prepare_get_many(ids, chunk_size)
+        
+        def fetch(chunk):
+            return get_records(self.search(
+                filters={"Id": [{"op": "IN", "val": chunk}]},
+                fields=fields,
+                limit=len(chunk)
+            ))
+        
+        if len(chunks) <= 1 or concurrency <= 1:
+            return _collect_get_many(results, map(fetch, chunks))
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            return _collect_get_many(results, executor.map(fetch, chunks))
+    
+    def _iter_streamed(self, filters, fields, page_size, offset, sort_by):
+        """Page through the results, parsing each page incrementally."""
+        while True:
+            count = 0
+            for record in self.search(
+                filters=filters,
+                fields=fields,
+                limit=page_size,
+                offset=offset,
+                sort_by=sort_by,
+                stream=True
+            ):
+                count += 1
+                yield record
+            
+            offset += count
+            if count < page_size:
+                return
+    
+    def _iter_prefetched(self, fetch, offset, end, page_size, concurrency):
+        """Fetch the pages between ``offset`` and ``end`` concurrently, in order."""
+        offsets = iter(range(offset, end, page_size))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight = deque()
+            try:
+                for page_offset in offsets:
+                    in_flight.append(executor.submit(fetch, page_offset))
+                    if len(in_flight) >= concurrency:
+                        break
+                
+                while in_flight:
+                    records, _ = in_flight.popleft().result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        in_flight.append(executor.submit(fetch, next_offset))
+                    yield from records
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+class AsyncResourceMixin:
+    """
+    Async variants of the ``BaseResource`` helpers.
+    
+    Mixed into resource handlers bound to an ``AsyncOnOfficeClient``, whose
+    ``_make_request`` is a coroutine. The plain request methods then return
+    awaitables; helpers that inspect responses are overridden here.
+    
+    Streamed parsing (``search(stream=True)``) is only available on
+    ``OnOfficeClient``; async resources read whole pages instead.
+    """
+    
+    def search(self, *args, stream: bool = False, **kwargs):
+        if stream:
+            raise ValueError(
+                "stream is not supported on AsyncOnOfficeClient; use iter_search() or OnOfficeClient"
+            )
+        return super().search(*args, **kwargs)
+    
+    async def _local_search(self, filters, fields, limit, offset, sort_by):
+        return super()._local_search(filters, fields, limit, offset, sort_by)
+    
+    async def _to_columnar(self, response):
+        return super()._to_columnar(await response)
+    
+    async def iter_search(
+        self,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        offset: int = 0,
+        sort_by: Optional[Dict[str, str]] = None,
+        concurrency: int = 1
+    ):
+        """
+        Iterate over all search results, one record at a time.
+        
+        Async counterpart of ``BaseResource.iter_search``; with
+        ``concurrency`` above 1 the remaining pages are fetched as
+        concurrent tasks on the running event loop.
+        
+        Args:
+            filters (dict, optional): Search filters
+            fields (list, optional): Fields to return
+            page_size (int, optional): Records per request. Defaults to 100
+            offset (int, optional): Number of results to skip. Defaults to 0
+            sort_by (dict, optional): Sorting criteria
+            concurrency (int, optional): Pages fetched in parallel. Defaults to 1
+            
+        Yields:
+            dict: Single records from ``data.records``
+            
+        Examples:
+            >>> async for estate in client.estate.iter_search(page_size=500):
+            ...     print(estate["id"])
+        """
+        async def fetch(page_offset):
+            response = await self.search(
+                filters=filters,
+                fields=fields,
+                limit=page_size,
+                offset=page_offset,
+                sort_by=sort_by
+            )
+            return get_records(response), get_total_count(response)
+        
+        records, total = await fetch(offset)
+        start = offset
+        offset += len(records)
+        for record in records:
+            yield record
+        
+        if len(records) < page_size or (total is not None and offset >= total):
+            return
+        
+        if concurrency > 1 and total is not None:
+            offsets = iter(range(offset, start + total, page_size))
+            in_flight = deque(
+                asyncio.ensure_future(fetch(page_offset))
+                for _, page_offset in zip(range(concurrency), offsets)
+            )
+            try:
+                while in_flight:
+                    records, _ = await in_flight.popleft()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        in_flight.append(asyncio.ensure_future(fetch(next_offset)))
+                    for record in records:
+                        yield record
+            finally:
+                for task in in_flight:
+                    task.cancel()
+            return
+        
+        while True:
+            records, total = await fetch(offset)
+            offset += len(records)
+            for record in records:
+                yield record
+            
+            if len(records) < page_size or (total is not None and offset >= total):
+                return
+
+    async def get_many(
+        self,
+        ids: Iterable[Any],
+        fields: Optional[List[str]] = None,
+        chunk_size: int = 500,
+        concurrency: int = 4
+    ) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """
+        Get many records by ID with as few requests as possible.
+        
+        Async counterpart of ``BaseResource.get_many``.
+        
+        Args:
+            ids (iterable): Record IDs
+            fields (list, optional): Fields to return
+            chunk_size (int, optional): IDs per request, at most the API list limit. Defaults to 500
+            concurrency (int, optional): Chunks fetched in parallel. Defaults to 4
+            
+        Returns:
+            dict: Records keyed by the requested IDs; IDs that were not found map to None
+        """
+        results, chunks = _prepare_get_many(ids, chunk_size)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch(chunk):
+            async with semaphore:
+                return get_records(await self.search(
+                    filters={"Id": [{"op": "IN", "val": chunk}]},
+                    fields=fields,
+                    limit=len(chunk)
+                ))
+        
+        pages = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return _collect_get_many(results, pages)
+    
+    async def scan(
+        self,
+        filters: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 500,
+        concurrency: int = 4,
+        range_pages: int = 4
+    ):
+        """
+        Iterate over all matching records in ID order using keyset paging.
+        
+        Async counterpart of ``BaseResource.scan``; ranges are read as
+        concurrent tasks on the running event loop.
+        
+        Args:
+            filters (dict, optional): Search filters
+            fields (list, optional): Fields to return
+            page_size (int, optional): Records per request. Defaults to 500
+            concurrency (int, optional): Ranges read in parallel. Defaults to 4
+            range_pages (int, optional): Target number of pages per range. Defaults to 4
+            
+        Yields:
+            dict: Single records from ``data.records``
+        """
+        async def read_page(after, start, end):
+            return get_records(await self.search(
+                filters=_keyset_filters(filters, after, start, end),
+                fields=fields,
+                limit=page_size,
+                sort_by={"Id": "ASC"}
+            ))
+        
+        last = get_records(await self.search(
+            filters=filters,
+            fields=["Id"],
+            limit=1,
+            sort_by={"Id": "DESC"}
+        ))
+        if not last:
+            return
+        max_id = int(last[0]["id"])
+        first_page = await read_page(None, None, max_id + 1)
+        for record in first_page:
+            yield record
+        if len(first_page) < page_size:
+            return
+        
+        min_id = int(first_page[0]["id"])
+        last_id = int(first_page[-1]["id"])
+        planner = _RangePlanner(last_id + 1, max_id + 1, page_size * range_pages)
+        planner.observe(len(first_page), last_id - min_id + 1)
+        
+        async def read_range(start, end, pages):
+            try:
+                after = None
+                while True:
+                    records = await read_page(after, start, end)
+                    if after is None:
+                        planner.observe(len(records), _first_page_span(records, start, end, page_size))
+                    await pages.put(records)
+                    if len(records) < page_size:
+                        break
+                    after = int(records[-1]["id"])
+                await pages.put(None)
+            except Exception as e:
+                await pages.put(e)
+        
+        ranges = deque()
+        
+        def schedule():
+            while len(ranges) < max(1, concurrency):
+                bounds = planner.next_range()
+                if bounds is None:
+                    return
+                pages = asyncio.Queue(maxsize=2)
+                ranges.append((pages, asyncio.ensure_future(read_range(bounds[0], bounds[1], pages))))
+        
+        try:
+            schedule()
+            while ranges:
+                page = await ranges[0][0].get()
+                if page is None:
+                    ranges.popleft()
+                    schedule()
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                for record in page:
+                    yield record
+        finally:
+            for _, task in ranges:
+                task.cancel()
@@ -2,15 +2,87 @@
 Estate resource handler for the OnOffice API.
 """
 
+import json
 from typing import Dict, List, Any, Optional
+from .base import BaseResource, AsyncResourceMixin
+from ..utils import get_records
 
-class EstateResource:
+RELATION_TYPES = {
+    "contacts": "urn:onoffice-de-ns:smart:2.5:relationTypes:estate:address:contactPerson",
+    "owners": "urn:onoffice-de-ns:smart:2.5:relationTypes:estate:address:owner",
+    "buyers": "urn:onoffice-de-ns:smart:2.5:relationTypes:estate:address:buyer",
+    "tenants": "urn:onoffice-de-ns:smart:2.5:relationTypes:estate:address:tenant",
+}
+
+def _pack_elements(
+    elements: List[Dict[str, Any]],
+    max_elements: int,
+    max_bytes: Optional[int]
+) -> List[List[int]]:
+    """Group element indices so each group stays within the element and size limits."""
+    groups = []
+    group = []
+    group_bytes = 0
+    for index, element in enumerate(elements):
+        size = len(json.dumps(element, default=str)) if max_bytes is not None else 0
+        if group and (
+            len(group) >= max_elements
+            or (max_bytes is not None and group_bytes + size > max_bytes)
+        ):
+            groups.append(group)
+            group = []
+            group_bytes = 0
+        group.append(index)
+        group_bytes += size
+    if group:
+        groups.append(group)
+    return groups
+
+def _relation_type(name: str) -> str:
+    """Get the relation type URN for an ``include`` key."""
+    if name.startswith("urn:"):
+        return name
+    try:
+        return RELATION_TYPES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown relation {name!r}; use one of {sorted(RELATION_TYPES)} or a relation type URN"
+        )
+
+def _relation_ids(response: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Map each estate ID to its linked address IDs from an ``idsfromrelation`` response."""
+    children = {}
+    for record in get_records(response):
+        for parent_id, child_ids in (record.get("elements") or {}).items():
+            if not isinstance(child_ids, list):
+                child_ids = [child_ids]
+            children.setdefault(str(parent_id), []).extend(
+                int(child_id) if str(child_id).isdigit() else child_id
+                for child_id in child_ids
+            )
+    return children
+
+def _linked_ids(children: Dict[str, List[Any]]) -> List[Any]:
+    """Get the linked address IDs of a page without duplicates."""
+    return list(dict.fromkeys(child_id for child_ids in children.values() for child_id in child_ids))
+
+def _attach_related(
+    records: List[Dict[str, Any]],
+    name: str,
+    children: Dict[str, List[Any]],
+    addresses: Dict[Any, Optional[Dict[str, Any]]]
+) -> None:
+    """Add the linked address records to each estate under ``relations[name]``."""
+    for record in records:
+        linked = [addresses.get(child_id) for child_id in children.get(str(record.get("id")), [])]
+        record.setdefault("relations", {})[name] = [address for address in linked if address is not None]
+
+class EstateResource(BaseResource):
     """
     Handler for estate-related API endpoints.
     """
     
-    def __init__(self, client):
-        self.client = client
+    resource_type = "estate"
     
     def search(
         self,
@@ -18,17 +90,37 @@ class EstateResource:
         fields: Optional[List[str]] = None,
         limit: int = 100,
         offset: int = 0,
-        sort_by: Optional[Dict[str, str]] = None
+        sort_by: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        columnar: bool = False,
+        include: Optional[Dict[str, Optional[List[str]]]] = None,
+        local: bool = False
     ) -> Dict[str, Any]:
         """
         Search for estates with given filters.
         
+        With ``include``, the addresses linked to the estates of the page are
+        attached to each record under ``relations``. Every relation costs one
+        ``idsfromrelation`` request for the whole page plus chunked
+        ``Id IN`` reads of the deduplicated addresses, instead of one read
+        per estate.
+        
         Args:
             filters (dict, optional): Search filters
-            fields (list, optional): Fields to return. Defaults to ["Id", "kaufpreis", "lage"]
+            fields (list, optional): Fields to return. Defaults to those of
+                ["Id", "kaufpreis", "lage"] that exist in the account
             limit (int, optional): Maximum number of results. Defaults to 100
             offset (int, optional): Number of results to skip. Defaults to 0
             sort_by (dict, optional): Sorting criteria. Example: {"kaufpreis": "ASC"}
+            stream (bool, optional): Parse the response incrementally and return
+                an iterator over its records instead of the response dict.
+                Not supported on ``AsyncOnOfficeClient``
+            columnar (bool, optional): Return the records as ``ColumnarRecords``
+            include (dict, optional): Address fields per relation to attach, keyed by
+                "contacts", "owners", "buyers", "tenants" or a relation type URN.
+                Cannot be combined with ``stream`` or ``columnar``
+            local (bool, optional): Answer from the snapshot of the client's
+                ``query_engine`` instead of the API
         
         Returns:
             dict: Search results
@@ -39,8 +131,23 @@ class EstateResource:
             ...     fields=["Id", "kaufpreis", "lage"],
             ...     sort_by={"kaufpreis": "ASC"}
             ... )
+            >>> response = client.estate.search(include={"contacts": ["Vorname", "Name", "Email"]})
+            >>> get_records(response)[0]["relations"]["contacts"]
         """
-        fields = fields or ["Id", "kaufpreis", "lage"]
+        if include and (stream or columnar):
+            raise ValueError("include cannot be combined with stream or columnar")
+        fields = fields or self._default_fields(["Id", "kaufpreis", "lage"])
+        self._validate(fields, filters, sort_by)
+        if local:
+            if stream:
+                raise ValueError("local cannot be combined with stream")
+            response = self._local_search(filters, fields, limit, offset, sort_by)
+            if columnar:
+                return self._to_columnar(response)
+            if include:
+                self._include(get_records(response), include)
+            return response
+        
         parameters = {
             "data": fields,
             "listlimit": limit,
@@ -53,11 +160,45 @@ class EstateResource:
         if sort_by:
             parameters["sortby"] = sort_by
         
-        return self.client._make_request(
+        if stream:
+            return self.client._stream_request(
+                resource_type="estate",
+                action_id=self.client.ACTION_READ,
+                parameters=parameters
+            )
+        
+        response = self.client._make_request(
             resource_type="estate",
             action_id=self.client.ACTION_READ,
             parameters=parameters
         )
+        
+        if columnar:
+            return self._to_columnar(response)
+        
+        if include:
+            self._include(get_records(response), include)
+        
+        return response
+
+    def _relation_parameters(self, name: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "parentids": [record.get("id") for record in records],
+            "relationtype": _relation_type(name),
+        }
+
+    def _include(self, records: List[Dict[str, Any]], include: Dict[str, Optional[List[str]]]) -> None:
+        """Attach the linked addresses of every relation in ``include`` to ``records``."""
+        for name, fields in include.items():
+            children = {}
+            if records:
+                children = _relation_ids(self.client._make_request(
+                    resource_type="idsfromrelation",
+                    action_id=self.client.ACTION_GET,
+                    parameters=self._relation_parameters(name, records)
+                ))
+            addresses = self.client.address.get_many(_linked_ids(children), fields=fields)
+            _attach_related(records, name, children, addresses)
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -136,6 +277,149 @@ class EstateResource:
             }
         )
 
+    def _bulk(
+        self,
+        action_id: str,
+        elements: List[Dict[str, Any]],
+        elements_per_action: int,
+        actions_per_request: int,
+        max_payload_bytes: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Send elements in multi-element actions and report the outcome per element."""
+        groups = _pack_elements(elements, elements_per_action, max_payload_bytes)
+        
+        with self.client.batch(
+            max_actions=actions_per_request,
+            max_payload_bytes=max_payload_bytes
+        ) as batch:
+            items = []
+            for group in groups:
+                if action_id == self.client.ACTION_CREATE:
+                    parameters = {"data": elements[group[0]]}
+                else:
+                    parameters = {"data": {"elements": [elements[index] for index in group]}}
+                items.append(batch._make_request(
+                    resource_type=self.resource_type,
+                    action_id=action_id,
+                    parameters=parameters
+                ))
+        
+        results = []
+        for group, item in zip(groups, items):
+            error = item.exception()
+            for index in group:
+                results.append({
+                    "index": index,
+                    "id": elements[index].get("id"),
+                    "success": error is None,
+                    "result": item.result() if error is None else None,
+                    "error": error
+                })
+        results.sort(key=lambda result: result["index"])
+        return results
+    
+    def bulk_create(
+        self,
+        records: List[Dict[str, Any]],
+        actions_per_request: int = 50,
+        max_payload_bytes: Optional[int] = 1000000
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many estates with few requests.
+        
+        The create action takes one record, so each estate gets its own
+        action and up to ``actions_per_request`` actions share a request.
+        
+        Args:
+            records (list): Estate data to create
+            actions_per_request (int, optional): Actions per request. Defaults to 50
+            max_payload_bytes (int, optional): Maximum encoded size per request. Defaults to 1000000
+            
+        Returns:
+            list: Per record dicts with ``index``, ``id``, ``success``, ``result`` and ``error``
+            
+        Examples:
+            >>> results = client.estate.bulk_create([
+            ...     {"objektart": "haus", "kaufpreis": 250000},
+            ...     {"objektart": "wohnung", "kaufpreis": 180000}
+            ... ])
+            >>> failed = [r for r in results if not r["success"]]
+        """
+        return self._bulk(
+            self.client.ACTION_CREATE,
+            list(records),
+            elements_per_action=1,
+            actions_per_request=actions_per_request,
+            max_payload_bytes=max_payload_bytes
+        )
+    
+    def bulk_update(
+        self,
+        changes: List[Dict[str, Any]],
+        elements_per_action: int = 100,
+        actions_per_request: int = 50,
+        max_payload_bytes: Optional[int] = 1000000
+    ) -> List[Dict[str, Any]]:
+        """
+        Update many estates with few requests.
+        
+        Changes are packed into multi-element modify actions, and several
+        actions share a request. If an action fails, all of its elements
+        are reported as failed.
+        
+        Args:
+            changes (list): Dicts with the estate ``id`` and the fields to change
+            elements_per_action (int, optional): Elements per action. Defaults to 100
+            actions_per_request (int, optional): Actions per request. Defaults to 50
+            max_payload_bytes (int, optional): Maximum encoded size per request. Defaults to 1000000
+            
+        Returns:
+            list: Per element dicts with ``index``, ``id``, ``success``, ``result`` and ``error``
+            
+        Examples:
+            >>> client.estate.bulk_update([
+            ...     {"id": 123, "kaufpreis": 260000},
+            ...     {"id": 124, "kaufpreis": 199000}
+            ... ])
+        """
+        return self._bulk(
+            self.client.ACTION_MODIFY,
+            list(changes),
+            elements_per_action=elements_per_action,
+            actions_per_request=actions_per_request,
+            max_payload_bytes=max_payload_bytes
+        )
+    
+    def bulk_delete(
+        self,
+        estate_ids: List[int],
+        elements_per_action: int = 100,
+        actions_per_request: int = 50,
+        max_payload_bytes: Optional[int] = 1000000
+    ) -> List[Dict[str, Any]]:
+        """
+        Delete many estates with few requests.
+        
+        Args:
+            estate_ids (list): IDs of the estates to delete
+            elements_per_action (int, optional): Elements per action. Defaults to 100
+            actions_per_request (int, optional): Actions per request. Defaults to 50
+            max_payload_bytes (int, optional): Maximum encoded size per request. Defaults to 1000000
+            
+        Returns:
+            list: Per element dicts with ``index``, ``id``, ``success``, ``result`` and ``error``
+            
+        Examples:
+            >>> client.estate.bulk_delete([123, 124, 125])
+        """
+        return self._bulk(
+            self.client.ACTION_DELETE,
+            [{"id": estate_id} for estate_id in estate_ids],
+            elements_per_action=elements_per_action,
+            actions_per_request=actions_per_request,
+            max_payload_bytes=max_payload_bytes
+        )
+
     def get(self, estate_id: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get a single estate by ID.
@@ -150,7 +434,8 @@ class EstateResource:
         Examples:
             >>> client.estate.get(123, fields=["kaufpreis", "lage"])
         """
-        fields = fields or ["Id", "kaufpreis", "lage"]
+        fields = fields or self._default_fields(["Id", "kaufpreis", "lage"])
+        self._validate(fields)
         return self.client._make_request(
             resource_type="estate",
             action_id=self.client.ACTION_READ,
@@ -164,3 +449,41 @@ class EstateResource:
                 }
             }
         )
+
+class AsyncEstateResource(AsyncResourceMixin, EstateResource):
+    """
+    Handler for estate-related API endpoints on an ``AsyncOnOfficeClient``.
+    
+    Mirrors ``EstateResource``; every request method returns an awaitable.
+    Bulk writes need a ``Batch``, which only ``OnOfficeClient`` provides.
+    """
+    
+    def _bulk(self, *args, **kwargs):
+        raise ValueError("bulk writes are not supported on AsyncOnOfficeClient; use OnOfficeClient")
+    
+    def search(self, *args, include: Optional[Dict[str, Optional[List[str]]]] = None, **kwargs):
+        """
+        Search for estates with given filters.
+        
+        Async counterpart of ``EstateResource.search``.
+        """
+        if not include:
+            return super().search(*args, **kwargs)
+        return self._search_including(include, *args, **kwargs)
+    
+    async def _search_including(self, include, *args, **kwargs):
+        if kwargs.get("stream") or kwargs.get("columnar"):
+            raise ValueError("include cannot be combined with stream or columnar")
+        response = await EstateResource.search(self, *args, **kwargs)
+        records = get_records(response)
+        for name, fields in include.items():
+            children = {}
+            if records:
+                children = _relation_ids(await self.client._make_request(
+                    resource_type="idsfromrelation",
+                    action_id=self.client.ACTION_GET,
+                    parameters=self._relation_parameters(name, records)
+                ))
+            addresses = await self.client.address.get_many(_linked_ids(children), fields=fields)
+            _attach_related(records, name, children, addresses)
+        return response
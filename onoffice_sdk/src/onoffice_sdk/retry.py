@@ -0,0 +1,165 @@
+"""
+Retry policy with exponential backoff and full jitter.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from .exceptions import AuthenticationError, RateLimitError, ValidationError, OnOfficeAPIError
+from .ratelimit import reset_delay
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Read and get actions are retried automatically. Create, modify and
+    delete actions are only retried with ``retry_writes=True``, since the
+    first attempt may already have been applied.
+
+    Args:
+        max_attempts (int, optional): Attempts per call, including the first. Defaults to 3
+        backoff_base (float, optional): Backoff before the first retry in seconds. Defaults to 0.5
+        backoff_cap (float, optional): Upper bound for a single backoff. Defaults to 30
+        deadline (float, optional): Time budget per call in seconds. Defaults to None
+        retry_writes (bool, optional): Also retry write actions. Defaults to False
+        retry_status_codes (tuple, optional): HTTP and API status codes to retry
+
+    Examples:
+        >>> retry = RetryPolicy(max_attempts=5, backoff_cap=10, deadline=60)
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", retry=retry)
+        >>> retry.stats()
+        {'calls': 0, 'attempts': 0, 'retries': 0, 'gave_up': 0, 'backoff_seconds': 0.0}
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        deadline: Optional[float] = None,
+        retry_writes: bool = False,
+        retry_status_codes: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.deadline = deadline
+        self.retry_writes = retry_writes
+        self.retry_status_codes = retry_status_codes
+
+        self._counters = {
+            "calls": 0,
+            "attempts": 0,
+            "retries": 0,
+            "gave_up": 0,
+            "backoff_seconds": 0.0,
+        }
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, value=1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get a full-jitter backoff for a retry.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 1
+
+        Returns:
+            float: Random delay between 0 and the capped exponential backoff
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether an error is transient.
+
+        Args:
+            error (Exception): Error raised by a request
+
+        Returns:
+            bool: True for connection errors, timeouts, rate limits and 5xx responses
+        """
+        if isinstance(error, RateLimitError):
+            return True
+        if isinstance(error, (AuthenticationError, ValidationError)):
+            return False
+        if not isinstance(error, OnOfficeAPIError):
+            return False
+
+        cause = error.__cause__
+        if cause is not None:
+            status = getattr(getattr(cause, 'response', None), 'status_code', None)
+            return status is None or status in self.retry_status_codes
+
+        if isinstance(error.response, dict):
+            return error.response.get('status', {}).get('code') in self.retry_status_codes
+        return False
+
+    def start(self) -> float:
+        """
+        Record the start of a call.
+
+        Returns:
+            float: Start time to pass to ``next_delay``
+        """
+        self._count("calls")
+        self._count("attempts")
+        return time.monotonic()
+
+    def next_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        started: float,
+        idempotent: bool,
+        rate_limited: bool = False
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            error (Exception): Error of the failed attempt
+            attempt (int): Number of the failed attempt, starting at 1
+            started (float): Result of ``start``
+            idempotent (bool): Whether the action is a read
+            rate_limited (bool, optional): Whether a rate limiter already waits
+                for ``reset_time``
+
+        Returns:
+            float: Seconds to wait before the next attempt, or None to give up
+        """
+        if not (idempotent or self.retry_writes) or not self.is_retryable(error):
+            return None
+
+        delay = self.backoff(attempt)
+        if isinstance(error, RateLimitError) and not rate_limited:
+            delay = max(delay, reset_delay(error.reset_time, default=0.0))
+
+        out_of_time = (
+            self.deadline is not None
+            and time.monotonic() - started + delay >= self.deadline
+        )
+        if attempt >= self.max_attempts or out_of_time:
+            self._count("gave_up")
+            return None
+
+        self._count("retries")
+        self._count("attempts")
+        self._count("backoff_seconds", delay)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry counters.
+
+        Returns:
+            dict: Calls, attempts, retries, calls that gave up and total backoff time
+        """
+        with self._lock:
+            return dict(self._counters)
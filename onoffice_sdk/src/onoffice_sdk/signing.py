@@ -0,0 +1,59 @@
+"""
+HMAC2 request signing.
+"""
+
+import base64
+import hashlib
+import hmac
+import threading
+
+class SigningContext:
+    """
+    Pre-keyed HMAC2 signer.
+
+    The secret is hashed into an HMAC state once; each signature copies that
+    state instead of building a new HMAC object. Signatures are cached per
+    (timestamp, resource type, action), and the cache is dropped whenever
+    the timestamp moves on, so it never holds more than one second's worth.
+
+    Args:
+        token (str): Your OnOffice API token
+        secret (str): Your OnOffice API secret
+    """
+
+    def __init__(self, token: str, secret: str):
+        self.token = token
+        self.secret = secret
+        self._keyed = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        self._timestamp = None
+        self._signatures = {}
+        self._lock = threading.Lock()
+
+    def sign(self, timestamp: int, resource_type: str, action_id: str) -> str:
+        """
+        Create the HMAC2 signature of an action.
+
+        Args:
+            timestamp (int): Unix timestamp of the action
+            resource_type (str): Type of resource being accessed
+            action_id (str): ID of the action being performed
+
+        Returns:
+            str: Base64 encoded HMAC signature
+        """
+        key = (timestamp, resource_type, action_id)
+        signature = self._signatures.get(key)
+        if signature is not None:
+            return signature
+
+        message = f"{timestamp}{self.token}{resource_type}{action_id}"
+        mac = self._keyed.copy()
+        mac.update(message.encode('utf-8'))
+        signature = base64.b64encode(mac.digest()).decode('utf-8')
+
+        with self._lock:
+            if timestamp != self._timestamp:
+                self._signatures = {}
+                self._timestamp = timestamp
+            self._signatures[key] = signature
+        return signature
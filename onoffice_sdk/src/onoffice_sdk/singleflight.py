@@ -0,0 +1,162 @@
+"""
+Coalescing of identical in-flight reads.
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class _Call:
+    """State of one in-flight call shared by its waiters."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class _AsyncCall:
+    """Future of one in-flight coroutine call and the number of tasks waiting for it."""
+
+    def __init__(self, future: 'asyncio.Future'):
+        self.future = future
+        self.waiters = 0
+
+class _LeaderCancelled(Exception):
+    """Set on the shared future when the task sending the request was cancelled."""
+
+class SingleFlight:
+    """
+    Lets concurrent callers with the same key share one request.
+
+    The first caller for a key sends the request; callers arriving while it
+    is in flight wait for it and receive a copy of its result, or the same
+    exception. The first caller gets the result itself; the copies are taken
+    from a snapshot made before it is returned, so changes the first caller
+    makes to its result are not seen by the others. Works for threads
+    (``do``) and asyncio tasks (``do_async``); if the task sending the
+    request is cancelled, one of the waiting tasks sends it again.
+
+    Examples:
+        >>> single_flight = SingleFlight()
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", single_flight=single_flight)
+        >>> single_flight.stats()
+        {'calls': 0, 'coalesced': 0, 'in_flight': 0}
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+
+        self._calls = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key (hashable): Canonical request key
+            fn (callable): Function sending the request
+
+        Returns:
+            Result of ``fn``, shared with concurrent callers
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        result = None
+        try:
+            result = fn()
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.error is None and call.waiters:
+                # Snapshot before the caller can modify its result
+                call.result = copy.deepcopy(result)
+            call.event.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless a call with the same key is already in flight.
+
+        Args:
+            key (hashable): Canonical request key
+            fn (callable): Coroutine function sending the request
+
+        Returns:
+            Result of ``fn()``, shared with concurrent tasks
+        """
+        loop = asyncio.get_event_loop()
+        future_key = (id(loop), key)
+
+        with self._lock:
+            self.calls += 1
+            call = self._futures.get(future_key)
+            leader = call is None
+            if leader:
+                call = self._futures[future_key] = _AsyncCall(loop.create_future())
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            try:
+                result = await asyncio.shield(call.future)
+            except _LeaderCancelled:
+                # Send the request again; the first task to get here leads it
+                with self._lock:
+                    self.calls -= 1
+                    self.coalesced -= 1
+                return await self.do_async(key, fn)
+            return copy.deepcopy(result)
+
+        future = call.future
+        try:
+            result = await fn()
+        except BaseException as e:
+            with self._lock:
+                del self._futures[future_key]
+            # Waiting tasks must not be cancelled along with this one
+            future.set_exception(_LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        with self._lock:
+            del self._futures[future_key]
+        # Snapshot before the caller can modify its result
+        future.set_result(copy.deepcopy(result) if call.waiters else result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            dict: Total calls, calls that shared another call's request and calls in flight
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._futures),
+            }
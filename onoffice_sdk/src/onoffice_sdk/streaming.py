@@ -0,0 +1,177 @@
+"""
+Incremental parsing of large API responses.
+
+Reads the response body chunk by chunk and yields the records of
+``response.results[*].data.records`` one at a time, so memory scales with
+the largest record rather than with the whole page.
+"""
+
+import codecs
+import json
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional
+
+_WHITESPACE = ' \t\n\r'
+
+class StreamingParser:
+    """
+    Pull parser for the OnOffice response envelope.
+
+    Values outside the records path are parsed one at a time and dropped.
+    The top-level and per-action status blocks are passed to the given
+    callbacks as soon as they are read, which for the usual key order is
+    before the first record is yielded.
+
+    Args:
+        chunks (iterable): Raw response body in byte chunks
+        check_status (callable, optional): Called with the top-level ``status`` block
+        check_action_status (callable, optional): Called with each result's ``status`` block
+        compact_size (int, optional): Consumed characters kept before the buffer is trimmed
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        check_status: Optional[Callable[[Dict[str, Any]], None]] = None,
+        check_action_status: Optional[Callable[[Dict[str, Any]], None]] = None,
+        compact_size: int = 65536
+    ):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._compact_size = compact_size
+        self._check_status = check_status
+        self._check_action_status = check_action_status
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at the end of the body."""
+        if self._eof:
+            return False
+        if self._pos > self._compact_size:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._decoder.decode(b'', final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos}, found {found!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Parse one complete JSON value, reading more of the body as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._grow():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and self._buf[self._pos] in '-0123456789' and self._grow():
+                continue
+            self._pos = end
+            return value
+
+    def _grow(self) -> bool:
+        """Read until the unconsumed part of the buffer has doubled."""
+        target = max(1, len(self._buf) - self._pos)
+        start = len(self._buf) - self._pos
+        while len(self._buf) - self._pos - start < target:
+            if not self._fill():
+                return len(self._buf) - self._pos > start
+        return True
+
+    def _keys(self) -> Iterator[str]:
+        """Iterate over the keys of an object; the caller consumes each value."""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            yield key
+            if self._peek() == ',':
+                self._pos += 1
+                continue
+            self._expect('}')
+            return
+
+    def _items(self) -> Iterator[None]:
+        """Iterate over the items of an array; the caller consumes each item."""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield None
+            if self._peek() == ',':
+                self._pos += 1
+                continue
+            self._expect(']')
+            return
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the records of all action results.
+
+        Yields:
+            dict: Single records from ``response.results[*].data.records``
+        """
+        for key in self._keys():
+            if key == 'status':
+                status = self._value()
+                if self._check_status is not None:
+                    self._check_status(status)
+            elif key == 'response' and self._peek() == '{':
+                yield from self._response()
+            else:
+                self._value()
+
+    def _response(self) -> Iterator[Dict[str, Any]]:
+        for key in self._keys():
+            if key == 'results' and self._peek() == '[':
+                for _ in self._items():
+                    yield from self._result()
+            else:
+                self._value()
+
+    def _result(self) -> Iterator[Dict[str, Any]]:
+        if self._peek() != '{':
+            self._value()
+            return
+        for key in self._keys():
+            if key == 'status':
+                status = self._value()
+                if self._check_action_status is not None:
+                    self._check_action_status(status)
+            elif key == 'data' and self._peek() == '{':
+                for data_key in self._keys():
+                    if data_key == 'records' and self._peek() == '[':
+                        for _ in self._items():
+                            yield self._value()
+                    else:
+                        self._value()
+            else:
+                self._value()
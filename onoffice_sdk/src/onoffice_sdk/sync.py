@@ -0,0 +1,345 @@
+"""
+Incremental sync of estates and addresses into a local SQLite mirror.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+
+from .utils import get_records
+
+class SyncEngine:
+    """
+    Keeps a local SQLite mirror of OnOffice records up to date.
+
+    Each resource type has a high-water mark on its last-modified field.
+    A sync run only reads records modified since that mark, sorted by the
+    field and ``Id``, and upserts them page by page. Pages continue after
+    the last (modified, Id) pair read instead of at an offset, so a record
+    edited during the run moves to the end instead of shifting the records
+    not read yet past the next page. The mark is stored in the same
+    transaction as each page, so an interrupted run resumes where it
+    stopped.
+
+    Args:
+        client (OnOfficeClient): Client used to read the records
+        database (str, optional): Path of the SQLite file. Defaults to ":memory:"
+        fields (dict, optional): Fields to mirror per resource type
+        modified_fields (dict, optional): Last-modified field per resource type.
+            Defaults to "geaendert_am" for estates and addresses
+        page_size (int, optional): Records per request and transaction. Defaults to 500
+        verify_interval (float, optional): Seconds between automatic ``verify``
+            runs during ``sync``. Defaults to None (never)
+
+    Examples:
+        >>> engine = SyncEngine(client, "mirror.db", verify_interval=86400)
+        >>> engine.sync("estate")
+        {'resource_type': 'estate', 'upserted': 42, 'high_water_mark': '2024-05-01 10:12:00'}
+        >>> engine.get("estate", 123)
+    """
+
+    DEFAULT_FIELDS = {
+        "estate": ["Id", "kaufpreis", "lage"],
+        "address": ["Id", "Vorname", "Name", "Email"],
+    }
+    DEFAULT_MODIFIED_FIELDS = {
+        "estate": "geaendert_am",
+        "address": "geaendert_am",
+    }
+
+    def __init__(
+        self,
+        client,
+        database: str = ":memory:",
+        fields: Optional[Dict[str, List[str]]] = None,
+        modified_fields: Optional[Dict[str, str]] = None,
+        page_size: int = 500,
+        verify_interval: Optional[float] = None
+    ):
+        self.client = client
+        self.fields = dict(self.DEFAULT_FIELDS, **(fields or {}))
+        self.modified_fields = dict(self.DEFAULT_MODIFIED_FIELDS, **(modified_fields or {}))
+        self.page_size = page_size
+        self.verify_interval = verify_interval
+
+        self.connection = sqlite3.connect(database)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                resource_type TEXT NOT NULL,
+                id TEXT NOT NULL,
+                modified TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (resource_type, id)
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                resource_type TEXT PRIMARY KEY,
+                high_water_mark TEXT,
+                last_sync REAL,
+                last_verify REAL
+            );
+        """)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        self.connection.close()
+
+    def _resource(self, resource_type: str):
+        return getattr(self.client, resource_type)
+
+    def _state(self, resource_type: str) -> Dict[str, Any]:
+        row = self.connection.execute(
+            "SELECT high_water_mark, last_sync, last_verify FROM sync_state WHERE resource_type = ?",
+            (resource_type,)
+        ).fetchone()
+        if row is None:
+            return {"high_water_mark": None, "last_sync": None, "last_verify": None}
+        return {"high_water_mark": row[0], "last_sync": row[1], "last_verify": row[2]}
+
+    def high_water_mark(self, resource_type: str) -> Optional[str]:
+        """
+        Get the last-modified value up to which a resource type is mirrored.
+
+        Args:
+            resource_type (str): "estate" or "address"
+
+        Returns:
+            str: High-water mark, or None before the first sync
+        """
+        return self._state(resource_type)["high_water_mark"]
+
+    def _write_page(
+        self,
+        resource_type: str,
+        records: List[Dict[str, Any]],
+        high_water_mark: Optional[str]
+    ) -> Optional[str]:
+        """Upsert one page and advance the high-water mark in one transaction."""
+        modified_field = self.modified_fields[resource_type]
+        rows = []
+        for record in records:
+            elements = record.get("elements", {})
+            modified = elements.get(modified_field)
+            if modified is not None and (high_water_mark is None or str(modified) > high_water_mark):
+                high_water_mark = str(modified)
+            rows.append((resource_type, str(record["id"]), modified, json.dumps(elements)))
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO records (resource_type, id, modified, data) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self.connection.execute(
+                "INSERT INTO sync_state (resource_type, high_water_mark, last_sync) VALUES (?, ?, ?) "
+                "ON CONFLICT(resource_type) DO UPDATE SET "
+                "high_water_mark = excluded.high_water_mark, last_sync = excluded.last_sync",
+                (resource_type, high_water_mark, time.time())
+            )
+        return high_water_mark
+
+    def _upsert(
+        self,
+        resource_type: str,
+        records: Iterable[Dict[str, Any]],
+        high_water_mark: Optional[str]
+    ) -> Dict[str, Any]:
+        upserted = 0
+        page = []
+        for record in records:
+            page.append(record)
+            if len(page) >= self.page_size:
+                high_water_mark = self._write_page(resource_type, page, high_water_mark)
+                upserted += len(page)
+                page = []
+        if page:
+            high_water_mark = self._write_page(resource_type, page, high_water_mark)
+            upserted += len(page)
+        return {"upserted": upserted, "high_water_mark": high_water_mark}
+
+    def sync(self, resource_type: str, full: bool = False) -> Dict[str, Any]:
+        """
+        Mirror records changed since the last run.
+
+        Records with a last-modified value equal to the high-water mark are
+        read again, so changes within the same second are not lost.
+
+        Args:
+            resource_type (str): "estate" or "address"
+            full (bool, optional): Ignore the high-water mark and read everything
+
+        Returns:
+            dict: Resource type, number of upserted records and new high-water mark
+        """
+        modified_field = self.modified_fields[resource_type]
+        high_water_mark = None if full else self.high_water_mark(resource_type)
+
+        fields = list(self.fields[resource_type])
+        if modified_field not in fields:
+            fields.append(modified_field)
+
+        records = self._iter_changes(resource_type, fields, high_water_mark)
+        result = self._upsert(resource_type, records, high_water_mark)
+        result["resource_type"] = resource_type
+
+        last_verify = self._state(resource_type)["last_verify"]
+        if self.verify_interval is not None and (
+            last_verify is None or time.time() - last_verify >= self.verify_interval
+        ):
+            result["verify"] = self.verify(resource_type, repair=True)
+
+        return result
+
+    def _iter_changes(
+        self,
+        resource_type: str,
+        fields: List[str],
+        high_water_mark: Optional[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield records modified at or after the mark in (modified, Id) order, paging by key."""
+        resource = self._resource(resource_type)
+        modified_field = self.modified_fields[resource_type]
+        mark, after = high_water_mark, None
+
+        def page(filters, sort_by):
+            return get_records(resource.search(
+                filters=filters,
+                fields=fields,
+                limit=self.page_size,
+                sort_by=sort_by
+            ))
+
+        while True:
+            if mark is not None:
+                # The rest of the records at the mark, then the ones after it
+                filters = {modified_field: [{"op": "=", "val": mark}]}
+                if after is not None:
+                    filters["Id"] = [{"op": ">", "val": after}]
+                records = page(filters, {"Id": "ASC"})
+                yield from records
+                if len(records) >= self.page_size:
+                    after = int(records[-1]["id"])
+                    continue
+
+            filters = None if mark is None else {modified_field: [{"op": ">", "val": mark}]}
+            records = page(filters, {modified_field: "ASC", "Id": "ASC"})
+            yield from records
+            if len(records) < self.page_size:
+                return
+            mark = str(records[-1].get("elements", {}).get(modified_field))
+            after = int(records[-1]["id"])
+
+    def sync_all(self) -> List[Dict[str, Any]]:
+        """
+        Mirror changes of all configured resource types.
+
+        Returns:
+            list: Result of ``sync`` per resource type
+        """
+        return [self.sync(resource_type) for resource_type in self.modified_fields]
+
+    def verify(self, resource_type: str, repair: bool = False) -> Dict[str, List[str]]:
+        """
+        Compare the mirrored IDs with the IDs known to the API.
+
+        Args:
+            resource_type (str): "estate" or "address"
+            repair (bool, optional): Delete extra records and fetch missing ones
+
+        Returns:
+            dict: Sorted lists of ``missing`` and ``extra`` IDs
+        """
+        remote_ids = {
+            str(record["id"])
+            for record in self._resource(resource_type).iter_search(
+                fields=["Id"],
+                page_size=self.page_size,
+                sort_by={"Id": "ASC"}
+            )
+        }
+        local_ids = {
+            row[0] for row in self.connection.execute(
+                "SELECT id FROM records WHERE resource_type = ?", (resource_type,)
+            )
+        }
+        missing = sorted(remote_ids - local_ids)
+        extra = sorted(local_ids - remote_ids)
+
+        if repair:
+            with self.connection:
+                self.connection.executemany(
+                    "DELETE FROM records WHERE resource_type = ? AND id = ?",
+                    [(resource_type, record_id) for record_id in extra]
+                )
+            self._fetch_ids(resource_type, missing)
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO sync_state (resource_type, last_verify) VALUES (?, ?) "
+                "ON CONFLICT(resource_type) DO UPDATE SET last_verify = excluded.last_verify",
+                (resource_type, time.time())
+            )
+
+        return {"missing": missing, "extra": extra}
+
+    def _fetch_ids(self, resource_type: str, ids: List[str]) -> None:
+        """Mirror specific records without moving the high-water mark."""
+        modified_field = self.modified_fields[resource_type]
+        fields = list(self.fields[resource_type])
+        if modified_field not in fields:
+            fields.append(modified_field)
+
+        for start in range(0, len(ids), self.page_size):
+            chunk = [int(i) if i.isdigit() else i for i in ids[start:start + self.page_size]]
+            records = self._resource(resource_type).iter_search(
+                filters={"Id": [{"op": "IN", "val": chunk}]},
+                fields=fields,
+                page_size=self.page_size
+            )
+            rows = [
+                (
+                    resource_type,
+                    str(record["id"]),
+                    record.get("elements", {}).get(modified_field),
+                    json.dumps(record.get("elements", {}))
+                )
+                for record in records
+            ]
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO records (resource_type, id, modified, data) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+
+    def get(self, resource_type: str, record_id) -> Optional[Dict[str, Any]]:
+        """
+        Get a mirrored record.
+
+        Args:
+            resource_type (str): "estate" or "address"
+            record_id: Record ID
+
+        Returns:
+            dict: Mirrored fields of the record, or None
+        """
+        row = self.connection.execute(
+            "SELECT data FROM records WHERE resource_type = ? AND id = ?",
+            (resource_type, str(record_id))
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_records(self, resource_type: str) -> Iterable[Dict[str, Any]]:
+        """
+        Iterate over all mirrored records of a resource type.
+
+        Args:
+            resource_type (str): "estate" or "address"
+
+        Yields:
+            dict: Records shaped like API records, with ``id`` and ``elements``
+        """
+        cursor = self.connection.execute(
+            "SELECT id, data FROM records WHERE resource_type = ? ORDER BY id",
+            (resource_type,)
+        )
+        for record_id, data in cursor:
+            yield {"id": record_id, "type": resource_type, "elements": json.loads(data)}
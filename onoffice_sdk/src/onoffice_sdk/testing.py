@@ -0,0 +1,513 @@
+"""
+Local stand-in for the OnOffice API.
+
+``FakeOnOfficeServer`` verifies HMAC2 signatures and serves estates and
+addresses from seed fixtures. It answers requests in memory through
+``transport()`` or over HTTP on localhost through ``serve()``, and can add
+latency, rate limit responses and server errors.
+"""
+
+import base64
+import bisect
+import hashlib
+import hmac
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
+from .transport import InMemoryTransport
+
+ACTION_READ = 'urn:onoffice-de-ns:smart:2.5:smartml:action:read'
+ACTION_CREATE = 'urn:onoffice-de-ns:smart:2.5:smartml:action:create'
+ACTION_MODIFY = 'urn:onoffice-de-ns:smart:2.5:smartml:action:modify'
+ACTION_DELETE = 'urn:onoffice-de-ns:smart:2.5:smartml:action:delete'
+ACTION_GET = 'urn:onoffice-de-ns:smart:2.5:smartml:action:get'
+
+_LOCATIONS = ["Berlin", "Hamburg", "München", "Köln", "Frankfurt", "Leipzig", "Dresden", "Bremen"]
+_ESTATE_TYPES = ["haus", "wohnung", "grundstueck", "buero_praxen"]
+_FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Eva", "Felix", "Greta", "Hannes"]
+_LAST_NAMES = ["Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker"]
+
+def generate_estates(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate estate fixtures with IDs 1 to ``count``.
+
+    Args:
+        count (int): Number of estates
+        seed (int, optional): Random seed. Defaults to 0
+
+    Returns:
+        list: Estate elements, each including ``Id``
+    """
+    rng = random.Random(seed)
+    estates = []
+    for estate_id in range(1, count + 1):
+        estates.append({
+            "Id": estate_id,
+            "objektart": rng.choice(_ESTATE_TYPES),
+            "kaufpreis": rng.randrange(80000, 1500000, 500),
+            "wohnflaeche": rng.randrange(30, 400),
+            "lage": rng.choice(_LOCATIONS),
+            "status": rng.choice([0, 1, 1, 1]),
+            "geaendert_am": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00",
+        })
+    return estates
+
+def generate_addresses(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate address fixtures with IDs 1 to ``count``.
+
+    Args:
+        count (int): Number of addresses
+        seed (int, optional): Random seed. Defaults to 0
+
+    Returns:
+        list: Address elements, each including ``Id``
+    """
+    rng = random.Random(seed)
+    addresses = []
+    for address_id in range(1, count + 1):
+        first_name = rng.choice(_FIRST_NAMES)
+        last_name = rng.choice(_LAST_NAMES)
+        addresses.append({
+            "Id": address_id,
+            "Vorname": first_name,
+            "Name": last_name,
+            "Email": f"{first_name}.{last_name}.{address_id}@example.com".lower(),
+            "Ort": rng.choice(_LOCATIONS),
+            "geaendert_am": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 12:00:00",
+        })
+    return addresses
+
+def _field_type(name: str, values: List[Any]) -> Dict[str, Any]:
+    """Derive a field definition from the fixture values of a field."""
+    if name == "objektart":
+        return {"type": "singleselect", "permittedvalues": {value: value for value in _ESTATE_TYPES}}
+    present = [value for value in values if value is not None and value != ""]
+    if present and all(isinstance(value, bool) for value in present):
+        return {"type": "boolean"}
+    if present and all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+        return {"type": "integer"}
+    if present and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        return {"type": "float"}
+    if present and all(isinstance(value, str) and len(value) >= 10 and value[4] == "-" and value[7] == "-" for value in present):
+        return {"type": "datetime"}
+    return {"type": "varchar"}
+
+def _comparable(value: Any) -> Any:
+    """Compare numeric strings as numbers, like the API does for numeric fields."""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+def _matches(value: Any, condition: Dict[str, Any]) -> bool:
+    op = condition.get("op", "=").upper()
+    expected = condition.get("val")
+    if op in ("IN", "NOT IN"):
+        found = _comparable(value) in [_comparable(item) for item in expected]
+        return found if op == "IN" else not found
+    if op == "BETWEEN":
+        low, high = (_comparable(item) for item in expected)
+        value = _comparable(value)
+        return value is not None and low <= value <= high
+    if op == "LIKE":
+        pattern = str(expected).replace("%", "")
+        return pattern.lower() in str(value).lower()
+
+    value = _comparable(value)
+    expected = _comparable(expected)
+    try:
+        if op in ("=", "=="):
+            return value == expected
+        if op in ("!=", "<>"):
+            return value != expected
+        if value is None:
+            return False
+        if op == ">":
+            return value > expected
+        if op == ">=":
+            return value >= expected
+        if op == "<":
+            return value < expected
+        if op == "<=":
+            return value <= expected
+    except TypeError:
+        return str(value) < str(expected) if op in ("<", "<=") else str(value) > str(expected)
+    raise ValueError(f"Unsupported filter operator: {op}")
+
+class _ActionError(Exception):
+    def __init__(self, errorcode: int, message: str):
+        super().__init__(message)
+        self.errorcode = errorcode
+        self.message = message
+
+class FakeOnOfficeServer:
+    """
+    In-process stand-in for the OnOffice API.
+
+    Supports read, create, modify and delete on the ``estate`` and
+    ``address`` resource types, with the filter operators used by the SDK,
+    ``sortby``, ``listlimit`` and ``listoffset``, and get on the ``fields``
+    and ``idsfromrelation`` resource types. Requests with a wrong token or signature get a 401
+    response.
+
+    Args:
+        token (str): Expected API token
+        secret (str): Secret used to verify signatures
+        estates (list, optional): Estate elements, each with an ``Id``
+        addresses (list, optional): Address elements, each with an ``Id``
+        fields (dict, optional): Field definitions per module served by the
+            ``fields`` resource. Defaults to definitions derived from the fixtures
+        relations (dict, optional): Child IDs per parent ID, keyed by relation
+            type, served by the ``idsfromrelation`` resource
+        latency (float or callable, optional): Seconds added to every request,
+            or a function returning them. Defaults to 0
+        rate_limit_rate (float, optional): Share of requests answered with a
+            429 status. Defaults to 0
+        error_rate (float, optional): Share of requests answered with an HTTP
+            500 error. Defaults to 0
+        max_clock_skew (int, optional): Maximum age in seconds of an action
+            timestamp. Defaults to None (not checked)
+        seed (int, optional): Seed for latency and error injection. Defaults to 0
+
+    Examples:
+        >>> server = FakeOnOfficeServer("token", "secret", estates=generate_estates(1000))
+        >>> client = OnOfficeClient(token="token", secret="secret", transport=server.transport())
+        >>> with server.serve() as base_url:
+        ...     client = OnOfficeClient(token="token", secret="secret", base_url=base_url)
+    """
+
+    def __init__(
+        self,
+        token: str,
+        secret: str,
+        estates: Optional[List[Dict[str, Any]]] = None,
+        addresses: Optional[List[Dict[str, Any]]] = None,
+        fields: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+        relations: Optional[Dict[str, Dict[Any, List[Any]]]] = None,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        max_clock_skew: Optional[int] = None,
+        seed: int = 0
+    ):
+        self.token = token
+        self.secret = secret
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.max_clock_skew = max_clock_skew
+        self.records = {
+            "estate": {element["Id"]: dict(element) for element in estates or []},
+            "address": {element["Id"]: dict(element) for element in addresses or []},
+        }
+        if fields is None:
+            fields = {}
+            for module, store in self.records.items():
+                names = {}
+                for elements in store.values():
+                    for name, value in elements.items():
+                        names.setdefault(name, []).append(value)
+                fields[module] = {name: _field_type(name, values) for name, values in names.items()}
+        self.fields = fields
+        self.relations = relations or {}
+        self._sorted_ids = {}
+        self.requests = 0
+        self.actions = 0
+        self._failures = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def fail_next(self, code: int = 500, count: int = 1, message: str = "Injected error") -> None:
+        """
+        Answer the next requests with an error.
+
+        Args:
+            code (int, optional): 429 for a rate limit, 401 for an
+                authentication error, anything else is sent as an HTTP error.
+                Defaults to 500
+            count (int, optional): Number of requests to fail. Defaults to 1
+            message (str, optional): Error message
+        """
+        with self._lock:
+            self._failures.extend([(code, message)] * count)
+
+    def _sign(self, timestamp: Any, resource_type: str, action_id: str) -> str:
+        message = ''.join([str(timestamp), self.token, resource_type, action_id])
+        digest = hmac.new(self.secret.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).digest()
+        return base64.b64encode(digest).decode('utf-8')
+
+    def _error(self, code: int, message: str) -> Tuple[int, Dict[str, Any]]:
+        status = {"code": code, "errorcode": code, "message": message}
+        if code == 429:
+            status["reset_time"] = int(time.time()) + 1
+            return 200, {"status": status}
+        if code in (400, 401):
+            return 200, {"status": status}
+        return code, {"status": status}
+
+    def handle(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Answer one decoded request.
+
+        Args:
+            request (dict): Request envelope with ``token`` and ``request.actions``
+
+        Returns:
+            tuple: HTTP status code and response body
+        """
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+
+        with self._lock:
+            self.requests += 1
+            failure = self._failures.popleft() if self._failures else None
+            if failure is None:
+                roll = self._random.random()
+                if roll < self.rate_limit_rate:
+                    failure = (429, "Rate limit exceeded")
+                elif roll < self.rate_limit_rate + self.error_rate:
+                    failure = (500, "Injected error")
+        if failure is not None:
+            return self._error(*failure)
+
+        actions = request.get("request", {}).get("actions", [])
+        if request.get("token") != self.token:
+            return self._error(401, "Invalid token")
+        for action in actions:
+            expected = self._sign(action.get("timestamp"), action.get("resourcetype", ""), action.get("actionid", ""))
+            if action.get("hmac_version") != "2" or not hmac.compare_digest(expected, str(action.get("hmac", ""))):
+                return self._error(401, "Invalid signature")
+            if self.max_clock_skew is not None and abs(time.time() - int(action.get("timestamp", 0))) > self.max_clock_skew:
+                return self._error(401, "Timestamp out of range")
+
+        results = []
+        with self._lock:
+            self.actions += len(actions)
+            for action in actions:
+                result = {
+                    "actionid": action.get("actionid"),
+                    "resourceid": action.get("resourceid", ""),
+                    "resourcetype": action.get("resourcetype"),
+                    "identifier": action.get("identifier", ""),
+                }
+                try:
+                    records, total = self._run(action)
+                    result["data"] = {"meta": {"cntabsolute": total}, "records": records}
+                    result["status"] = {"errorcode": 0, "message": "OK"}
+                except _ActionError as e:
+                    result["data"] = {"meta": {"cntabsolute": None}, "records": []}
+                    result["status"] = {"errorcode": e.errorcode, "message": e.message}
+                results.append(result)
+
+        return 200, {
+            "status": {"code": 200, "errorcode": 0, "message": "OK"},
+            "response": {"results": results}
+        }
+
+    def _run(self, action: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        resource_type = action.get("resourcetype")
+        if resource_type == "fields" and action.get("actionid") == ACTION_GET:
+            modules = action.get("parameters", {}).get("modules") or list(self.fields)
+            records = [
+                {"id": module, "type": "", "elements": dict(self.fields.get(module, {}), label=module)}
+                for module in modules
+            ]
+            return records, len(records)
+        if resource_type == "idsfromrelation" and action.get("actionid") == ACTION_GET:
+            parameters = action.get("parameters", {})
+            children = self.relations.get(parameters.get("relationtype"), {})
+            elements = {
+                str(parent_id): [str(child_id) for child_id in children[parent_id]]
+                for parent_id in parameters.get("parentids", [])
+                if children.get(parent_id)
+            }
+            return [{"id": 0, "type": "", "elements": elements}], 1
+        if resource_type not in self.records:
+            raise _ActionError(500, f"Unknown resource type: {resource_type}")
+        store = self.records[resource_type]
+        action_id = action.get("actionid")
+        parameters = action.get("parameters", {})
+
+        if action_id == ACTION_READ:
+            return self._read(resource_type, store, parameters)
+        if action_id == ACTION_CREATE:
+            new_id = max(store, default=0) + 1
+            store[new_id] = dict(parameters.get("data", {}), Id=new_id)
+            self._sorted_ids.pop(resource_type, None)
+            return [self._record(resource_type, new_id, {"id": new_id})], 1
+        if action_id == ACTION_MODIFY:
+            data = parameters.get("data", {})
+            elements = data["elements"] if "elements" in data else [dict(data, id=data.get("Id"))]
+            records = []
+            for element in elements:
+                element = dict(element)
+                record_id = element.pop("id", None)
+                element.pop("Id", None)
+                if record_id not in store:
+                    raise _ActionError(404, f"Record {record_id} not found")
+                store[record_id].update(element)
+                records.append(self._record(resource_type, record_id, {}))
+            return records, len(records)
+        if action_id == ACTION_DELETE:
+            elements = parameters.get("data", {}).get("elements", [])
+            self._sorted_ids.pop(resource_type, None)
+            for element in elements:
+                if store.pop(element.get("id"), None) is None:
+                    raise _ActionError(404, f"Record {element.get('id')} not found")
+            return [], len(elements)
+        raise _ActionError(500, f"Unsupported action: {action_id}")
+
+    def _id_range(
+        self,
+        resource_type: str,
+        store: Dict[int, Dict[str, Any]],
+        conditions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Get the records within the bounds of ``Id`` range conditions, in ID order."""
+        sorted_ids = self._sorted_ids.get(resource_type)
+        if sorted_ids is None:
+            sorted_ids = self._sorted_ids[resource_type] = sorted(store)
+        low, high = 0, len(sorted_ids)
+        for condition in conditions:
+            op = str(condition.get("op", "=")).upper()
+            try:
+                value = int(condition.get("val"))
+            except (TypeError, ValueError):
+                continue
+            if op == ">":
+                low = max(low, bisect.bisect_right(sorted_ids, value))
+            elif op == ">=":
+                low = max(low, bisect.bisect_left(sorted_ids, value))
+            elif op == "<":
+                high = min(high, bisect.bisect_left(sorted_ids, value))
+            elif op == "<=":
+                high = min(high, bisect.bisect_right(sorted_ids, value))
+        return [store[record_id] for record_id in sorted_ids[low:high]]
+
+    def _read(
+        self,
+        resource_type: str,
+        store: Dict[int, Dict[str, Any]],
+        parameters: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        filters = parameters.get("filter") or {}
+        candidates = store.values()
+        # Look up ID filters directly instead of scanning every record
+        for condition in filters.get("Id", []):
+            op = str(condition.get("op", "=")).upper()
+            if op in ("=", "IN"):
+                ids = condition.get("val") if op == "IN" else [condition.get("val")]
+                try:
+                    ids = [int(record_id) for record_id in ids]
+                except (TypeError, ValueError):
+                    break
+                candidates = [store[record_id] for record_id in sorted(set(ids)) if record_id in store]
+                break
+        else:
+            candidates = self._id_range(resource_type, store, filters.get("Id", []))
+        try:
+            matches = [
+                elements for elements in candidates
+                if all(
+                    _matches(elements.get(field), condition)
+                    for field, conditions in filters.items()
+                    for condition in conditions
+                )
+            ]
+        except (ValueError, TypeError) as e:
+            raise _ActionError(400, str(e))
+
+        for field, direction in reversed(list((parameters.get("sortby") or {}).items())):
+            matches.sort(
+                key=lambda elements: (elements.get(field) is None, _comparable(elements.get(field))),
+                reverse=str(direction).upper() == "DESC"
+            )
+
+        offset = int(parameters.get("listoffset", 0))
+        limit = int(parameters.get("listlimit", 20))
+        fields = parameters.get("data") or []
+        page = matches[offset:offset + limit]
+        records = [
+            self._record(
+                resource_type,
+                elements["Id"],
+                {field: elements.get(field, "") for field in fields} if fields else dict(elements)
+            )
+            for elements in page
+        ]
+        return records, len(matches)
+
+    @staticmethod
+    def _record(resource_type: str, record_id: int, elements: Dict[str, Any]) -> Dict[str, Any]:
+        return {"id": record_id, "type": resource_type, "elements": elements}
+
+    def transport(self) -> InMemoryTransport:
+        """
+        Get a transport answering requests in memory.
+
+        Returns:
+            InMemoryTransport: Transport for ``OnOfficeClient``
+        """
+        return InMemoryTransport(self.handle)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> '_RunningServer':
+        """
+        Serve the API over HTTP on a background thread.
+
+        Use as a context manager; it yields the base URL to pass to the client.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1"
+            port (int, optional): Port to bind. Defaults to a free port
+
+        Returns:
+            context manager: Yields the base URL
+        """
+        return _RunningServer(self, host, port)
+
+class _RunningServer:
+    """HTTP server thread around a ``FakeOnOfficeServer``."""
+
+    def __init__(self, fake: FakeOnOfficeServer, host: str, port: int):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    status_code, response = fake.handle(json.loads(body))
+                except ValueError:
+                    status_code, response = 400, {"status": {"code": 400, "message": "Invalid JSON"}}
+                payload = json.dumps(response).encode('utf-8')
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_port}/api/{{version}}/api.php"
+        self._thread = None
+
+    def __enter__(self) -> str:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def __exit__(self, *exc_info) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
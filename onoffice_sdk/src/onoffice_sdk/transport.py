@@ -0,0 +1,289 @@
+"""
+HTTP transports used by OnOfficeClient.
+
+A transport sends an encoded request body and returns the raw response.
+``RequestsTransport`` uses a pooled ``requests.Session``;
+``InMemoryTransport`` answers requests from a Python callable, for tests and
+benchmarks without network access.
+"""
+
+import json
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+
+class TransportResponse:
+    """
+    Response returned by a transport.
+
+    Args:
+        status_code (int): HTTP status code
+        content (bytes, optional): Response body
+        iter_chunks (callable, optional): Reads a streamed body; called with the chunk size
+        close (callable, optional): Releases the connection of a streamed response
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes = b'',
+        iter_chunks: Optional[Callable[[int], Iterator[bytes]]] = None,
+        close: Optional[Callable[[], None]] = None
+    ):
+        self.status_code = status_code
+        self.content = content
+        self._iter_chunks = iter_chunks
+        self._close = close
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.HTTPError`` for 4xx and 5xx status codes."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Iterate over the body in chunks."""
+        if self._iter_chunks is not None:
+            return self._iter_chunks(chunk_size)
+        return (self.content[i:i + chunk_size] for i in range(0, len(self.content), chunk_size))
+
+    def close(self) -> None:
+        """Release the connection."""
+        if self._close is not None:
+            self._close()
+
+class Transport:
+    """
+    Base class for transports.
+
+    Network failures are raised as ``requests.exceptions.RequestException``
+    so the client maps them the same way for every transport.
+    """
+
+    def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> TransportResponse:
+        """
+        Send a POST request.
+
+        Args:
+            url (str): Request URL
+            body (bytes): Encoded request body
+            headers (dict): Request headers
+            timeout (float, optional): Timeout in seconds
+            stream (bool, optional): Read the body lazily via ``iter_content``
+
+        Returns:
+            TransportResponse: The response
+        """
+        raise NotImplementedError
+
+    def warm_up(self, url: str, connections: int) -> int:
+        """
+        Open connections ahead of time.
+
+        Args:
+            url (str): URL of the host to connect to
+            connections (int): Number of connections to open
+
+        Returns:
+            int: Number of open connections kept for later requests
+        """
+        return 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get connection counters.
+
+        Returns:
+            dict: Requests sent, connections created (including warmed-up ones) and
+            requests served on an already open connection
+        """
+        return {"requests": 0, "connections_created": 0, "connections_reused": 0}
+
+    def close(self) -> None:
+        """Release all connections."""
+
+class RequestsTransport(Transport):
+    """
+    Transport on a pooled ``requests.Session``.
+
+    Args:
+        session (requests.Session, optional): Session to use. Defaults to a new session
+        pool_connections (int, optional): Number of hosts to keep pools for. Defaults to 10
+        pool_maxsize (int, optional): Connections kept per host. Defaults to 10
+        pool_block (bool, optional): Wait for a free connection instead of opening
+            one that is discarded afterwards. Defaults to False
+        keep_alive (bool, optional): Reuse connections between requests. Defaults to True
+        connect_timeout (float, optional): Connect timeout; defaults to the client timeout
+        read_timeout (float, optional): Read timeout; defaults to the client timeout
+
+    Examples:
+        >>> transport = RequestsTransport(pool_maxsize=50, connect_timeout=3, read_timeout=30)
+        >>> client = OnOfficeClient(token="your_token", secret="your_secret", transport=transport)
+        >>> client.warm_up(20)
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None
+    ):
+        self.session = session or requests.Session()
+        self.keep_alive = keep_alive
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        self.pool_maxsize = pool_maxsize
+        self._requests = 0
+        self._warmed = 0
+        self._lock = threading.Lock()
+
+    def _timeout(self, timeout: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+        connect = self.connect_timeout if self.connect_timeout is not None else timeout
+        read = self.read_timeout if self.read_timeout is not None else timeout
+        return (connect, read)
+
+    def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> TransportResponse:
+        if not self.keep_alive:
+            headers = dict(headers, Connection='close')
+        with self._lock:
+            self._requests += 1
+
+        response = self.session.post(
+            url,
+            data=body,
+            headers=headers,
+            timeout=self._timeout(timeout),
+            stream=stream
+        )
+        if stream:
+            return TransportResponse(
+                response.status_code,
+                iter_chunks=lambda chunk_size: response.iter_content(chunk_size=chunk_size),
+                close=response.close
+            )
+        return TransportResponse(response.status_code, response.content)
+
+    def warm_up(self, url: str, connections: int) -> int:
+        # Use the pool requests picks for the URL; its key includes the TLS settings
+        if hasattr(self.adapter, 'get_connection_with_tls_context'):
+            request = requests.Request('POST', url).prepare()
+            settings = self.session.merge_environment_settings(url, {}, None, None, None)
+            pool = self.adapter.get_connection_with_tls_context(
+                request, settings['verify'], cert=settings['cert']
+            )
+        else:
+            pool = self.adapter.get_connection(url)
+        # The pool keeps at most pool_maxsize connections; more would be closed again
+        count = min(connections, self.pool_maxsize)
+        created = pool.num_connections
+        taken = [pool._get_conn() for _ in range(count)]
+
+        def connect(conn):
+            if conn.sock is None:
+                conn.connect()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, count)) as executor:
+                list(executor.map(connect, taken))
+        finally:
+            for conn in taken:
+                pool._put_conn(conn)
+            with self._lock:
+                self._warmed += pool.num_connections - created
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        created = 0
+        served = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                created += pool.num_connections
+                served += pool.num_requests
+        with self._lock:
+            sent = self._requests
+            warmed = self._warmed
+        # Connections opened by warm_up are created without serving a request
+        return {
+            "requests": sent,
+            "connections_created": created,
+            "connections_reused": max(0, served - max(0, created - warmed)),
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+class InMemoryTransport(Transport):
+    """
+    Transport answering requests from a Python callable.
+
+    Args:
+        handler (callable): Called with the decoded request body. Returns the
+            response body as a dict, or a ``(status_code, dict)`` tuple
+        keep_requests (int, optional): Number of recent request bodies kept in
+            ``requests`` for inspection. Defaults to 100
+
+    Examples:
+        >>> transport = InMemoryTransport(lambda body: {"status": {"code": 200}, "response": {"results": []}})
+        >>> client = OnOfficeClient(token="test", secret="test", transport=transport)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Union[Dict[str, Any], Tuple[int, Dict[str, Any]]]],
+        keep_requests: int = 100
+    ):
+        self.handler = handler
+        self.requests = deque(maxlen=keep_requests)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        stream: bool = False
+    ) -> TransportResponse:
+        request = json.loads(body)
+        with self._lock:
+            self.requests.append(request)
+            self._count += 1
+        result = self.handler(request)
+        status_code = 200
+        if isinstance(result, tuple):
+            status_code, result = result
+        return TransportResponse(status_code, json.dumps(result).encode('utf-8'))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self._count, "connections_created": 0, "connections_reused": 0}
@@ -0,0 +1,36 @@
+"""
+Helpers for reading OnOffice API responses.
+"""
+
+from typing import Dict, List, Any, Optional
+
+def get_records(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Get the records of all action results in a response.
+    
+    Args:
+        response (dict): API response
+        
+    Returns:
+        list: Records from ``response.results[*].data.records``
+    """
+    records = []
+    for result in response.get('response', {}).get('results', []):
+        records.extend(result.get('data', {}).get('records', []))
+    return records
+
+def get_total_count(response: Dict[str, Any]) -> Optional[int]:
+    """
+    Get the total number of matching records reported by a read action.
+    
+    Args:
+        response (dict): API response
+        
+    Returns:
+        int: Value of ``data.meta.cntabsolute`` of the first result, or None
+    """
+    for result in response.get('response', {}).get('results', []):
+        count = result.get('data', {}).get('meta', {}).get('cntabsolute')
+        if count is not None:
+            return int(count)
+    return None
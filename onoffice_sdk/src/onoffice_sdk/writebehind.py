@@ -0,0 +1,280 @@
+"""
+Write-behind buffering of estate and address updates.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional
+
+RESOURCE_TYPES = ("estate", "address")
+
+class _Pending:
+    """Merged changes of one record and the futures waiting for them."""
+
+    __slots__ = ('data', 'futures')
+
+    def __init__(self):
+        self.data = {}
+        self.futures = []
+
+    def resolve(self, result: Any, error: Optional[BaseException]) -> None:
+        """Resolve the futures that were not cancelled by their callers."""
+        for future in self.futures:
+            try:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+            except Exception:
+                # A future resolved by someone else must not stop the flusher
+                continue
+
+class WriteBehindWriter:
+    """
+    Buffers updates and sends them in batches from a background thread.
+
+    Updates to the same record are merged while they wait, the last value
+    of each field winning, so a burst of updates to one estate becomes one
+    element. Buffered updates are sent when ``max_batch`` records are
+    pending or the oldest has waited ``flush_interval`` seconds. Estates
+    go out as multi-element modify actions with ``bulk_update``; addresses
+    as one batched request of single modify actions.
+
+    Every update returns a ``concurrent.futures.Future`` resolved with the
+    API result of the action that carried it. When ``max_pending`` records
+    are buffered, ``update`` blocks until a flush makes room. Cancelling a
+    future only stops waiting for it; the update is still sent.
+
+    Args:
+        client (OnOfficeClient): Client used to send the updates
+        max_batch (int, optional): Pending records that trigger a flush. Defaults to 100
+        flush_interval (float, optional): Maximum seconds an update waits. Defaults to 0.5
+        max_pending (int, optional): Pending records before ``update`` blocks. Defaults to 10000
+        actions_per_request (int, optional): Actions per request. Defaults to 50
+
+    Examples:
+        >>> with WriteBehindWriter(client, max_batch=200, flush_interval=0.25) as writer:
+        ...     future = writer.update("estate", 123, {"kaufpreis": 260000})
+        ...     writer.update("estate", 123, {"status": 1})
+        >>> future.result()
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch: int = 100,
+        flush_interval: float = 0.5,
+        max_pending: int = 10000,
+        actions_per_request: int = 50
+    ):
+        self.client = client
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_pending = max(max_pending, max_batch)
+        self.actions_per_request = actions_per_request
+
+        self._pending = {resource_type: OrderedDict() for resource_type in RESOURCE_TYPES}
+        self._count = 0
+        self._oldest = None
+        self._in_flight = False
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._submitted = 0
+        self._coalesced = 0
+        self._flushes = 0
+        self._sent = 0
+        self._failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="onoffice-write-behind", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'WriteBehindWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+    def update(
+        self,
+        resource_type: str,
+        record_id: Any,
+        data: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Future:
+        """
+        Buffer an update of a record.
+
+        Args:
+            resource_type (str): "estate" or "address"
+            record_id: ID of the record to update
+            data (dict): Fields to change
+            timeout (float, optional): Seconds to wait for room in a full
+                buffer. Defaults to None (wait indefinitely)
+
+        Returns:
+            Future: Resolved with the API result once the update is sent
+
+        Raises:
+            ValueError: If the resource type is not supported
+            RuntimeError: If the writer is closed
+            TimeoutError: If the buffer stayed full for ``timeout`` seconds
+        """
+        if resource_type not in self._pending:
+            raise ValueError(f"Unsupported resource type: {resource_type}")
+        pending = self._pending[resource_type]
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WriteBehindWriter is closed")
+                entry = pending.get(record_id)
+                if entry is not None or self._count < self.max_pending:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Write-behind buffer is full")
+                self._cond.wait(remaining)
+
+            if entry is None:
+                entry = pending[record_id] = _Pending()
+                self._count += 1
+                if self._oldest is None:
+                    self._oldest = time.monotonic()
+                    self._cond.notify_all()
+                elif self._count >= self.max_batch:
+                    self._cond.notify_all()
+            else:
+                self._coalesced += 1
+
+            entry.data.update(data)
+            future = Future()
+            entry.futures.append(future)
+            self._submitted += 1
+        return future
+
+    def _due(self) -> bool:
+        """True if the buffer should be sent now. Call with the lock held."""
+        if not self._count:
+            return False
+        return (
+            self._closed
+            or self._flush_requested
+            or self._count >= self.max_batch
+            or time.monotonic() - self._oldest >= self.flush_interval
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._due():
+                    if self._closed:
+                        return
+                    wait = None
+                    if self._count:
+                        wait = max(0.0, self.flush_interval - (time.monotonic() - self._oldest))
+                    self._cond.wait(wait)
+
+                batches = {}
+                for resource_type, pending in self._pending.items():
+                    if pending:
+                        batches[resource_type] = list(pending.items())
+                        pending.clear()
+                self._count = 0
+                self._oldest = None
+                self._flush_requested = False
+                self._in_flight = True
+                self._cond.notify_all()
+
+            sent = failed = 0
+            try:
+                for resource_type, entries in batches.items():
+                    for entry, result, error in self._send(resource_type, entries):
+                        entry.resolve(result, error)
+                        if error is None:
+                            sent += 1
+                        else:
+                            failed += 1
+            finally:
+                with self._cond:
+                    self._in_flight = False
+                    self._flushes += 1
+                    self._sent += sent
+                    self._failed += failed
+                    self._cond.notify_all()
+
+    def _send(self, resource_type: str, entries: List[Any]) -> List[Any]:
+        """Send the merged updates of one resource type and pair each entry with its outcome."""
+        try:
+            if resource_type == "estate":
+                results = self.client.estate.bulk_update(
+                    [{"id": record_id, **entry.data} for record_id, entry in entries],
+                    elements_per_action=self.max_batch,
+                    actions_per_request=self.actions_per_request
+                )
+                return [
+                    (entry, result["result"], result["error"])
+                    for (_, entry), result in zip(entries, results)
+                ]
+
+            with self.client.batch(max_actions=self.actions_per_request) as batch:
+                items = [batch.address.update(record_id, entry.data) for record_id, entry in entries]
+            return [
+                (entry, None if item.exception() else item.result(), item.exception())
+                for (_, entry), item in zip(entries, items)
+            ]
+        except Exception as e:
+            return [(entry, None, e) for _, entry in entries]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all buffered updates and wait until they are done.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to None
+
+        Returns:
+            bool: True if everything was sent, False on timeout
+        """
+        with self._cond:
+            if self._count:
+                self._flush_requested = True
+                self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._count and not self._in_flight, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Send the remaining updates and stop the background thread.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to None
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get writer statistics.
+
+        Returns:
+            dict: Updates submitted, updates merged into a pending one,
+            flushes, records sent and failed, and records pending
+        """
+        with self._cond:
+            return {
+                "submitted": self._submitted,
+                "coalesced": self._coalesced,
+                "flushes": self._flushes,
+                "sent": self._sent,
+                "failed": self._failed,
+                "pending": self._count,
+            }
@@ -4,6 +4,7 @@ Pytest configuration and shared fixtures.
 
 import pytest
 from onoffice_sdk import OnOfficeClient
+from onoffice_sdk.testing import FakeOnOfficeServer, generate_addresses, generate_estates
 
 @pytest.fixture
 def mock_client():
@@ -29,3 +30,32 @@ def mock_response():
             "data": []
         }
     }
+
+@pytest.fixture
+def make_server():
+    """
+    Returns a factory for fake servers accepting the test credentials.
+    
+    ``estates`` and ``addresses`` are either counts of generated fixtures
+    or lists of records; other arguments go to ``FakeOnOfficeServer``.
+    """
+    def make(estates=0, addresses=0, **kwargs):
+        return FakeOnOfficeServer(
+            "test_token",
+            "test_secret",
+            estates=generate_estates(estates) if isinstance(estates, int) else estates,
+            addresses=generate_addresses(addresses) if isinstance(addresses, int) else addresses,
+            **kwargs
+        )
+    return make
+
+@pytest.fixture
+def make_client():
+    """
+    Returns a factory for clients talking to a fake server in memory.
+    
+    Keyword arguments go to ``OnOfficeClient``.
+    """
+    def make(server, **kwargs):
+        return OnOfficeClient(token="test_token", secret="test_secret", transport=server.transport(), **kwargs)
+    return make
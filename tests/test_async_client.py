@@ -0,0 +1,96 @@
+"""
+Tests for the asyncio client.
+"""
+
+import asyncio
+import json
+import pytest
+from onoffice_sdk import AsyncOnOfficeClient, OnOfficeClient, AuthenticationError
+
+httpx = pytest.importorskip("httpx")
+
+def _client(handler):
+    return AsyncOnOfficeClient(
+        token="test_token",
+        secret="test_secret",
+        transport=httpx.MockTransport(handler)
+    )
+
+def test_async_estate_get_signs_like_sync_client():
+    """Test that async requests carry the same HMAC2 signature as sync ones."""
+    sent = []
+    
+    def handler(request):
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={
+            "status": {"code": 200, "message": "OK"},
+            "response": {"results": [{"data": {"records": [{"id": 123}]}}]}
+        })
+    
+    async def run():
+        async with _client(handler) as client:
+            return await client.estate.get(123)
+    
+    result = asyncio.run(run())
+    
+    action = sent[0]["request"]["actions"][0]
+    expected = OnOfficeClient("test_token", "test_secret")._create_hmac2(
+        action["timestamp"], "estate", action["actionid"]
+    )
+    assert action["hmac"] == expected
+    assert result["response"]["results"][0]["data"]["records"][0]["id"] == 123
+
+def test_async_error_mapping():
+    """Test that API status codes map to the same exceptions."""
+    def handler(request):
+        return httpx.Response(200, json={"status": {"code": 401, "message": "Unauthorized"}})
+    
+    async def run():
+        async with _client(handler) as client:
+            await client.address.search()
+    
+    with pytest.raises(AuthenticationError):
+        asyncio.run(run())
+
+def test_async_iter_search_concurrent_pages():
+    """Test that async iter_search fetches pages concurrently and in order."""
+    def handler(request):
+        parameters = json.loads(request.content)["request"]["actions"][0]["parameters"]
+        start = parameters["listoffset"] + 1
+        ids = range(start, min(start + parameters["listlimit"], 8))
+        return httpx.Response(200, json={
+            "status": {"code": 200, "message": "OK"},
+            "response": {"results": [{"data": {
+                "meta": {"cntabsolute": 7},
+                "records": [{"id": i} for i in ids]
+            }}]}
+        })
+    
+    async def run():
+        async with _client(handler) as client:
+            return [r["id"] async for r in client.estate.iter_search(page_size=2, concurrency=3)]
+    
+    assert asyncio.run(run()) == list(range(1, 8))
+
+def test_async_search_rejects_stream():
+    """Test that streamed searches are refused on async resources."""
+    async def run():
+        async with _client(lambda request: httpx.Response(500)) as client:
+            for resource in (client.estate, client.address):
+                with pytest.raises(ValueError):
+                    resource.search(stream=True)
+    
+    asyncio.run(run())
+
+def test_async_bulk_writes_are_refused():
+    """Test that bulk writes fail clearly instead of reaching for a missing batch."""
+    async def run():
+        async with _client(lambda request: httpx.Response(500)) as client:
+            with pytest.raises(ValueError, match="OnOfficeClient"):
+                client.estate.bulk_create([{"kaufpreis": 1}])
+            with pytest.raises(ValueError, match="OnOfficeClient"):
+                client.estate.bulk_update([{"id": 1, "kaufpreis": 1}])
+            with pytest.raises(ValueError, match="OnOfficeClient"):
+                client.estate.bulk_delete([1])
+    
+    asyncio.run(run())
@@ -0,0 +1,80 @@
+"""
+Tests for multi-action request batching.
+"""
+
+import pytest
+from onoffice_sdk import OnOfficeClient, OnOfficeAPIError
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def _result(identifier, records, errorcode=0):
+    return {
+        "identifier": identifier,
+        "data": {"records": records},
+        "status": {"errorcode": errorcode, "message": "OK" if errorcode == 0 else "Failed"}
+    }
+
+def test_batch_packs_actions_into_one_request(requests_mock):
+    """Test that queued actions are sent in a single POST and split back."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json={
+        "status": {"code": 200, "message": "OK"},
+        "response": {"results": [
+            _result("1", [{"id": 7}]),
+            _result("0", [{"id": 123}]),
+        ]}
+    })
+    
+    with client.batch() as b:
+        estate = b.estate.get(123)
+        addresses = b.address.search(limit=10)
+    
+    assert requests_mock.call_count == 1
+    actions = requests_mock.last_request.json()["request"]["actions"]
+    assert [a["resourcetype"] for a in actions] == ["estate", "address"]
+    assert all(a["hmac"] for a in actions)
+    assert estate.result()["response"]["results"][0]["data"]["records"][0]["id"] == 123
+    assert addresses.result()["response"]["results"][0]["data"]["records"][0]["id"] == 7
+
+def test_batch_splits_into_chunks(requests_mock):
+    """Test that batches larger than max_actions use several requests."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json={
+        "status": {"code": 200, "message": "OK"},
+        "response": {"results": [_result("0", []), _result("1", [])]}
+    })
+    
+    with client.batch(max_actions=2) as b:
+        for estate_id in range(3):
+            b.estate.get(estate_id)
+    
+    assert requests_mock.call_count == 2
+    assert all(item.done for item in b.items)
+
+def test_batch_reports_per_action_errors(requests_mock):
+    """Test that a failing action only fails its own item."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json={
+        "status": {"code": 200, "message": "OK"},
+        "response": {"results": [_result("0", []), _result("1", [], errorcode=137)]}
+    })
+    
+    with client.batch() as b:
+        ok = b.estate.get(1)
+        failed = b.estate.delete(2)
+    
+    assert ok.exception() is None
+    with pytest.raises(OnOfficeAPIError):
+        failed.result()
+
+def test_batch_refuses_methods_needing_a_response(mock_client):
+    """Test that only single-action methods can be queued in a batch."""
+    with mock_client.batch() as b:
+        for method in ("get_many", "iter_search", "scan", "bulk_update"):
+            with pytest.raises(AttributeError):
+                getattr(b.estate, method)
+        for option in ("stream", "columnar", "include", "local"):
+            with pytest.raises(ValueError):
+                b.estate.search(**{option: True})
+    
+    assert b.items == []
@@ -0,0 +1,128 @@
+"""
+Tests for the circuit breaker and hedged reads.
+"""
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+import pytest
+from onoffice_sdk import AsyncOnOfficeClient, CircuitBreaker, HedgePolicy, RetryPolicy
+from onoffice_sdk.exceptions import AuthenticationError, CircuitOpenError
+
+def test_breaker_opens_fails_fast_and_recovers(make_server, make_client):
+    """Test the closed, open, half-open and closed cycle."""
+    server = make_server(estates=5)
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05)
+    client = make_client(server, circuit_breaker=breaker, retry=RetryPolicy(max_attempts=5, backoff_base=0))
+
+    server.fail_next(500, count=3)
+    # The fourth attempt is rejected by the open breaker instead of being sent
+    with pytest.raises(CircuitOpenError):
+        client.estate.get(1)
+    assert breaker.state == "open"
+    assert server.requests == 3
+
+    with pytest.raises(CircuitOpenError) as error:
+        client.estate.get(1)
+    assert error.value.retry_after > 0
+    assert server.requests == 3
+
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    client.estate.get(1)
+    assert breaker.state == "closed"
+    assert breaker.stats()["opened"] == 1 and breaker.stats()["rejected"] == 2
+
+def test_breaker_counts_slow_calls_and_ignores_client_errors():
+    """Test the latency threshold and errors that show a healthy API."""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60, slow_call_threshold=0.5)
+
+    breaker.record(0.01, AuthenticationError("Invalid token"))
+    breaker.record(1.0)
+    assert breaker.state == "closed"
+    breaker.record(1.0)
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before()
+    breaker.reset()
+    breaker.before()
+
+def test_hedged_read_takes_the_faster_copy(make_server, make_client):
+    """Test that a slow read is answered by its copy."""
+    latencies = itertools.chain([0.5], itertools.repeat(0.0))
+    server = make_server(estates=5, latency=lambda: next(latencies))
+    hedge = HedgePolicy(delay=0.02)
+    client = make_client(server, hedge=hedge)
+
+    started = time.perf_counter()
+    client.estate.get(1)
+    assert time.perf_counter() - started < 0.4
+
+    client.estate.update(1, {"kaufpreis": 1})
+    assert hedge.stats()["hedged"] == 1 and hedge.stats()["hedge_wins"] == 1
+
+def test_hedging_does_not_limit_concurrency(make_server, make_client):
+    """Test that reads beyond the hedge threads run on their callers without waiting."""
+    server = make_server(estates=5, latency=0.1)
+    hedge = HedgePolicy(delay=0.5, max_workers=4)
+    client = make_client(server, hedge=hedge)
+    threads = [threading.Thread(target=client.estate.get, args=(1,)) for _ in range(32)]
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.perf_counter() - started < 0.4
+    assert hedge.stats()["hedged"] == 0
+
+def test_hedged_share_is_capped(make_server, make_client):
+    """Test that at most max_ratio of the reads are sent a copy."""
+    server = make_server(estates=5, latency=0.01)
+    hedge = HedgePolicy(delay=0.001, max_ratio=0.2)
+    client = make_client(server, hedge=hedge)
+
+    for _ in range(30):
+        client.estate.get(1)
+
+    assert 1 <= hedge.stats()["hedged"] <= 0.2 * 30 + 1
+
+def test_hedge_delay_follows_the_latency_quantile():
+    """Test that no read is hedged before enough latencies are known."""
+    hedge = HedgePolicy(quantile=0.9, min_samples=10, min_delay=0)
+    for latency in range(9):
+        hedge.observe(latency / 100)
+    assert hedge.delay() is None
+    hedge.observe(0.09)
+    assert hedge.delay() == pytest.approx(0.08)
+
+def test_async_hedged_read(make_server):
+    """Test hedging on the async client."""
+    httpx = pytest.importorskip("httpx")
+    server = make_server(estates=5)
+    calls = itertools.count()
+
+    async def handler(request):
+        if next(calls) == 0:
+            await asyncio.sleep(0.5)
+        status_code, body = server.handle(json.loads(request.content))
+        return httpx.Response(status_code, json=body)
+
+    async def run():
+        async with AsyncOnOfficeClient(
+            token="test_token",
+            secret="test_secret",
+            transport=httpx.MockTransport(handler),
+            hedge=HedgePolicy(delay=0.02)
+        ) as client:
+            started = time.perf_counter()
+            await client.estate.get(1)
+            return time.perf_counter() - started, client.hedge.stats()
+
+    elapsed, stats = asyncio.run(run())
+    assert elapsed < 0.4
+    assert stats["hedge_wins"] == 1
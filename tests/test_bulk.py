@@ -0,0 +1,60 @@
+"""
+Tests for bulk estate writes.
+"""
+
+from onoffice_sdk import OnOfficeClient
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def _respond(failing_action=None):
+    """Answer every action with success, except ``(request_number, action_index)``."""
+    calls = []
+    
+    def respond(request, context):
+        actions = request.json()["request"]["actions"]
+        results = []
+        for index, action in enumerate(actions):
+            failed = failing_action == (len(calls), index)
+            results.append({
+                "identifier": action["identifier"],
+                "data": {"records": []},
+                "status": {"errorcode": 137 if failed else 0, "message": "Failed" if failed else "OK"}
+            })
+        calls.append(request)
+        return {"status": {"code": 200, "message": "OK"}, "response": {"results": results}}
+    return respond
+
+def test_bulk_update_packs_elements_and_actions(requests_mock):
+    """Test that changes are packed into multi-element actions and few requests."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json=_respond())
+    changes = [{"id": i, "kaufpreis": 1000 + i} for i in range(25)]
+    
+    results = client.estate.bulk_update(changes, elements_per_action=10, actions_per_request=2)
+    
+    assert requests_mock.call_count == 2
+    first = requests_mock.request_history[0].json()["request"]["actions"]
+    assert [len(a["parameters"]["data"]["elements"]) for a in first] == [10, 10]
+    assert all(a["actionid"].endswith("action:modify") for a in first)
+    assert [r["id"] for r in results] == list(range(25))
+    assert all(r["success"] for r in results)
+
+def test_bulk_delete_reports_failed_elements(requests_mock):
+    """Test that elements of a failed action are reported as failed."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json=_respond(failing_action=(0, 1)))
+    
+    results = client.estate.bulk_delete([1, 2, 3, 4], elements_per_action=2)
+    
+    assert [r["success"] for r in results] == [True, True, False, False]
+    assert results[2]["error"] is not None
+
+def test_bulk_update_respects_payload_limit(requests_mock):
+    """Test that the payload limit splits actions and requests."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json=_respond())
+    changes = [{"id": i, "objektbeschreibung": "x" * 400} for i in range(4)]
+    
+    client.estate.bulk_update(changes, max_payload_bytes=1000)
+    
+    assert requests_mock.call_count == 2
@@ -0,0 +1,56 @@
+"""
+Tests for the read response cache.
+"""
+
+from onoffice_sdk import OnOfficeClient, ResponseCache
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+OK_RESPONSE = {
+    "status": {"code": 200, "message": "OK"},
+    "response": {"results": [{"data": {"records": [{"id": 123}]}}]}
+}
+
+def test_cache_serves_repeated_reads(requests_mock):
+    """Test that identical reads are answered from the cache."""
+    cache = ResponseCache(ttl=60)
+    client = OnOfficeClient(token="test_token", secret="test_secret", cache=cache)
+    requests_mock.post(API_URL, json=OK_RESPONSE)
+    
+    first = client.estate.get(123)
+    first["response"]["results"] = []
+    second = client.estate.get(123)
+    
+    assert requests_mock.call_count == 1
+    assert second["response"]["results"][0]["data"]["records"][0]["id"] == 123
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_cache_invalidated_by_writes(requests_mock):
+    """Test that a write drops cached reads of the same resource type only."""
+    cache = ResponseCache(ttl=60)
+    client = OnOfficeClient(token="test_token", secret="test_secret", cache=cache)
+    requests_mock.post(API_URL, json=OK_RESPONSE)
+    
+    client.estate.get(123)
+    client.address.get(5)
+    client.estate.update(123, {"kaufpreis": 260000})
+    client.estate.get(123)
+    client.address.get(5)
+    
+    assert requests_mock.call_count == 4
+    assert cache.stats()["invalidations"] == 1
+
+def test_cache_lru_eviction_and_ttl():
+    """Test the size cap and per-resource TTL."""
+    cache = ResponseCache(ttl=60, maxsize=2, ttls={"address": 0})
+    cache.set("estate", "a", {"n": 1})
+    cache.set("estate", "b", {"n": 2})
+    cache.get("a")
+    cache.set("estate", "c", {"n": 3})
+    cache.set("address", "d", {"n": 4})
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.get("d") is None
+    assert cache.stats()["evictions"] == 1
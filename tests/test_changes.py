@@ -0,0 +1,72 @@
+"""
+Tests for diff-aware updates.
+"""
+
+from onoffice_sdk import ChangeTracker, SyncEngine
+from onoffice_sdk.changes import normalise
+
+def test_normalise_compares_numbers_and_strings_by_value():
+    """Test that API strings match the Python values they were written from."""
+    assert normalise("250000.00") == normalise(250000)
+    assert normalise(" Berlin ") == normalise("Berlin")
+    assert normalise(None) == normalise("")
+    assert normalise("01067") != normalise(1067)
+    assert normalise("1") != normalise("2")
+
+def test_update_sends_only_changed_fields_and_skips_no_ops(make_server, make_client):
+    """Test estate and address updates after a read."""
+    server = make_server(estates=5, addresses=5)
+    tracker = ChangeTracker()
+    client = make_client(server, change_tracker=tracker)
+    transport = client.transport
+    estate = dict(server.records["estate"][1])
+    client.estate.get(1, fields=["Id", "kaufpreis", "lage"])
+    client.address.get(2, fields=["Id", "Name", "Email"])
+    sent = transport.stats()["requests"]
+
+    client.estate.update(1, {"kaufpreis": str(estate["kaufpreis"]), "lage": estate["lage"]})
+    assert transport.stats()["requests"] == sent
+
+    client.estate.update(1, {"kaufpreis": estate["kaufpreis"] + 1, "lage": estate["lage"]})
+    action = transport.requests[-1]["request"]["actions"][0]
+    assert action["parameters"]["data"]["elements"] == [{"id": 1, "kaufpreis": estate["kaufpreis"] + 1}]
+
+    client.estate.update(1, {"kaufpreis": estate["kaufpreis"] + 1})
+    client.address.update(2, {"Name": server.records["address"][2]["Name"]})
+    assert transport.stats()["requests"] == sent + 1
+
+    stats = tracker.stats()
+    assert stats["writes"] == 4
+    assert stats["skipped_writes"] == 3
+    assert stats["skipped_fields"] == 5
+    assert stats["bytes_saved"] > 0
+
+def test_unknown_fields_are_always_sent(make_server, make_client):
+    """Test that fields never read are sent even without a snapshot."""
+    server = make_server(estates=5)
+    client = make_client(server, change_tracker=ChangeTracker())
+    transport = client.transport
+
+    client.estate.update(3, {"kaufpreis": 1})
+    client.estate.update(3, {"kaufpreis": 1})
+
+    assert transport.stats()["requests"] == 1
+
+def test_bulk_update_drops_unchanged_elements_with_mirror_snapshots(make_server, make_client):
+    """Test snapshots loaded from a mirror and multi-element modify actions."""
+    server = make_server(estates=20)
+    engine = SyncEngine(make_client(server))
+    engine.sync("estate")
+    tracker = ChangeTracker()
+    assert tracker.load_mirror(engine, resource_types=("estate",)) == 20
+    client = make_client(server, change_tracker=tracker)
+    transport = client.transport
+
+    changes = [{"id": i, "kaufpreis": server.records["estate"][i]["kaufpreis"]} for i in range(1, 11)]
+    changes[4]["kaufpreis"] += 1
+    results = client.estate.bulk_update(changes)
+
+    assert all(result["success"] for result in results)
+    elements = transport.requests[0]["request"]["actions"][0]["parameters"]["data"]["elements"]
+    assert elements == [changes[4]]
+    assert tracker.stats()["skipped_elements"] == 9
@@ -0,0 +1,161 @@
+"""
+Tests for the columnar result container.
+"""
+
+import asyncio
+import pytest
+from onoffice_sdk import AsyncOnOfficeClient, OnOfficeClient, ColumnarRecords, LocalQueryEngine
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+RECORDS = [
+    {"id": "1", "elements": {"kaufpreis": "250000.00", "objektart": "haus", "lage": "Berlin Mitte"}},
+    {"id": "2", "elements": {"kaufpreis": "", "objektart": "haus", "lage": "Köln"}},
+    {"id": "3", "elements": {"kaufpreis": 180000, "objektart": "wohnung", "lage": "Hamburg"}},
+    {"id": "4", "elements": {"kaufpreis": "99000", "objektart": "haus", "lage": "Bonn"}},
+]
+
+def test_columns_are_typed():
+    """Test type inference, dictionary encoding and row views."""
+    records = ColumnarRecords.from_records(iter(RECORDS))
+    
+    assert len(records) == 4
+    assert records.ids.kind == "int"
+    assert records.columns["kaufpreis"].kind == "float"
+    assert records.columns["objektart"].kind == "dictionary"
+    assert records.columns["objektart"].categories == ["haus", "wohnung"]
+    assert records.columns["lage"].kind == "string"
+    
+    row = records[1]
+    assert row.id == 2
+    assert row["kaufpreis"] is None
+    assert dict(records[0]) == {"kaufpreis": 250000.0, "objektart": "haus", "lage": "Berlin Mitte"}
+
+def test_search_returns_columnar(requests_mock):
+    """Test that search(columnar=True) converts the response."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json={
+        "status": {"code": 200, "message": "OK"},
+        "response": {"results": [{"data": {"meta": {"cntabsolute": 10}, "records": RECORDS}}]}
+    })
+    
+    records = client.estate.search(columnar=True)
+    
+    assert isinstance(records, ColumnarRecords)
+    assert records.total == 10
+    assert records[-1].to_record() == {
+        "id": 4,
+        "elements": {"kaufpreis": 99000.0, "objektart": "haus", "lage": "Bonn"}
+    }
+
+def test_async_search_returns_columnar():
+    """Test that async search(columnar=True) awaits the response before converting it."""
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("numpy")
+    
+    def handler(request):
+        return httpx.Response(200, json={
+            "status": {"code": 200, "message": "OK"},
+            "response": {"results": [{"data": {"meta": {"cntabsolute": 4}, "records": RECORDS}}]}
+        })
+    
+    engine = LocalQueryEngine()
+    engine.load("address", RECORDS)
+    
+    async def run():
+        async with AsyncOnOfficeClient(
+            token="test_token",
+            secret="test_secret",
+            transport=httpx.MockTransport(handler),
+            query_engine=engine
+        ) as client:
+            return (
+                await client.estate.search(columnar=True),
+                await client.address.search(fields=["kaufpreis", "lage"], columnar=True, local=True)
+            )
+    
+    remote, local = asyncio.run(run())
+    
+    assert isinstance(remote, ColumnarRecords) and remote.total == 4
+    assert isinstance(local, ColumnarRecords) and len(local) == 4
+    assert local[0]["lage"] == "Berlin Mitte"
+
+def test_to_pandas_shares_buffers():
+    """Test that numeric columns are exported to pandas without copying."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+    records = ColumnarRecords.from_records(RECORDS)
+    
+    df = records.to_pandas()
+    
+    assert list(df.index) == [1, 2, 3, 4]
+    assert str(df["objektart"].dtype) == "category"
+    assert np.isnan(df["kaufpreis"].iloc[1])
+    buffer = np.frombuffer(records.columns["kaufpreis"].values, dtype=np.float64)
+    assert np.shares_memory(df["kaufpreis"].to_numpy(), buffer)
+
+def test_to_arrow():
+    """Test the Arrow export including nulls and dictionaries."""
+    pytest.importorskip("pyarrow")
+    table = ColumnarRecords.from_records(RECORDS).to_arrow()
+    
+    assert table.column_names == ["id", "kaufpreis", "objektart", "lage"]
+    assert table.column("objektart").to_pylist() == ["haus", "haus", "wohnung", "haus"]
+    assert table.column("kaufpreis").null_count == 1
+
+def test_leading_zeros_stay_strings():
+    """Test that postal codes with leading zeros are not inferred as numbers."""
+    records = ColumnarRecords.from_records([
+        {"id": "1", "elements": {"plz": "01234"}},
+        {"id": "2", "elements": {"plz": "10115"}},
+        {"id": "3", "elements": {"plz": "0"}},
+    ])
+    
+    assert records.columns["plz"].kind != "float"
+    assert [row["plz"] for row in records] == ["01234", "10115", "0"]
+
+def test_demoted_column_keeps_original_strings():
+    """Test that widening a numeric column to strings keeps the original text."""
+    records = ColumnarRecords.from_records([
+        {"id": "1", "elements": {"nummer": "1"}},
+        {"id": "2", "elements": {"nummer": "2.50"}},
+        {"id": "3", "elements": {"nummer": ""}},
+        {"id": "4", "elements": {"nummer": "4a"}},
+    ])
+    
+    assert records.columns["nummer"].kind in ("dictionary", "string")
+    assert [row["nummer"] for row in records] == ["1", "2.50", None, "4a"]
+
+def test_widened_column_keeps_original_numbers():
+    """Test that numbers keep their type when a column widens past them."""
+    records = ColumnarRecords.from_records([
+        {"id": "1", "elements": {"nummer": 5}},
+        {"id": "2", "elements": {"nummer": 2.5}},
+        {"id": "3", "elements": {"nummer": "x"}},
+    ])
+    column = records.columns["nummer"]
+    
+    assert [column.source(index) for index in range(3)] == [5, 2.5, "x"]
+
+def test_source_returns_original_values():
+    """Test that numeric columns still give access to the original values."""
+    records = ColumnarRecords.from_records(RECORDS)
+    column = records.columns["kaufpreis"]
+    
+    assert column.value(0) == 250000.0
+    assert [column.source(index) for index in range(4)] == ["250000.00", None, 180000, "99000"]
+    assert records.columns["objektart"].exceptions == {}
+
+def test_api_strings_keep_no_per_row_originals():
+    """Test that uniformly formatted API strings are rebuilt from the column format."""
+    records = ColumnarRecords.from_records(
+        {"id": str(n), "elements": {"kaufpreis": f"{n * 1000}.00", "zimmer": str(n % 5 + 1)}}
+        for n in range(1, 1001)
+    )
+    kaufpreis = records.columns["kaufpreis"]
+    
+    assert (records.ids.decimals, records.ids.exceptions) == (0, {})
+    assert (kaufpreis.decimals, kaufpreis.exceptions) == (2, {})
+    assert records.columns["zimmer"].exceptions == {}
+    assert kaufpreis.source(41) == "42000.00"
+    assert records.ids.source(41) == "42"
@@ -0,0 +1,45 @@
+"""
+Tests for the signing context and JSON codecs.
+"""
+
+import base64
+import hashlib
+import hmac
+import pytest
+from onoffice_sdk import OnOfficeClient
+from onoffice_sdk.codec import JSONCodec, default_codec
+from onoffice_sdk.signing import SigningContext
+
+def _reference_hmac2(token, secret, timestamp, resource_type, action_id):
+    message = f"{timestamp}{token}{resource_type}{action_id}".encode("utf-8")
+    digest = hmac.new(secret.encode("utf-8"), message, hashlib.sha256).digest()
+    return base64.b64encode(digest).decode("utf-8")
+
+def test_signing_context_matches_reference():
+    """Test that the pre-keyed signer produces the documented HMAC2."""
+    signer = SigningContext("test_token", "test_secret")
+    action = OnOfficeClient.ACTION_READ
+    
+    for timestamp in (1700000000, 1700000000, 1700000001):
+        assert signer.sign(timestamp, "estate", action) == _reference_hmac2(
+            "test_token", "test_secret", timestamp, "estate", action
+        )
+
+def test_client_resigns_after_secret_change():
+    """Test that changing the secret on the client is picked up."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    client._create_hmac2(1700000000, "estate", client.ACTION_READ)
+    client.secret = "other_secret"
+    
+    assert client._create_hmac2(1700000000, "estate", client.ACTION_READ) == _reference_hmac2(
+        "test_token", "other_secret", 1700000000, "estate", client.ACTION_READ
+    )
+
+@pytest.mark.parametrize("codec", [JSONCodec(), default_codec()])
+def test_codecs_round_trip(codec):
+    """Test that codecs encode to bytes and decode back."""
+    payload = {"token": "t", "request": {"actions": [{"parameters": {"lage": "Köln", "listlimit": 5}}]}}
+    encoded = codec.dumps(payload)
+    
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
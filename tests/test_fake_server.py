@@ -0,0 +1,74 @@
+"""
+Tests for the local stand-in OnOffice server.
+"""
+
+import pytest
+from onoffice_sdk import OnOfficeClient, RetryPolicy
+from onoffice_sdk.exceptions import AuthenticationError, OnOfficeAPIError, RateLimitError
+from onoffice_sdk.testing import generate_estates
+from onoffice_sdk.utils import get_records, get_total_count
+
+@pytest.fixture
+def server(make_server):
+    return make_server(estates=250, addresses=20)
+
+def test_search_filters_sorts_and_pages(server, make_client):
+    """Test reads against the seed fixtures through the in-memory transport."""
+    client = make_client(server)
+
+    response = client.estate.search(
+        filters={"kaufpreis": [{"op": ">", "val": 500000}]},
+        fields=["Id", "kaufpreis"],
+        sort_by={"kaufpreis": "ASC"},
+        limit=10
+    )
+    prices = [record["elements"]["kaufpreis"] for record in get_records(response)]
+    expected = sorted(e["kaufpreis"] for e in generate_estates(250) if e["kaufpreis"] > 500000)
+
+    assert prices == expected[:10]
+    assert get_total_count(response) == len(expected)
+    assert len(list(client.estate.iter_search(page_size=40))) == 250
+
+def test_writes_change_the_served_data(server, make_client):
+    """Test create, update and delete on the fake server."""
+    client = make_client(server)
+
+    created = client.estate.create({"objektart": "haus", "kaufpreis": 1})
+    new_id = get_records(created)[0]["id"]
+    client.estate.update(new_id, {"kaufpreis": 2})
+    assert server.records["estate"][new_id]["kaufpreis"] == 2
+
+    client.estate.delete(new_id)
+    assert new_id not in server.records["estate"]
+
+def test_rejects_bad_signatures(server):
+    """Test that a client with the wrong secret gets an authentication error."""
+    client = OnOfficeClient(token="test_token", secret="wrong_secret", transport=server.transport())
+
+    with pytest.raises(AuthenticationError):
+        client.estate.get(1)
+
+def test_injected_failures_are_retried(server, make_client):
+    """Test 429 and 500 injection together with the retry policy."""
+    server.fail_next(429)
+    server.fail_next(500)
+    client = make_client(server, retry=RetryPolicy(max_attempts=3, backoff_base=0))
+
+    assert get_records(client.estate.get(1))[0]["id"] == 1
+    assert server.requests == 3
+
+    server.fail_next(429)
+    with pytest.raises(RateLimitError):
+        make_client(server).estate.get(1)
+    server.fail_next(503)
+    with pytest.raises(OnOfficeAPIError):
+        make_client(server).estate.get(1)
+
+def test_serves_over_http(server):
+    """Test the HTTP mode with the client's base_url."""
+    with server.serve() as base_url:
+        client = OnOfficeClient(token="test_token", secret="test_secret", base_url=base_url)
+        response = client.address.get(5, fields=["Id", "Name"])
+
+    assert get_records(response)[0]["id"] == 5
+    assert server.requests == 1
@@ -0,0 +1,66 @@
+"""
+Tests for the field metadata registry.
+"""
+
+import pytest
+from onoffice_sdk import FieldRegistry
+from onoffice_sdk.exceptions import ValidationError
+
+def test_unknown_fields_fail_before_sending(make_server, make_client):
+    """Test that invalid fields never reach the API."""
+    server = make_server(estates=5)
+    client = make_client(server, field_registry=FieldRegistry())
+
+    with pytest.raises(ValidationError) as excinfo:
+        client.estate.search(fields=["Id", "kaufpreiss"], sort_by={"flaeche": "ASC"})
+
+    assert excinfo.value.errors == {"kaufpreiss": "unknown field", "flaeche": "unknown sort field"}
+    assert server.requests == 1  # only the field definitions
+
+    client.estate.search(fields=["Id", "kaufpreis"])
+    assert server.requests == 2
+
+def test_filter_operators_and_types_are_checked(make_server, make_client):
+    """Test operator names, list operands and value types."""
+    server = make_server(estates=5)
+    client = make_client(server, field_registry=FieldRegistry())
+
+    with pytest.raises(ValidationError) as excinfo:
+        client.estate.search(filters={
+            "kaufpreis": [{"op": ">", "val": "teuer"}],
+            "objektart": [{"op": "=", "val": "schloss"}],
+            "Id": [{"op": "IN", "val": 5}],
+            "status": [{"op": "~", "val": 1}],
+        })
+
+    errors = excinfo.value.errors
+    assert errors["kaufpreis"] == "expected an integer, got 'teuer'"
+    assert errors["objektart"] == "'schloss' is not a permitted value"
+    assert errors["Id"] == "operator IN expects a list"
+    assert errors["status"] == "unknown operator '~'"
+
+    client.estate.search(filters={"kaufpreis": [{"op": "BETWEEN", "val": [1, "200000"]}]})
+
+def test_default_fields_are_limited_to_existing_fields(make_server, make_client):
+    """Test that defaults missing from the account are not requested."""
+    addresses = [{"Id": 1, "Vorname": "Anna", "Name": "Müller"}]
+    server = make_server(addresses=addresses)
+    client = make_client(server, field_registry=FieldRegistry())
+    transport = client.transport
+
+    client.address.get(1)
+
+    action = transport.requests[-1]["request"]["actions"][0]
+    assert action["parameters"]["data"] == ["Id", "Vorname", "Name"]
+
+def test_definitions_are_cached_on_disk(tmp_path, make_server, make_client):
+    """Test that a new registry reuses the file until the TTL expires."""
+    path = str(tmp_path / "fields.json")
+    server = make_server(addresses=3)
+
+    make_client(server, field_registry=FieldRegistry(path=path)).address.get(1, fields=["Id"])
+    make_client(server, field_registry=FieldRegistry(path=path)).address.get(1, fields=["Id"])
+    assert server.requests == 3  # one definitions fetch and two reads
+
+    make_client(server, field_registry=FieldRegistry(path=path, ttl=0)).address.get(1, fields=["Id"])
+    assert server.requests == 5
@@ -0,0 +1,47 @@
+"""
+Tests for bulk get-by-IDs.
+"""
+
+from onoffice_sdk import OnOfficeClient
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def _serve(known_ids):
+    def respond(request, context):
+        parameters = request.json()["request"]["actions"][0]["parameters"]
+        wanted = parameters["filter"]["Id"][0]["val"]
+        return {
+            "status": {"code": 200, "message": "OK"},
+            "response": {"results": [{"data": {"records": [
+                {"id": str(i), "elements": {"Id": str(i)}} for i in wanted if i in known_ids
+            ]}}]}
+        }
+    return respond
+
+def test_get_many_chunks_and_dedupes(requests_mock):
+    """Test that IDs are deduplicated, chunked into IN filters and keyed by ID."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json=_serve({1, 2, 3, 4}))
+    
+    result = client.estate.get_many([1, 2, 2, 3, 4, 5], chunk_size=2)
+    
+    assert requests_mock.call_count == 3
+    chunks = sorted(
+        r.json()["request"]["actions"][0]["parameters"]["filter"]["Id"][0]["val"]
+        for r in requests_mock.request_history
+    )
+    assert chunks == [[1, 2], [3, 4], [5]]
+    assert list(result) == [1, 2, 3, 4, 5]
+    assert result[3]["id"] == "3"
+    assert result[5] is None
+
+def test_address_get_many_single_request(requests_mock):
+    """Test that a small ID list needs a single request."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, json=_serve({7}))
+    
+    result = client.address.get_many([7, 8])
+    
+    assert requests_mock.call_count == 1
+    assert result[7]["id"] == "7"
+    assert result[8] is None
@@ -0,0 +1,168 @@
+"""
+Tests for request lifecycle hooks and metrics.
+"""
+
+import asyncio
+import pytest
+from onoffice_sdk import (
+    AsyncOnOfficeClient,
+    MetricsAggregator,
+    ResponseCache,
+    RetryPolicy,
+    TracingHook
+)
+from onoffice_sdk.exceptions import OnOfficeAPIError
+
+def test_event_reports_phases_bytes_and_cache_outcome(make_server, make_client):
+    """Test the event contents for a miss followed by a cache hit."""
+    server = make_server(estates=10)
+    client = make_client(server, cache=ResponseCache())
+    events = []
+    client.add_hook(events.append)
+
+    client.estate.get(1)
+    client.estate.get(1)
+
+    miss, hit = events
+    assert miss.resource_type == "estate"
+    assert miss.cache == "miss" and hit.cache == "hit"
+    assert set(miss.phases) == {"sign", "encode", "network", "decode", "status"}
+    assert miss.request_bytes > 0 and miss.response_bytes > 0
+    assert miss.http_status == 200 and miss.status_code == 200
+    assert hit.phases == {} and hit.duration >= 0
+
+    client.remove_hook(events.append)
+    client.estate.get(2)
+    assert len(events) == 2
+
+def test_event_counts_retries_and_errors(make_server, make_client):
+    """Test retries, backoff time and the error of a failed request."""
+    server = make_server(estates=10)
+    client = make_client(server, retry=RetryPolicy(max_attempts=2, backoff_base=0))
+    events = []
+    client.add_hook(events.append)
+
+    server.fail_next(500, count=2)
+    with pytest.raises(OnOfficeAPIError):
+        client.estate.get(1)
+
+    event = events[0]
+    assert event.retries == 1
+    assert event.http_status == 500
+    assert isinstance(event.error, OnOfficeAPIError)
+
+def test_batched_and_streamed_requests_emit_events(make_server, make_client):
+    """Test that batched POSTs and streamed reads are reported like other requests."""
+    server = make_server(estates=10)
+    client = make_client(server)
+    events = []
+    client.add_hook(events.append)
+
+    client.estate.bulk_update([{"id": n, "kaufpreis": n} for n in range(1, 5)], elements_per_action=1)
+    with client.batch() as b:
+        b.estate.get(1)
+        b.address.search(limit=1)
+    records = list(client.estate.search(fields=["Id"], limit=5, stream=True))
+
+    bulk, mixed, streamed = events
+    assert (bulk.resource_type, bulk.actions, bulk.error) == ("estate", 4, None)
+    assert bulk.action_id == client.ACTION_MODIFY and bulk.response_bytes > 0
+    assert (mixed.resource_type, mixed.action_id, mixed.actions) == ("batch", "batch", 2)
+    assert len(records) == 5
+    assert streamed.actions == 1 and streamed.status_code == 200
+    assert streamed.response_bytes > 0 and "network" in streamed.phases
+
+def test_failing_hook_does_not_reach_the_caller(make_server, make_client, caplog):
+    """Test that a raising hook is logged and later hooks still run."""
+    server = make_server(estates=10)
+    client = make_client(server)
+    events = []
+
+    def broken(event):
+        raise RuntimeError("hook failed")
+
+    client.add_hook(broken)
+    client.add_hook(events.append)
+
+    assert client.estate.get(1)["status"]["code"] == 200
+    server.fail_next(code=500)
+    with pytest.raises(OnOfficeAPIError):
+        client.estate.get(1)
+
+    assert [event.error is None for event in events] == [True, False]
+    assert "hook failed" in caplog.text
+
+def test_metrics_aggregator_renders_prometheus_text(make_server, make_client):
+    """Test counters and histograms in the exposition format."""
+    server = make_server(estates=10)
+    client = make_client(server)
+    metrics = MetricsAggregator()
+    client.add_hook(metrics)
+
+    client.estate.get(1)
+    client.estate.update(1, {"kaufpreis": 1})
+    text = metrics.render()
+
+    assert 'onoffice_requests_total{resource_type="estate",action="read",outcome="ok"} 1' in text
+    assert 'onoffice_requests_total{resource_type="estate",action="modify",outcome="ok"} 1' in text
+    assert 'onoffice_request_duration_seconds_bucket{resource_type="estate",action="read",le="+Inf"} 1' in text
+    assert 'phase="network"' in text
+    assert metrics.snapshot()["cache"][("estate", "bypass")] == 2
+
+def test_async_client_emits_events():
+    """Test that the async client reports the same events."""
+    httpx = pytest.importorskip("httpx")
+    events = []
+
+    def handler(request):
+        return httpx.Response(200, json={"status": {"code": 200, "message": "OK"}, "response": {"results": []}})
+
+    async def run():
+        async with AsyncOnOfficeClient(
+            token="test_token",
+            secret="test_secret",
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            client.add_hook(events.append)
+            await client.estate.get(1)
+
+    asyncio.run(run())
+    assert events[0].cache == "bypass"
+    assert events[0].phases["network"] >= 0
+
+def test_tracing_hook_records_a_span(make_server, make_client):
+    """Test the span name and attributes with the OpenTelemetry API."""
+    pytest.importorskip("opentelemetry")
+
+    class Span:
+        def __init__(self, name, attributes):
+            self.name = name
+            self.attributes = attributes
+            self.ended = False
+
+        def record_exception(self, error):
+            pass
+
+        def set_status(self, status):
+            pass
+
+        def end(self, end_time=None):
+            self.ended = True
+
+    class Tracer:
+        spans = []
+
+        def start_span(self, name, start_time=None, attributes=None):
+            span = Span(name, attributes)
+            self.spans.append(span)
+            return span
+
+    server = make_server(estates=10)
+    client = make_client(server)
+    client.add_hook(TracingHook(tracer=Tracer()))
+    client.estate.get(1)
+
+    span = Tracer.spans[0]
+    assert span.name == "onoffice estate read"
+    assert span.attributes["onoffice.cache"] == "bypass"
+    assert span.ended
@@ -0,0 +1,95 @@
+"""
+Tests for the standalone onoffice_api_client module.
+"""
+
+import importlib.util
+import os
+import pytest
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), "..", "onoffice_api", "onoffice_api_client.py")
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+READ = "urn:onoffice-de-ns:smart:2.5:smartml:action:read"
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("onoffice_api_client", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def api():
+    module = load_module()
+    yield module
+    module.close_sessions()
+
+def test_import_does_not_load_dotenv(monkeypatch):
+    """Test that importing the module leaves the environment alone."""
+    dotenv = pytest.importorskip("dotenv")
+    calls = []
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args, **kwargs: calls.append(1))
+
+    load_module()
+
+    assert calls == []
+
+def test_first_request_loads_dotenv_once(monkeypatch, requests_mock):
+    """Test that the .env file is loaded on the first request and only then."""
+    dotenv = pytest.importorskip("dotenv")
+    calls = []
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args, **kwargs: calls.append(1))
+    requests_mock.post(API_URL, json={"status": {"code": 200}})
+    api = load_module()
+
+    api.send_onoffice_api_request("test_token", "test_secret", "estate", READ, {})
+    api.send_onoffice_api_request("test_token", "test_secret", "estate", READ, {})
+    api.get_session("other_token")
+    api.close_sessions()
+
+    assert calls == [1]
+
+def test_batched_actions_are_signed_in_one_post(api, requests_mock):
+    """Test that every action carries its own signature and all go in one request."""
+    requests_mock.post(API_URL, json={"status": {"code": 200}, "response": {"results": [{}, {}]}})
+
+    result = api.send_onoffice_api_request(
+        token="test_token",
+        secret="test_secret",
+        actions=[
+            {"resourcetype": "estate", "actionid": READ, "parameters": {"data": ["Id"]}},
+            {"resourcetype": "address", "actionid": READ, "parameters": {"data": ["Name"]}, "identifier": "a"},
+        ]
+    )
+
+    assert requests_mock.call_count == 1
+    assert len(result["response"]["results"]) == 2
+    body = requests_mock.last_request.json()
+    assert body["token"] == "test_token"
+    actions = body["request"]["actions"]
+    assert [action["resourcetype"] for action in actions] == ["estate", "address"]
+    assert actions[1]["identifier"] == "a"
+    for action in actions:
+        assert action["hmac_version"] == "2"
+        assert action["hmac"] == api.create_hmac2(
+            "test_token", "test_secret", action["timestamp"], action["resourcetype"], action["actionid"]
+        )
+
+def test_sessions_are_reused_per_token_and_version(api, requests_mock):
+    """Test the session pool and that the timeout reaches the request."""
+    requests_mock.post(API_URL, json={"status": {"code": 200}})
+
+    assert api.get_session("test_token") is api.get_session("test_token", "stable")
+    assert api.get_session("test_token") is not api.get_session("other_token")
+    assert api.get_session("test_token") is not api.get_session("test_token", "latest")
+
+    session = api.get_session("test_token")
+    api.send_onoffice_api_request("test_token", "test_secret", "estate", READ, {}, timeout=5)
+    assert requests_mock.last_request.timeout == 5
+    assert api.get_session("test_token") is session
+
+    api.close_sessions()
+    assert api.get_session("test_token") is not session
+
+def test_single_action_requires_resource_and_action(api):
+    """Test that a request without an action is rejected before sending."""
+    with pytest.raises(ValueError):
+        api.send_onoffice_api_request("test_token", "test_secret", parameters={})
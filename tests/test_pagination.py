@@ -0,0 +1,63 @@
+"""
+Tests for paginated search iterators.
+"""
+
+from onoffice_sdk import OnOfficeClient
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def _page(ids, total):
+    return {
+        "json": {
+            "status": {"code": 200, "message": "OK"},
+            "response": {"results": [{
+                "data": {
+                    "meta": {"cntabsolute": total},
+                    "records": [{"id": i, "elements": {"Id": i}} for i in ids]
+                },
+                "status": {"errorcode": 0, "message": "OK"}
+            }]}
+        }
+    }
+
+def test_estate_iter_search_pages_lazily(requests_mock):
+    """Test that iter_search follows listoffset until all records are read."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, [_page([1, 2], 5), _page([3, 4], 5), _page([5], 5)])
+    
+    records = client.estate.iter_search(page_size=2)
+    assert next(records)["id"] == 1
+    assert requests_mock.call_count == 1
+    
+    assert [r["id"] for r in records] == [2, 3, 4, 5]
+    assert requests_mock.call_count == 3
+    offsets = [
+        r.json()["request"]["actions"][0]["parameters"]["listoffset"]
+        for r in requests_mock.request_history
+    ]
+    assert offsets == [0, 2, 4]
+
+def test_address_iter_search_stops_on_short_page(requests_mock):
+    """Test that a short page ends the iteration without a count."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, [_page([1, 2], None), _page([3], None)])
+    
+    assert [r["id"] for r in client.address.iter_search(page_size=2)] == [1, 2, 3]
+    assert requests_mock.call_count == 2
+
+def test_iter_search_prefetches_pages_concurrently(requests_mock):
+    """Test that prefetched pages are fetched by offset and yielded in order."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    
+    def respond(request, context):
+        parameters = request.json()["request"]["actions"][0]["parameters"]
+        start = parameters["listoffset"] + 1
+        ids = range(start, min(start + parameters["listlimit"], 11))
+        return _page(list(ids), 10)["json"]
+    
+    requests_mock.post(API_URL, json=respond)
+    
+    records = list(client.estate.iter_search(page_size=3, concurrency=3))
+    
+    assert [r["id"] for r in records] == list(range(1, 11))
+    assert requests_mock.call_count == 4
@@ -0,0 +1,107 @@
+"""
+Tests for the local query engine.
+"""
+
+import asyncio
+import pytest
+from onoffice_sdk import AsyncOnOfficeClient, LocalQueryEngine, SyncEngine
+from onoffice_sdk.exceptions import ValidationError
+from onoffice_sdk.testing import generate_estates
+from onoffice_sdk.utils import get_records, get_total_count
+
+pytest.importorskip("numpy")
+
+FIELDS = ["Id", "kaufpreis", "wohnflaeche", "objektart", "lage", "status"]
+
+@pytest.fixture
+def clients(make_server, make_client):
+    server = make_server(estates=2000)
+    engine = LocalQueryEngine()
+    client = make_client(server, query_engine=engine)
+    engine.refresh(client, "estate", fields=FIELDS, page_size=500)
+    return server, client
+
+@pytest.mark.parametrize("filters, sort_by", [
+    ({"status": [{"op": "=", "val": 1}], "kaufpreis": [{"op": "<", "val": 300000}]}, {"kaufpreis": "ASC"}),
+    ({"objektart": [{"op": "IN", "val": ["haus", "wohnung"]}]}, {"wohnflaeche": "DESC"}),
+    ({"kaufpreis": [{"op": "BETWEEN", "val": [100000, 200000]}], "status": [{"op": "!=", "val": 1}]}, None),
+    ({"lage": [{"op": "LIKE", "val": "%ber%"}]}, {"objektart": "ASC", "kaufpreis": "DESC"}),
+    ({"objektart": [{"op": "NOT IN", "val": ["haus"]}], "Id": [{"op": ">", "val": 500}]}, {"lage": "DESC"}),
+])
+def test_local_search_matches_remote_search(clients, filters, sort_by):
+    """Test that local and remote searches return the same page and total."""
+    server, client = clients
+    arguments = dict(filters=filters, fields=FIELDS, limit=50, offset=10, sort_by=sort_by)
+
+    remote = client.estate.search(**arguments)
+    requests = server.requests
+    local = client.estate.search(local=True, **arguments)
+
+    assert server.requests == requests
+    assert get_total_count(local) == get_total_count(remote)
+    assert [record["id"] for record in get_records(local)] == [record["id"] for record in get_records(remote)]
+    assert get_records(local)[0]["elements"] == get_records(remote)[0]["elements"]
+
+def test_local_records_equal_remote_records(make_server, make_client):
+    """Test that local results keep the API's string values, including leading zeros."""
+    estates = generate_estates(300)
+    postal_codes = ["01067", "01309", "12043", "20095", "50667", "80331"]
+    for index, estate in enumerate(estates):
+        estate["kaufpreis"] = f"{estate['kaufpreis']}.00"
+        estate["plz"] = postal_codes[index % len(postal_codes)]
+    server = make_server(estates=estates)
+    engine = LocalQueryEngine()
+    client = make_client(server, query_engine=engine)
+    fields = ["Id", "kaufpreis", "plz", "lage"]
+    engine.refresh(client, "estate", fields=fields, page_size=100)
+    arguments = dict(
+        filters={"plz": [{"op": "LIKE", "val": "01%"}], "kaufpreis": [{"op": "<", "val": 1000000}]},
+        fields=fields,
+        limit=40,
+        sort_by={"kaufpreis": "DESC"}
+    )
+
+    remote = client.estate.search(**arguments)
+    local = client.estate.search(local=True, **arguments)
+
+    assert get_total_count(local) == get_total_count(remote) > 0
+    assert get_records(local) == get_records(remote)
+    assert get_records(local)[0]["elements"]["plz"].startswith("01")
+
+def test_local_search_rejects_fields_outside_the_snapshot(clients):
+    """Test the validation of fields, operators and sort directions."""
+    _, client = clients
+
+    with pytest.raises(ValidationError) as error:
+        client.estate.search(
+            fields=["Id", "geaendert_am"],
+            filters={"kaufpreis": [{"op": "BETWEEN", "val": 1}]},
+            sort_by={"lage": "UP"},
+            local=True
+        )
+    assert set(error.value.errors) == {"geaendert_am", "kaufpreis", "lage"}
+
+    with pytest.raises(RuntimeError):
+        client.address.search(local=True)
+
+def test_load_from_mirror_and_async_client(clients):
+    """Test snapshots taken from a SyncEngine and searches on the async client."""
+    pytest.importorskip("httpx")
+    server, client = clients
+    mirror = SyncEngine(client, fields={"estate": FIELDS})
+    mirror.sync("estate")
+    engine = LocalQueryEngine()
+    engine.load_mirror(mirror, resource_types=("estate",))
+
+    async def run():
+        async with AsyncOnOfficeClient(token="test_token", secret="test_secret", query_engine=engine) as client:
+            return await client.estate.search(
+                filters={"status": [{"op": "=", "val": 1}]},
+                sort_by={"kaufpreis": "ASC"},
+                limit=5,
+                local=True
+            )
+
+    records = get_records(asyncio.run(run()))
+    prices = [record["elements"]["kaufpreis"] for record in records]
+    assert len(records) == 5 and prices == sorted(prices)
@@ -0,0 +1,34 @@
+"""
+Tests for the client-side rate limiter.
+"""
+
+import time
+import pytest
+from onoffice_sdk import OnOfficeClient, RateLimiter, RateLimitError
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def test_rate_limiter_paces_requests():
+    """Test that requests beyond the burst are spread at the configured rate."""
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    
+    assert time.monotonic() - start >= 0.075
+
+def test_rate_limit_error_pauses_all_callers(requests_mock):
+    """Test that a server-side 429 holds back the next request until the reset time."""
+    limiter = RateLimiter(rate=100)
+    client = OnOfficeClient(token="test_token", secret="test_secret", rate_limiter=limiter)
+    requests_mock.post(API_URL, [
+        {"json": {"status": {"code": 429, "message": "Too many requests", "reset_time": 0.2}}},
+        {"json": {"status": {"code": 200, "message": "OK"}, "response": {"results": []}}},
+    ])
+    
+    with pytest.raises(RateLimitError):
+        client.estate.get(1)
+    start = time.monotonic()
+    client.estate.get(1)
+    
+    assert time.monotonic() - start >= 0.15
@@ -0,0 +1,68 @@
+"""
+Tests for including related addresses in estate searches.
+"""
+
+import asyncio
+import json
+import pytest
+from onoffice_sdk import AsyncOnOfficeClient
+from onoffice_sdk.resources.estate import RELATION_TYPES
+from onoffice_sdk.utils import get_records
+
+@pytest.fixture
+def server(make_server):
+    # Estate n is linked to addresses n % 50 + 1 and 1, so contacts repeat across the page
+    contacts = {estate_id: [estate_id % 50 + 1, 1] for estate_id in range(1, 501)}
+    return make_server(estates=500, addresses=50, relations={RELATION_TYPES["contacts"]: contacts})
+
+def test_include_resolves_contacts_for_a_page_in_three_requests(server, make_client):
+    """Test that a page of 500 estates costs one search, one relation and one address read."""
+    client = make_client(server)
+
+    response = client.estate.search(limit=500, include={"contacts": ["Id", "Name", "Email"]})
+
+    records = get_records(response)
+    assert len(records) == 500
+    assert server.requests == 3
+    for record in records:
+        contacts = record["relations"]["contacts"]
+        assert [contact["id"] for contact in contacts] == [record["id"] % 50 + 1, 1]
+        assert set(contacts[0]["elements"]) == {"Id", "Name", "Email"}
+
+def test_include_handles_estates_without_relations(server, make_client):
+    """Test that estates without links get an empty list."""
+    server.relations[RELATION_TYPES["contacts"]] = {1: [2]}
+    client = make_client(server)
+
+    records = get_records(client.estate.search(limit=3, sort_by={"Id": "ASC"}, include={"contacts": None}))
+
+    assert [len(record["relations"]["contacts"]) for record in records] == [1, 0, 0]
+
+def test_include_rejects_unknown_relations_and_streaming(server, make_client):
+    """Test the argument checks."""
+    client = make_client(server)
+
+    with pytest.raises(ValueError):
+        client.estate.search(include={"neighbours": None})
+    with pytest.raises(ValueError):
+        client.estate.search(stream=True, include={"contacts": None})
+
+def test_async_include(server):
+    """Test the async client against the fake server."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        status_code, body = server.handle(json.loads(request.content))
+        return httpx.Response(status_code, json=body)
+
+    async def run():
+        async with AsyncOnOfficeClient(
+            token="test_token",
+            secret="test_secret",
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.estate.search(limit=10, include={"owners": None, "contacts": ["Name"]})
+
+    records = get_records(asyncio.run(run()))
+    assert all(record["relations"]["owners"] == [] for record in records)
+    assert all(len(record["relations"]["contacts"]) == 2 for record in records)
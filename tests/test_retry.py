@@ -0,0 +1,56 @@
+"""
+Tests for the retry policy.
+"""
+
+import pytest
+import requests
+from onoffice_sdk import OnOfficeClient, OnOfficeAPIError, ValidationError, RetryPolicy
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+OK_RESPONSE = {"json": {"status": {"code": 200, "message": "OK"}, "response": {"results": []}}}
+
+def test_reads_are_retried_on_transient_errors(requests_mock):
+    """Test that connection errors and 5xx responses are retried for reads."""
+    retry = RetryPolicy(max_attempts=3, backoff_base=0.001)
+    client = OnOfficeClient(token="test_token", secret="test_secret", retry=retry)
+    requests_mock.post(API_URL, [
+        {"exc": requests.exceptions.ConnectionError},
+        {"status_code": 503},
+        OK_RESPONSE,
+    ])
+    
+    result = client.estate.get(1)
+    
+    assert result["status"]["code"] == 200
+    assert requests_mock.call_count == 3
+    stats = retry.stats()
+    assert stats["retries"] == 2
+    assert stats["attempts"] == 3
+
+def test_writes_need_opt_in(requests_mock):
+    """Test that writes are only retried with retry_writes=True."""
+    requests_mock.post(API_URL, [{"status_code": 502}, OK_RESPONSE])
+    client = OnOfficeClient(token="test_token", secret="test_secret", retry=RetryPolicy(backoff_base=0.001))
+    
+    with pytest.raises(OnOfficeAPIError):
+        client.estate.update(1, {"kaufpreis": 1})
+    
+    requests_mock.post(API_URL, [{"status_code": 502}, OK_RESPONSE])
+    client.retry = RetryPolicy(backoff_base=0.001, retry_writes=True)
+    assert client.estate.update(1, {"kaufpreis": 1})["status"]["code"] == 200
+
+def test_permanent_errors_and_exhaustion(requests_mock):
+    """Test that validation errors fail at once and attempts are capped."""
+    retry = RetryPolicy(max_attempts=2, backoff_base=0.001)
+    client = OnOfficeClient(token="test_token", secret="test_secret", retry=retry)
+    
+    requests_mock.post(API_URL, json={"status": {"code": 400, "message": "Bad"}})
+    with pytest.raises(ValidationError):
+        client.estate.get(1)
+    assert requests_mock.call_count == 1
+    
+    requests_mock.post(API_URL, status_code=500)
+    with pytest.raises(OnOfficeAPIError):
+        client.estate.get(1)
+    assert retry.stats()["gave_up"] == 1
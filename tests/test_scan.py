@@ -0,0 +1,67 @@
+"""
+Tests for keyset-partitioned scans.
+"""
+
+import asyncio
+import json
+import random
+import pytest
+from onoffice_sdk import AsyncOnOfficeClient, OnOfficeClient
+from onoffice_sdk.testing import generate_estates
+
+@pytest.fixture
+def server(make_server):
+    estates = generate_estates(3000)
+    # Leave gaps in the ID space, denser at the start than at the end
+    rng = random.Random(7)
+    estates = [e for e in estates if rng.random() < (0.9 if e["Id"] < 1000 else 0.3)]
+    return make_server(estates=estates)
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_scan_returns_every_record_in_id_order(server, concurrency):
+    """Test that ranges are merged into one ordered stream."""
+    transport = server.transport()
+    client = OnOfficeClient(token="test_token", secret="test_secret", transport=transport)
+
+    ids = [record["id"] for record in client.estate.scan(page_size=50, concurrency=concurrency)]
+
+    assert ids == sorted(server.records["estate"])
+    actions = [request["request"]["actions"][0]["parameters"] for request in transport.requests]
+    assert all(parameters.get("listoffset", 0) == 0 for parameters in actions)
+    keyset = [
+        condition for parameters in actions
+        for condition in parameters.get("filter", {}).get("Id", [])
+        if condition["op"] == ">"
+    ]
+    assert keyset and all(condition["val"] in ids for condition in keyset)
+
+def test_scan_applies_filters(server, make_client):
+    """Test that the user's filters are kept next to the keyset conditions."""
+    client = make_client(server)
+    filters = {"kaufpreis": [{"op": "<", "val": 500000}], "Id": [{"op": ">=", "val": 100}]}
+
+    ids = [record["id"] for record in client.estate.scan(filters=filters, page_size=40, concurrency=3)]
+
+    expected = sorted(
+        record_id for record_id, elements in server.records["estate"].items()
+        if elements["kaufpreis"] < 500000 and record_id >= 100
+    )
+    assert ids == expected
+
+def test_async_scan(server):
+    """Test the async scan against the fake server."""
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        status_code, body = server.handle(json.loads(request.content))
+        return httpx.Response(status_code, json=body)
+
+    async def run():
+        async with AsyncOnOfficeClient(
+            token="test_token",
+            secret="test_secret",
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            return [record["id"] async for record in client.estate.scan(page_size=50, concurrency=4)]
+
+    assert asyncio.run(run()) == sorted(server.records["estate"])
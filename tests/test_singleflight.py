@@ -0,0 +1,119 @@
+"""
+Tests for single-flight coalescing of identical reads.
+"""
+
+import asyncio
+import threading
+import time
+from onoffice_sdk import OnOfficeClient, SingleFlight
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def test_concurrent_identical_reads_share_one_request(requests_mock):
+    """Test that threads reading the same estate send a single request."""
+    single_flight = SingleFlight()
+    client = OnOfficeClient(token="test_token", secret="test_secret", single_flight=single_flight)
+    
+    def respond(request, context):
+        time.sleep(0.2)
+        return {"status": {"code": 200, "message": "OK"}, "response": {"results": []}}
+    
+    requests_mock.post(API_URL, json=respond)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.estate.get(123)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert requests_mock.call_count == 1
+    assert len(results) == 5
+    assert single_flight.stats()["coalesced"] == 4
+
+def test_async_calls_share_result_and_errors():
+    """Test asyncio coalescing, including exception propagation."""
+    single_flight = SingleFlight()
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+    
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+    
+    async def run():
+        results = await asyncio.gather(*(single_flight.do_async("a", fetch) for _ in range(3)))
+        errors = await asyncio.gather(
+            *(single_flight.do_async("b", fail) for _ in range(2)),
+            return_exceptions=True
+        )
+        return results, errors
+    
+    results, errors = asyncio.run(run())
+    
+    assert len(calls) == 1
+    assert results == [{"ok": True}] * 3
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert single_flight.stats() == {"calls": 5, "coalesced": 3, "in_flight": 0}
+
+def test_leader_changes_are_not_seen_by_followers():
+    """Test that followers copy a snapshot taken before the leader returns."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    
+    def fetch():
+        started.set()
+        time.sleep(0.1)
+        return {"records": [{"id": 1, "elements": {}}]}
+    
+    def lead():
+        result = single_flight.do("key", fetch)
+        for i in range(1000):
+            result["records"][0]["elements"][f"field{i}"] = i
+        result["relations"] = {}
+    
+    results = []
+    leader = threading.Thread(target=lead)
+    leader.start()
+    started.wait()
+    followers = [
+        threading.Thread(target=lambda: results.append(single_flight.do("key", fetch)))
+        for _ in range(4)
+    ]
+    for thread in followers:
+        thread.start()
+    for thread in [leader] + followers:
+        thread.join()
+    
+    assert results == [{"records": [{"id": 1, "elements": {}}]}] * 4
+
+def test_cancelled_async_leader_hands_over_to_a_follower():
+    """Test that cancelling the leading task does not cancel the waiting ones."""
+    single_flight = SingleFlight()
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": len(calls)}
+    
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do_async("a", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(single_flight.do_async("a", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(*followers), leader.cancelled()
+    
+    results, cancelled = asyncio.run(run())
+    
+    assert cancelled
+    assert len(calls) == 2
+    assert results == [{"ok": 2}] * 3
+    assert single_flight.stats() == {"calls": 4, "coalesced": 2, "in_flight": 0}
@@ -0,0 +1,57 @@
+"""
+Tests for incremental response parsing.
+"""
+
+import json
+import pytest
+from onoffice_sdk import OnOfficeClient, AuthenticationError, OnOfficeAPIError
+from onoffice_sdk.streaming import StreamingParser
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def _body(records, code=200, errorcode=0):
+    return {
+        "status": {"code": code, "message": "OK"},
+        "response": {"results": [{
+            "actionid": "urn:onoffice-de-ns:smart:2.5:smartml:action:read",
+            "data": {"meta": {"cntabsolute": len(records)}, "records": records},
+            "status": {"errorcode": errorcode, "message": "OK"}
+        }]}
+    }
+
+def test_parser_handles_arbitrary_chunk_boundaries():
+    """Test that records split across chunks, including multi-byte characters, are parsed."""
+    records = [
+        {"id": 1, "elements": {"lage": "Köln " * 40}},
+        {"id": 2, "elements": {"kaufpreis": 1234567.5}},
+    ]
+    raw = json.dumps(_body(records), ensure_ascii=False).encode("utf-8")
+    
+    for size in (1, 5, 64):
+        chunks = [raw[i:i + size] for i in range(0, len(raw), size)]
+        assert list(StreamingParser(chunks).records()) == records
+
+def test_streamed_iter_search(requests_mock):
+    """Test that iter_search(stream=True) yields records page by page."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    requests_mock.post(API_URL, [
+        {"content": json.dumps(_body([{"id": 1}, {"id": 2}])).encode()},
+        {"content": json.dumps(_body([{"id": 3}])).encode()},
+    ])
+    
+    records = list(client.estate.iter_search(page_size=2, stream=True))
+    
+    assert [r["id"] for r in records] == [1, 2, 3]
+    assert requests_mock.call_count == 2
+
+def test_streamed_search_checks_status(requests_mock):
+    """Test that status blocks are still mapped to exceptions."""
+    client = OnOfficeClient(token="test_token", secret="test_secret")
+    
+    requests_mock.post(API_URL, json=_body([{"id": 1}], code=401))
+    with pytest.raises(AuthenticationError):
+        list(client.address.search(stream=True))
+    
+    requests_mock.post(API_URL, json=_body([{"id": 1}], errorcode=137))
+    with pytest.raises(OnOfficeAPIError):
+        list(client.estate.search(stream=True))
@@ -0,0 +1,72 @@
+"""
+Tests for the incremental SQLite sync engine.
+"""
+
+from onoffice_sdk import SyncEngine
+
+ESTATES = [
+    {"Id": 1, "kaufpreis": 100, "geaendert_am": "2024-01-01 10:00:00"},
+    {"Id": 2, "kaufpreis": 200, "geaendert_am": "2024-01-02 10:00:00"},
+    {"Id": 3, "kaufpreis": 300, "geaendert_am": "2024-01-03 10:00:00"},
+]
+
+def test_sync_is_incremental(make_server, make_client):
+    """Test that a second run only reads records changed since the mark."""
+    server = make_server(estates=ESTATES)
+    engine = SyncEngine(make_client(server), page_size=2)
+    
+    result = engine.sync("estate")
+    assert result["upserted"] == 3
+    assert engine.high_water_mark("estate") == "2024-01-03 10:00:00"
+    
+    server.records["estate"][1].update(kaufpreis=150, geaendert_am="2024-01-04 10:00:00")
+    result = engine.sync("estate")
+    
+    # Estate 3 at the mark is read again, estate 1 changed after it
+    assert result["upserted"] == 2
+    assert engine.high_water_mark("estate") == "2024-01-04 10:00:00"
+    assert engine.get("estate", 1)["kaufpreis"] == 150
+
+def test_sync_keeps_records_edited_during_the_run(make_server, make_client):
+    """Test that a record edited between pages does not push others out of the run."""
+    server = make_server(estates=ESTATES)
+    client = make_client(server)
+    handle = client.transport.handler
+    
+    def edit_after_first_page(request):
+        response = handle(request)
+        server.records["estate"][1].update(kaufpreis=150, geaendert_am="2024-01-04 10:00:00")
+        return response
+    
+    client.transport.handler = edit_after_first_page
+    engine = SyncEngine(client, page_size=2)
+    
+    result = engine.sync("estate")
+    
+    assert engine.get("estate", 3)["kaufpreis"] == 300
+    assert engine.get("estate", 1)["kaufpreis"] == 150
+    assert result["high_water_mark"] == "2024-01-04 10:00:00"
+
+def test_sync_pages_through_equal_marks(make_server, make_client):
+    """Test that more records than a page at the same mark are all read."""
+    estates = [{"Id": n, "kaufpreis": n, "geaendert_am": "2024-01-01 10:00:00"} for n in range(1, 8)]
+    server = make_server(estates=estates)
+    engine = SyncEngine(make_client(server), page_size=2)
+    
+    assert engine.sync("estate")["upserted"] == 7
+    assert sorted(int(record["id"]) for record in engine.iter_records("estate")) == list(range(1, 8))
+
+def test_verify_repairs_mirror(make_server, make_client):
+    """Test that verify drops deleted records and fetches missing ones."""
+    client = make_client(make_server(estates=ESTATES))
+    engine = SyncEngine(client)
+    engine.sync("estate")
+    
+    engine.connection.execute("DELETE FROM records WHERE id = '2'")
+    client.estate.delete(3)
+    
+    result = engine.verify("estate", repair=True)
+    
+    assert result == {"missing": ["2"], "extra": ["3"]}
+    assert engine.get("estate", 2)["kaufpreis"] == 200
+    assert engine.get("estate", 3) is None
@@ -0,0 +1,91 @@
+"""
+Tests for the pluggable transports.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from onoffice_sdk import OnOfficeClient, InMemoryTransport, RequestsTransport
+
+API_URL = "https://api.onoffice.de/api/stable/api.php"
+
+def test_in_memory_transport_serves_requests():
+    """Test that the client runs against a handler without network access."""
+    def handler(request):
+        action = request["request"]["actions"][0]
+        assert action["resourcetype"] == "estate"
+        return {
+            "status": {"code": 200, "message": "OK"},
+            "response": {"results": [{"data": {"records": [{"id": 1, "elements": {}}]}}]}
+        }
+
+    transport = InMemoryTransport(handler)
+    client = OnOfficeClient(token="test_token", secret="test_secret", transport=transport)
+
+    response = client.estate.get(1)
+
+    assert response["response"]["results"][0]["data"]["records"][0]["id"] == 1
+    assert client.session is None
+    assert client.transport_stats()["requests"] == 1
+
+def test_in_memory_transport_keeps_only_recent_requests(make_server):
+    """Test that the request log is bounded while the count keeps growing."""
+    transport = InMemoryTransport(make_server(estates=5).handle, keep_requests=2)
+    client = OnOfficeClient(token="test_token", secret="test_secret", transport=transport)
+
+    for estate_id in range(1, 6):
+        client.estate.get(estate_id)
+
+    assert transport.stats()["requests"] == 5
+    assert [request["request"]["actions"][0]["parameters"]["filter"]["Id"][0]["val"]
+            for request in transport.requests] == [4, 5]
+
+def test_requests_transport_splits_timeouts_and_disables_keep_alive(requests_mock):
+    """Test connect/read timeouts and the Connection header."""
+    transport = RequestsTransport(connect_timeout=2, keep_alive=False)
+    client = OnOfficeClient(token="test_token", secret="test_secret", timeout=15, transport=transport)
+    requests_mock.post(API_URL, json={"status": {"code": 200, "message": "OK"}, "response": {"results": []}})
+
+    client.estate.get(1)
+
+    assert requests_mock.last_request.timeout == (2, 15)
+    assert requests_mock.last_request.headers["Connection"] == "close"
+
+def test_warm_up_opens_connections_that_are_reused():
+    """Test that warmed-up connections serve later requests."""
+    body = b'{"status": {"code": 200, "message": "OK"}, "response": {"results": []}}'
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = OnOfficeClient(token="test_token", secret="test_secret", transport=RequestsTransport(pool_maxsize=4))
+        client.API_BASE_URL = f"http://127.0.0.1:{server.server_port}/api/{{version}}/api.php"
+
+        # Connections beyond the pool size would be closed again, so they are not opened
+        assert client.warm_up(10) == 4
+        assert client.transport_stats()["connections_created"] == 4
+        assert client.warm_up(2) == 2
+        for _ in range(3):
+            client.estate.get(1)
+
+        stats = client.transport_stats()
+        assert stats["requests"] == 3
+        assert stats["connections_created"] == 4
+        assert stats["connections_reused"] == 3
+    finally:
+        server.shutdown()
+        server.server_close()
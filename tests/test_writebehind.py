@@ -0,0 +1,89 @@
+"""
+Tests for the write-behind writer.
+"""
+
+import threading
+import pytest
+from onoffice_sdk import OnOfficeClient, WriteBehindWriter
+from onoffice_sdk.exceptions import OnOfficeAPIError
+
+@pytest.fixture
+def server(make_server):
+    return make_server(estates=50, addresses=10)
+
+def test_updates_to_the_same_record_are_merged(server, make_client):
+    """Test last-write-wins merging and one request for the whole buffer."""
+    with WriteBehindWriter(make_client(server), max_batch=1000, flush_interval=60) as writer:
+        first = writer.update("estate", 1, {"kaufpreis": 100, "lage": "Berlin"})
+        second = writer.update("estate", 1, {"kaufpreis": 200})
+        others = [writer.update("estate", i, {"kaufpreis": i}) for i in range(2, 21)]
+        address = writer.update("address", 3, {"Name": "Weber"})
+        assert writer.flush(timeout=5)
+
+    assert server.requests == 2
+    assert server.records["estate"][1]["kaufpreis"] == 200
+    assert server.records["estate"][1]["lage"] == "Berlin"
+    assert server.records["address"][3]["Name"] == "Weber"
+    assert first.result() is second.result()
+    assert all(future.done() for future in others) and address.done()
+    stats = writer.stats()
+    assert stats["submitted"] == 22 and stats["coalesced"] == 1 and stats["sent"] == 21
+
+def test_cancelled_futures_do_not_stop_the_writer(server, make_client):
+    """Test that a cancelled future is skipped and later updates are still sent."""
+    writer = WriteBehindWriter(make_client(server), max_batch=1000, flush_interval=60)
+    cancelled = writer.update("estate", 1, {"kaufpreis": 100})
+    kept = writer.update("estate", 1, {"lage": "Bonn"})
+    assert cancelled.cancel()
+    assert writer.flush(timeout=2)
+
+    later = writer.update("estate", 2, {"kaufpreis": 200})
+    assert writer.flush(timeout=2)
+    writer.close()
+
+    assert kept.result(timeout=1) is not None
+    assert later.done() and not later.cancelled()
+    assert server.records["estate"][1]["kaufpreis"] == 100
+    assert server.records["estate"][2]["kaufpreis"] == 200
+
+def test_flushes_on_size_and_time(server, make_client):
+    """Test that a full batch and an old update are sent without flush()."""
+    writer = WriteBehindWriter(make_client(server), max_batch=5, flush_interval=0.05)
+    futures = [writer.update("estate", i, {"kaufpreis": i}) for i in range(1, 6)]
+    futures[-1].result(timeout=5)
+    late = writer.update("estate", 10, {"kaufpreis": 10})
+    late.result(timeout=5)
+    writer.close()
+
+    assert server.records["estate"][5]["kaufpreis"] == 5
+    assert server.records["estate"][10]["kaufpreis"] == 10
+
+def test_backpressure_and_errors(server):
+    """Test that a full buffer blocks and failed requests reach the futures."""
+    release = threading.Event()
+    transport = server.transport()
+    handle = transport.handler
+
+    def blocking(request):
+        release.wait(5)
+        return handle(request)
+
+    transport.handler = blocking
+    client = OnOfficeClient(token="test_token", secret="test_secret", transport=transport)
+    writer = WriteBehindWriter(client, max_batch=2, flush_interval=60, max_pending=2)
+    writer.update("estate", 1, {"kaufpreis": 1})
+    writer.update("estate", 2, {"kaufpreis": 2})
+    # The first two are in flight; two more fill the buffer
+    writer.update("estate", 3, {"kaufpreis": 3}, timeout=1)
+    writer.update("estate", 4, {"kaufpreis": 4}, timeout=1)
+    with pytest.raises(TimeoutError):
+        writer.update("estate", 5, {"kaufpreis": 5}, timeout=0.05)
+    release.set()
+    assert writer.flush(timeout=5)
+
+    server.fail_next(500)
+    failed = writer.update("estate", 6, {"kaufpreis": 6})
+    writer.close()
+    assert isinstance(failed.exception(timeout=5), OnOfficeAPIError)
+    with pytest.raises(RuntimeError):
+        writer.update("estate", 7, {"kaufpreis": 7})